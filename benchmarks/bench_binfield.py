@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""BinField performance benchmarks.
+
+Usage::
+
+    python benchmarks/bench_binfield.py --output results.json
+    python benchmarks/bench_binfield.py --compare results.json --filter access
+
+Results are stored as nanoseconds per operation (best and median of repeats).
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import datetime
+import json
+import os
+import pickle
+import platform
+import statistics
+import subprocess  # nosec
+import sys
+import timeit
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import binfield  # noqa: E402
+from binfield import BinField  # noqa: E402
+
+# pylint: disable=missing-docstring,protected-access,no-member,attribute-defined-outside-init
+
+CaseT = typing.Callable[[], typing.Callable[[], typing.Any]]
+CASES: typing.Dict[str, CaseT] = {}
+
+
+def case(name: str) -> typing.Callable[[CaseT], CaseT]:
+    """Register benchmark case: decorated function is setup and returns measured callable."""
+
+    def wrapper(func: CaseT) -> CaseT:
+        CASES[name] = func
+        return func
+
+    return wrapper
+
+
+class Packet(BinField):
+    _size_ = 16
+    low = (0, 4)
+    middle = (4, 12)
+    high = (12, 16)
+
+
+class Header(BinField):
+    _size_ = 32
+    flags = (0, 4)
+    outer = {
+        "_index_": (4, 28),
+        "kind": (0, 2),
+        "middle": {"_index_": (2, 18), "inner": {"_index_": (3, 11), "leaf": (2, 5)}},
+    }
+
+
+class Uncached(BinField):
+    _size_ = 16
+    _cache_size_ = 0
+
+
+class CPacket(ctypes.Structure):
+    _fields_ = [("low", ctypes.c_uint16, 4), ("middle", ctypes.c_uint16, 8), ("high", ctypes.c_uint16, 4)]
+
+
+# Construction
+@case("construct.int")
+def _construct_int() -> typing.Callable[[], typing.Any]:
+    return lambda: Packet(0x1234)
+
+
+@case("construct.str")
+def _construct_str() -> typing.Callable[[], typing.Any]:
+    return lambda: Packet("1234", base=16)
+
+
+# Flat mapping
+@case("access.flat.read")
+def _flat_read() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+    return lambda: obj.middle
+
+
+@case("access.flat.read_int")
+def _flat_read_int() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+    return lambda: obj._get_int_("middle")
+
+
+@case("access.flat.write")
+def _flat_write() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+
+    def stmt() -> None:
+        obj.middle = 0x5A
+
+    return stmt
+
+
+@case("access.flat.write_many")
+def _flat_write_many() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+
+    def stmt() -> None:
+        obj.low = 0x5
+        obj.middle = 0x5A
+        obj.high = 0xA
+
+    return stmt
+
+
+@case("access.flat.update")
+def _flat_update() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+    return lambda: obj._update_(low=0x5, middle=0x5A, high=0xA)
+
+
+@case("construct.fields")
+def _construct_fields() -> typing.Callable[[], typing.Any]:
+    return lambda: Packet(low=0x5, middle=0x5A, high=0xA)
+
+
+# Nested mapping
+@case("access.nested.read")
+def _nested_read() -> typing.Callable[[], typing.Any]:
+    obj = Header(0x12345678)
+    return lambda: obj.outer.middle.inner.leaf
+
+
+@case("access.nested.read_int")
+def _nested_read_int() -> typing.Callable[[], typing.Any]:
+    obj = Header(0x12345678)
+    return lambda: obj._get_int_("outer.middle.inner.leaf")
+
+
+@case("access.nested.write")
+def _nested_write() -> typing.Callable[[], typing.Any]:
+    obj = Header(0x12345678)
+    inner = obj.outer.middle.inner
+
+    def stmt() -> None:
+        inner.leaf = 0b101
+
+    return stmt
+
+
+@case("access.nested.write_linked")
+def _nested_write_linked() -> typing.Callable[[], typing.Any]:
+    leaf = Header(0x12345678).outer.middle.inner.leaf
+
+    def stmt() -> None:
+        leaf._value_ = 0b101
+
+    return stmt
+
+
+# Slicing
+@case("slice.cache_hit")
+def _slice_hit() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+    return lambda: obj[3:9]
+
+
+@case("slice.cache_miss")
+def _slice_miss() -> typing.Callable[[], typing.Any]:
+    obj = Uncached(0x1234)
+    return lambda: obj[3:9]
+
+
+# Formatting
+@case("format.str.flat")
+def _format_flat() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+    return lambda: str(obj)
+
+
+@case("format.str.nested")
+def _format_nested() -> typing.Callable[[], typing.Any]:
+    obj = Header(0x12345678)
+    return lambda: str(obj)
+
+
+@case("format.repr")
+def _format_repr() -> typing.Callable[[], typing.Any]:
+    obj = Header(0x12345678)
+    return lambda: repr(obj)
+
+
+# Filtering
+@case("match.objects")
+def _match_objects() -> typing.Callable[[], typing.Any]:
+    obj = Packet(0x1234)
+    return lambda: obj.low == 4 and obj.high == 1
+
+
+@case("match.compiled")
+def _match_compiled() -> typing.Callable[[], typing.Any]:
+    match = Packet._match_(low=4, high=1)
+    return lambda: match(0x1234)
+
+
+# Pickle
+@case("pickle.roundtrip")
+def _pickle_roundtrip() -> typing.Callable[[], typing.Any]:
+    obj = Header(0x12345678)
+    return lambda: pickle.loads(pickle.dumps(obj))
+
+
+# Class creation
+@case("meta.makecls")
+def _makecls() -> typing.Callable[[], typing.Any]:
+    mapping = {"low": (0, 4), "high": (12, 16), "nested": {"_index_": (4, 12), "bit": 0, "rest": (1, 8)}}
+    return lambda: BinField.__class__.makecls("Dynamic", mapping=mapping, size=16)
+
+
+@case("meta.makecls_first_access")
+def _makecls_first_access() -> typing.Callable[[], typing.Any]:
+    mapping = {"low": (0, 4), "high": (12, 16), "nested": {"_index_": (4, 12), "bit": 0, "rest": (1, 8)}}
+
+    def stmt() -> None:
+        obj = BinField.__class__.makecls("Dynamic", mapping=mapping, size=16)(0x1234)
+        obj.low, obj.high, obj.nested.bit, obj.nested.rest  # pylint: disable=pointless-statement
+
+    return stmt
+
+
+# Import of protocol definitions module
+PROTOCOL_CLASS_TEMPLATE = """
+class Header{idx}(BinField):
+    _size_ = 32
+    version = (0, 4)
+    flags = {{"_index_": (4, 12), "urgent": 0, "ack": 1, "code": (2, 8)}}
+    length = (12, 28)
+    tail = {{"_index_": (28, 32), "low": (0, 2), "high": (2, 4)}}
+"""
+PROTOCOL_CLASSES = 200
+
+
+@case(f"import.protocol_module_{PROTOCOL_CLASSES}")
+def _import_protocol() -> typing.Callable[[], typing.Any]:
+    source = "from binfield import BinField\n" + "".join(
+        PROTOCOL_CLASS_TEMPLATE.format(idx=idx) for idx in range(PROTOCOL_CLASSES)
+    )
+    code = compile(source, "protocol.py", "exec")
+    return lambda: exec(code, {"__name__": "protocol"})  # nosec  # Generated source
+
+
+@case("import.binfield")
+def _import_binfield() -> typing.Callable[[], typing.Any]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return lambda: subprocess.run([sys.executable, "-c", "import binfield"], env=env, check=True)  # nosec
+
+
+@case("import.interpreter_startup")
+def _interpreter_startup() -> typing.Callable[[], typing.Any]:
+    return lambda: subprocess.run([sys.executable, "-c", "pass"], check=True)  # nosec
+
+
+# Baselines
+@case("baseline.shift_mask.read")
+def _shift_mask_read() -> typing.Callable[[], typing.Any]:
+    value = 0x1234
+    return lambda: (value >> 4) & 0xFF
+
+
+@case("baseline.shift_mask.write")
+def _shift_mask_write() -> typing.Callable[[], typing.Any]:
+    state = [0x1234]
+
+    def stmt() -> None:
+        state[0] = state[0] & ~0x0FF0 | (0x5A << 4) & 0x0FF0
+
+    return stmt
+
+
+@case("baseline.ctypes.read")
+def _ctypes_read() -> typing.Callable[[], typing.Any]:
+    obj = CPacket.from_buffer_copy((0x1234).to_bytes(2, sys.byteorder))
+    return lambda: obj.middle
+
+
+@case("baseline.ctypes.write")
+def _ctypes_write() -> typing.Callable[[], typing.Any]:
+    obj = CPacket.from_buffer_copy((0x1234).to_bytes(2, sys.byteorder))
+
+    def stmt() -> None:
+        obj.middle = 0x5A
+
+    return stmt
+
+
+def measure(setup: CaseT, number: int, repeat: int) -> typing.Dict[str, float]:
+    """Measure case: nanoseconds per operation."""
+    timer = timeit.Timer(setup())
+    if number <= 0:
+        number, _ = timer.autorange()
+    timings = [elapsed * 1e9 / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(timings), "median": statistics.median(timings), "number": number}
+
+
+def get_meta() -> typing.Dict[str, typing.Any]:
+    """Environment description for results comparison."""
+    return {
+        "binfield": binfield.__version__,
+        "compiled": binfield.COMPILED,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Run benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="run only cases with name containing substring")
+    parser.add_argument("--number", type=int, default=0, help="calls per repeat (default: auto)")
+    parser.add_argument("--repeat", type=int, default=5, help="amount of repeats")
+    parser.add_argument("--output", help="store results as JSON")
+    parser.add_argument("--compare", help="JSON results for comparison")
+    args = parser.parse_args(argv)
+
+    previous: typing.Dict[str, typing.Any] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as src:
+            previous = json.load(src)["results"]
+
+    results = {}
+    for name, setup in CASES.items():
+        if args.filter not in name:
+            continue
+        results[name] = result = measure(setup, args.number, args.repeat)
+        line = f"{name:<32} {result['best']:>12.1f} ns  (median {result['median']:.1f} ns)"
+        if name in previous:
+            line += f"  x{previous[name]['best'] / result['best']:.2f} vs previous"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as dst:
+            json.dump({"meta": get_meta(), "results": results}, dst, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
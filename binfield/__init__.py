@@ -15,7 +15,61 @@
 
 from __future__ import absolute_import
 
+import importlib
+import importlib.util
+import os
+import sys
+import typing
+
+if os.environ.get("BINFIELD_NO_EXTENSIONS") and f"{__name__}.binfield" not in sys.modules:
+    # Use pure python implementation even if compiled version is available
+    _spec = importlib.util.spec_from_file_location(
+        f"{__name__}.binfield", os.path.join(os.path.dirname(__file__), "binfield.py")
+    )
+    _module = importlib.util.module_from_spec(_spec)  # type: ignore
+    sys.modules[_spec.name] = _module  # type: ignore
+    _spec.loader.exec_module(_module)  # type: ignore
+
+from . import binfield
+from . import stats
 from .binfield import BinField
+from .record import Record
+from .serialize import dumps_many
+from .serialize import loads_many
+from .stream import AsyncRecordWriter
+from .stream import aiter_chunks
+from .stream import aiter_records
+from .stream import iter_chunks
+from .stream import iter_records
+from .view import BinFieldView
+
+COMPILED = not binfield.__file__.endswith(".py")  # Compiled hot paths are used
+
+# Rarely used API with expensive dependencies: imported on first access
+_LAZY_ATTRIBUTES = {
+    "decode_parallel": ".parallel",
+    "load_schema": ".schema",
+    "make_class": ".schema",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import lazy API on first access.
+
+    :raises AttributeError: attribute not found
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    """Module attributes including lazy API."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
 
 __version__ = "0.9.3"
 __author__ = "Alexey Stepanov"
@@ -18,9 +18,19 @@ Implements BinField in Python
 
 from __future__ import annotations
 
+import array
+import collections
+import collections.abc
 import copy
+import functools
+import itertools
 import math
+import operator
+import struct
+import sys
+import threading
 import typing
+import weakref
 
 __all__ = ("BinField",)
 
@@ -36,6 +46,36 @@ DeclaredMappingT = typing.Dict[
 ]
 
 AllowedMappingT = typing.Optional[DeclaredMappingT]
+IntAccessorT = typing.Tuple[int, int, int]
+# Pre-resolved layout: (resolved mapping, integer accessors). Validation is skipped for it.
+LayoutT = typing.Tuple[ResolvedMappingT, typing.Dict[str, IntAccessorT]]
+# Compact class descriptor: (name, size, mask, mapping, frozen).
+# Mapping records: bit index, (start, stop) or nested records.
+SchemaRecordT = typing.Union[
+    int,
+    typing.Tuple[typing.Optional[int], typing.Optional[int]],
+    typing.Tuple[typing.Any, ...],
+]
+SchemaT = typing.Tuple[
+    str,
+    typing.Optional[int],
+    typing.Optional[int],
+    typing.Optional[typing.Tuple[typing.Tuple[str, SchemaRecordT], ...]],
+    bool,
+]
+# (((key, start, mask), ...), (value dependent key, ...)): leaf records for diff
+DiffPlanT = typing.Tuple[typing.Tuple[typing.Tuple[str, int, int], ...], typing.Tuple[str, ...]]
+# (template, ((shift, mask), ...)): template is formatted by values of records, extracted from root value
+FormatPlanT = typing.Tuple[str, typing.Tuple[typing.Tuple[int, int], ...]]
+_T = typing.TypeVar("_T")
+# Lookup table storage: list over all masked values (unlimited) or dict of stored entries (capped)
+LookupStorageT = typing.Union[typing.List[typing.Optional[_T]], typing.Dict[int, _T]]
+# Instrumentation counters: (weak reference to class, event, record) -> count
+StatsT = typing.Counter[typing.Tuple["weakref.ReferenceType[type]", str, typing.Optional[str]]]
+
+DEFAULT_CACHE_SIZE = 128  # Default limit of memorized child classes per BinField class
+SCHEMA_CACHE_SIZE = 1024  # Limit of memorized classes, restored from schema
+MAX_LOOKUP_SIZE = 16  # Maximum size in bits of class with lookup table decode
 
 # Resolve mapping
 # _size_ : int -> _size_ + _mask_
@@ -115,7 +155,7 @@ def _mapping_filter(key: str, val: typing.Any) -> bool:
         return True
 
     # Not nested
-    if not isinstance(val, dict):
+    if not isinstance(val, collections.abc.Mapping):
         return False
 
     # Process nested
@@ -128,7 +168,7 @@ def _get_index(val: IndexT) -> typing.Union[int, slice]:
         return val  # type: ignore
     if _is_valid_slice_mapping(val):
         return slice(*val)  # type: ignore
-    if isinstance(val, dict):
+    if isinstance(val, collections.abc.Mapping):
         return slice(*val["_index_"])
     raise TypeError(f"Unexpected val: {val!r}")  # pragma: no cover
 
@@ -155,6 +195,78 @@ def _get_start_index(src: typing.Tuple[typing.Any, IndexT]) -> int:
     return _get_index(src[1]).start  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
+def _get_numpy() -> typing.Any:
+    """Import optional numpy on first usage: numpy import is expensive.
+
+    :return: numpy module or None, if numpy is not installed
+    """
+    try:
+        import numpy  # type: ignore  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def _get_nested_mapping(mapping: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Get nested mapping records without _index_.
+
+    Shallow copy: nested records are not modified by mapping preparation.
+
+    :type mapping: typing.Mapping[str, typing.Any]
+    :rtype: typing.Dict[str, typing.Any]
+    """
+    return {key: val for key, val in mapping.items() if key != "_index_"}
+
+
+class _FrozenDict(typing.Dict[str, typing.Any]):
+    """Read-only dict for shared mapping records.
+
+    Copy, deep copy and pickle produce plain (mutable) dict.
+    """
+
+    __slots__ = ()
+
+    def __readonly(self, *args: typing.Any, **kwargs: typing.Any) -> typing.NoReturn:
+        """Shared mapping could not be modified.
+
+        :raises TypeError: read-only mapping
+        """
+        raise TypeError(f"{self.__class__.__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = __readonly
+    clear = pop = popitem = setdefault = update = __readonly
+
+    def __copy__(self) -> typing.Dict[str, typing.Any]:
+        """Mutable copy.
+
+        :rtype: typing.Dict[str, typing.Any]
+        """
+        return dict(self)
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """Mutable deep copy, including nested records.
+
+        :rtype: typing.Dict[str, typing.Any]
+        """
+        return {key: copy.deepcopy(val, memo) for key, val in self.items()}
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickle as plain dict."""
+        return dict, (dict(self),)
+
+
+def _freeze_mapping(mapping: typing.Mapping[str, typing.Any]) -> typing.Mapping[str, typing.Any]:
+    """Make read-only copy of resolved mapping, including nested records.
+
+    :type mapping: typing.Mapping[str, typing.Any]
+    :rtype: typing.Mapping[str, typing.Any]
+    """
+    return _FrozenDict(
+        (key, _freeze_mapping(val) if isinstance(val, collections.abc.Mapping) else val) for key, val in mapping.items()
+    )
+
+
 def _prepare_mapping(mapping: DeclaredMappingT) -> ResolvedMappingT:
     """Check indexes for intersections.
 
@@ -182,7 +294,8 @@ def _prepare_mapping(mapping: DeclaredMappingT) -> ResolvedMappingT:
     # pylint: enable=undefined-loop-variable
 
     if "_index_" in mapping:
-        new_mapping["_index_"] = mapping.pop("_index_")  # type: ignore
+        new_mapping["_index_"] = tuple(mapping["_index_"])  # type: ignore
+        mapping = _get_nested_mapping(mapping)
 
     unexpected = [item for item in mapping.items() if not _mapping_filter(*item)]
 
@@ -199,7 +312,7 @@ def _prepare_mapping(mapping: DeclaredMappingT) -> ResolvedMappingT:
         elif isinstance(m_val, int):
             mapping_mask = check_update_mapping_mask(_get_mask(m_val, m_val + 1))
             new_mapping[m_key] = m_val
-        elif isinstance(m_val, dict):  # nested mapping
+        elif isinstance(m_val, collections.abc.Mapping):  # nested mapping
             mapping_mask = check_update_mapping_mask(_get_mask(*m_val["_index_"]))
             new_mapping[m_key] = _prepare_mapping(m_val)
         else:
@@ -217,21 +330,434 @@ def _prepare_mapping(mapping: DeclaredMappingT) -> ResolvedMappingT:
     return new_mapping
 
 
-def _make_mapping_property(key: str) -> property:
-    """Property generator. Fixing lazy calculation.
+def _get_field_bounds(
+    index: typing.Union[int, slice],
+    size: typing.Optional[int],
+) -> typing.Optional[typing.Tuple[int, int]]:
+    """Resolve mapping index to (start, stop) bits, if it does not depend on instance value.
+
+    :param index: resolved mapping index
+    :type index: typing.Union[int, slice]
+    :param size: BinField size
+    :type size: typing.Optional[int]
+    :return: start and stop bits or None if bounds could be calculated only on instance
+    :rtype: typing.Optional[typing.Tuple[int, int]]
+    """
+    if isinstance(index, int):
+        start, stop = index, index + 1
+    else:
+        start, stop = index.start if index.start else 0, index.stop
+
+    if size is not None:
+        if start > size:
+            return None  # IndexError will be raised on access
+        if not stop or stop > size:
+            stop = size
+    elif not stop:
+        return None  # Open slice on unsized data: stop depends on value
+
+    if stop <= start:
+        return None
+    return start, stop
+
+
+class _MappingRecord:
+    """Mapping record descriptor.
+
+    Class level: record index. Instance level: record as BinField object, linked to the instance.
+    Start bit and mask are resolved on class creation, child class is created on first access.
+    """
+
+    __slots__ = ("key", "index", "start", "mask", "__child_cls", "__child_params")
+
+    def __init__(
+        self,
+        key: str,
+        m_val: typing.Union[int, slice, typing.Mapping[str, typing.Any]],
+        mask: typing.Optional[int],
+        size: typing.Optional[int],
+        frozen: bool = False,
+        int_accessors: typing.Optional[typing.Mapping[str, IntAccessorT]] = None,
+    ) -> None:
+        """Mapping record descriptor.
+
+        :param key: mapping key
+        :type key: str
+        :param m_val: resolved mapping value
+        :type m_val: typing.Union[int, slice, typing.Dict[str, typing.Any]]
+        :param mask: BinField mask
+        :type mask: typing.Optional[int]
+        :param size: BinField size
+        :type size: typing.Optional[int]
+        :param frozen: make frozen child class
+        :type frozen: bool
+        :param int_accessors: resolved integer accessors of owner class (nested records: child class layout)
+        :type int_accessors: typing.Optional[typing.Dict[str, typing.Tuple[int, int, int]]]
+        """
+        self.key = key
+        self.index: typing.Union[int, slice] = _get_index(m_val)  # type: ignore
+        self.__child_cls: typing.Optional[typing.Type[BinField]] = None
+        self.__child_params: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+
+        accessor = int_accessors.get(key) if int_accessors is not None else None
+        if accessor is None:
+            bounds = _get_field_bounds(self.index, size)
+            if bounds is None:  # Value dependent
+                self.start: typing.Optional[int] = None
+                self.mask: typing.Optional[int] = None
+                return
+
+            start, stop = bounds
+            get_mask = _get_mask(start, stop)
+            if mask is not None:
+                get_mask &= mask
+            width = stop - start
+        else:
+            start, get_mask, width = accessor
+        self.start, self.mask = start, get_mask
+
+        if isinstance(m_val, collections.abc.Mapping):
+            self.__child_params = _get_nested_mapping(m_val), get_mask >> start, width, frozen, int_accessors
+        else:
+            self.__child_params = None, get_mask >> start, width, frozen, None
+
+    @property
+    def child_cls(self) -> typing.Type[BinField]:
+        """Child class for record with static bounds. Created on first access.
+
+        :rtype: typing.Type[BinField]
+        """
+        child_cls = self.__child_cls
+        if child_cls is None:
+            with _LAZY_LOCK:
+                if self.__child_cls is None:
+                    mapping, mask, size, frozen, int_accessors = self.__child_params  # type: ignore
+                    layout = None
+                    if int_accessors is not None:  # Nested mapping is already validated and resolved
+                        prefix, start = f"{self.key}.", self.start
+                        layout = (
+                            mapping,
+                            {
+                                n_key[len(prefix) :]: (n_start - start, n_mask >> start, n_width)
+                                for n_key, (n_start, n_mask, n_width) in int_accessors.items()
+                                if n_key.startswith(prefix)
+                            },
+                        )
+                    self.__child_cls = BinFieldMeta.makecls(
+                        name=self.key, mapping=mapping, mask=mask, size=size, frozen=frozen, _layout=layout
+                    )
+                child_cls = self.__child_cls
+        return child_cls
+
+    def __get__(self, instance: typing.Optional[BinField], owner: typing.Any = None) -> typing.Any:
+        """Get record index (class level) or record object (instance level)."""
+        if instance is None:
+            return self.index
+
+        start = self.start
+        if start is None:  # Bounds depend on value: use common way
+            return instance[self.key]
+
+        child_cls = self.__child_cls
+        if child_cls is None:
+            child_cls = self.child_cls
+        if _STATS is not None:
+            _count(instance.__class__, "child.alloc", self.key)
+        return child_cls((instance._value_ & self.mask) >> start, _parent=(instance, start))  # type: ignore
+
+    def __set__(self, instance: BinField, value: typing.Any) -> None:
+        """Set record value."""
+        instance[self.key] = value
+
+
+def _make_int_accessors(
+    mapping: ResolvedMappingT,
+    mask: typing.Optional[int],
+    size: typing.Optional[int],
+) -> typing.Dict[str, IntAccessorT]:
+    """Resolve mapping records to (shift, mask, width) for integer access, including nested records.
+
+    Nested records are stored using dotted path: "nested.record".
+
+    :param mapping: resolved mapping
+    :type mapping: typing.Dict[str, typing.Union[int, slice, typing.Dict[str, typing.Any]]]
+    :param mask: BinField mask
+    :type mask: typing.Optional[int]
+    :param size: BinField size
+    :type size: typing.Optional[int]
+    :return: start bit, mask for extraction and bit width of each record with static bounds
+    :rtype: typing.Dict[str, typing.Tuple[int, int, int]]
+    """
+    result: typing.Dict[str, IntAccessorT] = {}
+    for m_key, m_val in mapping.items():
+        if m_key == "_index_":
+            continue
+
+        bounds = _get_field_bounds(_get_index(m_val), size)
+        if bounds is None:
+            continue
+
+        start, stop = bounds
+        get_mask = _get_mask(start, stop)
+        if mask is not None:
+            get_mask &= mask
+        result[m_key] = (start, get_mask, stop - start)
+
+        if isinstance(m_val, collections.abc.Mapping):
+            nested = _make_int_accessors(m_val, get_mask >> start, stop - start)
+            for n_key, (n_start, n_mask, n_width) in nested.items():
+                result[f"{m_key}.{n_key}"] = (start + n_start, n_mask << start, n_width)
+    return result
+
+
+def _iter_leaf_keys(mapping: typing.Mapping[str, typing.Any], prefix: str = "") -> typing.Iterator[str]:
+    """Get mapping records without nested records, nested records are addressed by dotted path.
+
+    :type mapping: typing.Mapping[str, typing.Any]
+    :type prefix: str
+    :rtype: typing.Iterator[str]
+    """
+    for key, val in mapping.items():
+        if key == "_index_":
+            continue
+        if isinstance(val, collections.abc.Mapping):
+            yield from _iter_leaf_keys(val, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}"
+
+
+def _get_diff_plan(cls: typing.Type[BinField]) -> DiffPlanT:
+    """Get leaf records accessors for diff.
 
-    :rtype: property
+    :return: ((key, start, mask), ...) of records with static bounds and keys of value dependent records
+    :raises IndexError: Mapping is not available
     """
+    # pylint: disable=protected-access
+    plan = _DIFF_PLANS.get(cls)
+    if plan is None:
+        mapping = cls._mapping_
+        if not isinstance(mapping, collections.abc.Mapping):
+            raise IndexError("Mapping is not available")
+
+        static: typing.List[typing.Tuple[str, int, int]] = []
+        dynamic: typing.List[str] = []
+        for key in _iter_leaf_keys(mapping):
+            accessor = cls._int_accessors_.get(key)
+            if accessor is not None:
+                static.append((key, accessor[0], accessor[1]))
+            elif cls._size_ is None:  # Open slice on unsized data. For sized data: record is out of data
+                dynamic.append(key)
+        plan = _DIFF_PLANS[cls] = tuple(static), tuple(dynamic)
+    return plan
+
+
+def _diff_values(cls: typing.Type[BinField], old: int, new: int) -> typing.Dict[str, typing.Tuple[int, int]]:
+    """Compare values by leaf mapping records: single XOR, changed bits are mapped to records.
+
+    :return: changed records: {key: (old value, new value)}
+    :raises IndexError: Mapping is not available
+    """
+    # pylint: disable=protected-access
+    static, dynamic = _get_diff_plan(cls)
+    changed = old ^ new
+    result: typing.Dict[str, typing.Tuple[int, int]] = {}
+    if not changed:
+        return result
 
-    def fget(self: typing.MutableMapping[str, typing.Any]) -> typing.Any:
-        """Mapping key: {key}."""
-        return self[key]
+    for key, start, mask in static:
+        if changed & mask:
+            result[key] = (old & mask) >> start, (new & mask) >> start
 
-    def fset(self: typing.MutableMapping[str, typing.Any], val: typing.Any) -> None:
-        """Setter for {key}."""
-        self[key] = val
+    if dynamic:
+        old_obj, new_obj = cls(old), cls(new)
+        for key in dynamic:
+            old_val, new_val = old_obj._get_int_(key), new_obj._get_int_(key)
+            if old_val != new_val:
+                result[key] = old_val, new_val
+    return result
 
-    return property(fget=fget, fset=fset, doc=f"mapping key: {key}")
+
+def _merge_records(cls: typing.Type[BinField], fields: typing.Mapping[str, int]) -> typing.Tuple[int, int]:
+    """Validate records values and merge them into single (mask, value) for one write.
+
+    Records are applied in order: later record overrides intersecting bits, like sequential assignment.
+
+    :return: mask of modified bits and new value of modified bits
+    :raises TypeError: value type is not int
+    :raises IndexError: key not found or record bounds depend on value
+    :raises ValueError: negative data or data bigger, than record
+    """
+    # pylint: disable=protected-access
+    merged_mask = merged_value = 0
+    for key, value in fields.items():
+        accessor = cls._int_accessors_.get(key)
+        if accessor is None:
+            raise IndexError(key)
+        start, mask, width = accessor
+
+        if not isinstance(value, int):
+            raise TypeError("BinField value could be set only as int")
+        if value < 0:
+            raise ValueError("BinField could not be negative!")
+        if value.bit_length() > width:
+            raise ValueError(f"Data size is bigger, than record {key} ({width} bits)")
+
+        merged_mask |= mask
+        merged_value = merged_value & ~mask | (value << start) & mask
+    return merged_mask, merged_value
+
+
+def _get_byte_size(cls: typing.Type[BinField]) -> int:
+    """Get record size in bytes for sized BinField class.
+
+    :type cls: typing.Type[BinField]
+    :rtype: int
+    :raises ValueError: BinField class size is not defined
+    """
+    # pylint: disable=protected-access
+    size = cls._size_
+    if not isinstance(size, int):
+        raise ValueError(f"{cls.__name__} size is not defined")
+    return (size + 7) // 8
+
+
+_STRUCT_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_BYTEORDER_CODES = {"big": ">", "little": "<"}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_struct(length: int, byteorder: str) -> typing.Optional[struct.Struct]:
+    """Get precompiled struct for native integer sizes.
+
+    :param length: data length in bytes
+    :type length: int
+    :param byteorder: "big" or "little"
+    :type byteorder: str
+    :return: precompiled struct, if length is native integer size
+    :rtype: typing.Optional[struct.Struct]
+    :raises ValueError: unexpected byteorder
+    """
+    if byteorder not in _BYTEORDER_CODES:
+        raise ValueError("byteorder must be either 'little' or 'big'")
+    if length not in _STRUCT_CODES:
+        return None
+    return struct.Struct(_BYTEORDER_CODES[byteorder] + _STRUCT_CODES[length])
+
+
+def _mapping_to_schema(mapping: typing.Mapping[str, typing.Any]) -> typing.Tuple[typing.Tuple[str, SchemaRecordT], ...]:
+    """Convert resolved mapping to hashable and picklable records.
+
+    :type mapping: typing.Mapping[str, typing.Any]
+    :rtype: typing.Tuple[typing.Tuple[str, typing.Union[int, typing.Tuple[typing.Any, ...]]], ...]
+    """
+    records: typing.List[typing.Tuple[str, SchemaRecordT]] = []
+    for key, val in mapping.items():
+        if isinstance(val, int):
+            records.append((key, val))
+        elif isinstance(val, collections.abc.Mapping):
+            records.append((key, _mapping_to_schema(val)))
+        else:
+            index = _get_index(val)
+            records.append((key, (index.start, index.stop)))  # type: ignore
+    return tuple(records)
+
+
+def _mapping_from_schema(records: typing.Tuple[typing.Tuple[str, SchemaRecordT], ...]) -> DeclaredMappingT:
+    """Convert schema records to mapping.
+
+    :type records: typing.Tuple[typing.Tuple[str, typing.Union[int, typing.Tuple[typing.Any, ...]]], ...]
+    :rtype: typing.Dict[str, typing.Any]
+    """
+    mapping: DeclaredMappingT = {}
+    for key, val in records:
+        if isinstance(val, int):
+            mapping[key] = val
+        elif val and isinstance(val[0], tuple):  # Nested records: pairs of key and record
+            mapping[key] = _mapping_from_schema(val)
+        elif key == "_index_":
+            mapping[key] = val
+        else:  # Slice record: restore as slice, open-ended bounds are not valid slice mapping
+            mapping[key] = slice(*val)
+    return mapping
+
+
+# Schema of classes: calculated once per class
+_SCHEMAS: weakref.WeakKeyDictionary[typing.Type[BinField], SchemaT] = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _make_cls_from_schema(schema: SchemaT) -> typing.Type[BinField]:
+    """Create BinField subclass from schema. Memorized: the same schema produces the same class.
+
+    :type schema: typing.Tuple[str, typing.Optional[int], typing.Optional[int],
+                  typing.Optional[typing.Tuple[typing.Tuple[str, typing.Any], ...]], bool]
+    :rtype: typing.Type[BinField]
+    """
+    name, size, mask, records, frozen = schema
+    cls = BinFieldMeta.makecls(
+        name=name,
+        mapping=None if records is None else _mapping_from_schema(records),
+        mask=mask,
+        size=size,
+        frozen=frozen,
+    )
+    _SCHEMAS[cls] = schema
+    return cls
+
+
+def _is_importable(cls: typing.Type[typing.Any]) -> bool:
+    """Check, that class could be found by module and qualified name.
+
+    :rtype: bool
+    """
+    obj: typing.Any = sys.modules.get(cls.__module__)
+    for part in cls.__qualname__.split("."):
+        obj = getattr(obj, part, None)
+    return obj is cls
+
+
+def _get_class_ref(cls: typing.Type[BinField]) -> typing.Union[typing.Type[BinField], SchemaT]:
+    """Get picklable class reference: class itself, if importable, else schema.
+
+    :rtype: typing.Union[typing.Type[BinField], typing.Tuple[typing.Any, ...]]
+    """
+    # pylint: disable=protected-access
+    if _is_importable(cls):
+        return cls
+    return cls._schema_()
+
+
+def _resolve_class_ref(ref: typing.Union[typing.Type[BinField], SchemaT]) -> typing.Type[BinField]:
+    """Get class from reference, made by _get_class_ref.
+
+    :rtype: typing.Type[BinField]
+    """
+    if isinstance(ref, type):
+        return ref
+    return BinFieldMeta.from_schema(ref)
+
+
+def _restore_from_schema(schema: SchemaT, value: int) -> BinField:
+    """Restore pickled BinField of not importable class.
+
+    :rtype: BinField
+    """
+    return _make_cls_from_schema(schema)(value)
+
+
+def _reduce_value(cls: typing.Type[BinField], value: int) -> typing.Tuple[typing.Any, ...]:
+    """Pickle data for BinField: class reference and value.
+
+    :rtype: typing.Tuple[typing.Any, ...]
+    """
+    ref = _get_class_ref(cls)
+    if isinstance(ref, type):
+        return ref, (value,)
+    return _restore_from_schema, (ref, value)
+
+
+# Frozen variants of mutable classes
+_FROZEN_CLASSES: weakref.WeakKeyDictionary[typing.Type[BinField], typing.Type[BinField]] = weakref.WeakKeyDictionary()
 
 
 def _make_static_ro_property(name: str, val: typing.Any) -> property:
@@ -244,6 +770,418 @@ def _make_static_ro_property(name: str, val: typing.Any) -> property:
     return property(fget=lambda _: val, doc=f"Read-only {name}")
 
 
+class _StaticValue:
+    """Read-only class layout value: the same for class and instances."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, val: typing.Any) -> None:
+        """Read-only class layout value.
+
+        :type val: object
+        """
+        self.value = val
+
+    def __get__(self, instance: typing.Any, owner: typing.Any = None) -> typing.Any:
+        """Get value."""
+        return self.value
+
+    def __set__(self, instance: typing.Any, value: typing.Any) -> None:
+        """Read-only.
+
+        :raises AttributeError: Always
+        """
+        raise AttributeError("can't set attribute")
+
+
+def _get_static_value(cls: typing.Type[typing.Any], name: str, default: typing.Any = NotImplemented) -> typing.Any:
+    """Get class layout value.
+
+    :rtype: typing.Any
+    """
+    value = cls.__dict__.get(name)
+    if isinstance(value, _StaticValue):
+        return value.value
+    return default
+
+
+# Attributes, which could not be changed on class
+_LAYOUT_ATTRIBUTES = frozenset(("_value_", "_size_", "_bit_size_", "_mask_", "_mapping_", "_frozen_"))
+_LAZY_LOCK = threading.Lock()  # Lazy child classes creation
+
+# Instrumentation counters. None: instrumentation is disabled.
+_STATS: typing.Optional[StatsT] = None
+
+
+def _set_stats(counters: typing.Optional[StatsT]) -> None:
+    """Enable (counters storage) or disable (None) instrumentation.
+
+    Hot path methods, which count only if enabled, are replaced by instrumented variants.
+
+    :type counters: typing.Optional[typing.Counter[typing.Tuple[weakref.ref, str, typing.Optional[str]]]]
+    """
+    global _STATS  # pylint: disable=global-statement
+    _STATS = counters
+    for name, (plain, instrumented) in _INSTRUMENTED.items():
+        type.__setattr__(BinField, name, plain if counters is None else instrumented)
+
+
+def _get_stats() -> typing.Optional[StatsT]:
+    """Get instrumentation counters storage, None if disabled.
+
+    :rtype: typing.Optional[typing.Counter[typing.Tuple[weakref.ref, str, typing.Optional[str]]]]
+    """
+    return _STATS
+
+
+def _count(cls: type, event: str, record: typing.Optional[str] = None) -> None:
+    """Increment instrumentation counter, if enabled. Class is referenced weakly: counters do not keep it alive.
+
+    :type cls: type
+    :type event: str
+    :type record: typing.Optional[str]
+    """
+    counters = _STATS
+    if counters is not None:
+        counters[weakref.ref(cls), event, record] += 1
+
+
+class CacheInfo(typing.NamedTuple):
+    """Child classes cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: typing.Optional[int]
+    currsize: int
+
+
+class _ChildClassCache:
+    """Size-capped LRU cache for generated child classes.
+
+    Lookup of existing record is lock-free, class creation and eviction are made under lock.
+    Hits counter is not protected by lock and could be approximate under high contention.
+    """
+
+    __slots__ = ("__data", "__lock", "__maxsize", "__hits", "__misses", "__evictions")
+
+    def __init__(self, maxsize: typing.Optional[int] = DEFAULT_CACHE_SIZE) -> None:
+        """Size-capped LRU cache for generated child classes.
+
+        :param maxsize: maximum classes amount to keep. None means unlimited, 0 disables memorize.
+        :type maxsize: typing.Optional[int]
+        :raises TypeError: maxsize is not int
+        :raises ValueError: maxsize is negative
+        """
+        if maxsize is not None:
+            if not isinstance(maxsize, int):
+                raise TypeError(f"Cache size has invalid type: {maxsize!r}")
+            if maxsize < 0:
+                raise ValueError("Cache size could not be negative!")
+
+        self.__data: typing.OrderedDict[typing.Tuple[int, str], typing.Type[BinField]] = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__maxsize = maxsize
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: typing.Tuple[int, str]) -> typing.Optional[typing.Type[BinField]]:
+        """Get memorized class without locking.
+
+        :type key: typing.Tuple[int, str]
+        :rtype: typing.Optional[typing.Type[BinField]]
+        """
+        try:
+            cls = self.__data[key]
+        except KeyError:
+            return None
+        try:
+            self.__data.move_to_end(key)
+        except KeyError:  # pragma: no cover
+            pass  # Evicted in parallel thread: class is still valid
+        self.__hits += 1
+        return cls
+
+    def get_or_create(
+        self,
+        key: typing.Tuple[int, str],
+        factory: typing.Callable[[], typing.Type[BinField]],
+    ) -> typing.Type[BinField]:
+        """Get memorized class or create it using factory.
+
+        :type key: typing.Tuple[int, str]
+        :param factory: class constructor, called under lock
+        :type factory: typing.Callable[[], typing.Type[BinField]]
+        :rtype: typing.Type[BinField]
+        """
+        cls = self.get(key)
+        if cls is not None:
+            return cls
+
+        with self.__lock:
+            cls = self.__data.get(key)
+            if cls is not None:  # pragma: no cover
+                return cls  # Created in parallel thread
+
+            self.__misses += 1
+            cls = factory()
+            if self.__maxsize == 0:
+                return cls
+
+            self.__data[key] = cls
+            if self.__maxsize is not None and len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+                self.__evictions += 1
+        return cls
+
+    def cache_info(self) -> CacheInfo:
+        """Cache statistics.
+
+        :rtype: CacheInfo
+        """
+        return CacheInfo(
+            hits=self.__hits,
+            misses=self.__misses,
+            evictions=self.__evictions,
+            maxsize=self.__maxsize,
+            currsize=len(self.__data),
+        )
+
+    def cache_clear(self) -> None:
+        """Drop memorized classes and statistics."""
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = self.__misses = self.__evictions = 0
+
+    def __len__(self) -> int:
+        """Amount of memorized classes."""
+        return len(self.__data)
+
+    def __repr__(self) -> str:
+        """Debug information."""
+        return f"<{self.__class__.__name__}: {self.cache_info()}>"
+
+
+class _LookupTable:
+    """Lazily filled decode table of small sized class: value -> records values or frozen instance.
+
+    Entries are indexed by masked value and created on first access, amount of stored entries is capped per kind.
+    Unlimited table is list over all masked values, capped table is dict: memory is limited by stored entries.
+    Access is lock-free: the same entry could be created twice by parallel threads.
+    """
+
+    __slots__ = ("cls", "__mask", "__maxsize", "__ints", "__objects")
+
+    def __init__(self, mask: int, maxsize: typing.Optional[int]) -> None:
+        """Lazily filled decode table.
+
+        :param mask: class mask: table index limit
+        :type mask: int
+        :param maxsize: maximum amount of stored entries of each kind. None means unlimited.
+        :type maxsize: typing.Optional[int]
+        :raises TypeError: maxsize is not int
+        :raises ValueError: maxsize is not positive
+        """
+        if maxsize is not None:
+            if isinstance(maxsize, bool) or not isinstance(maxsize, int):
+                raise TypeError(f"Lookup table size has invalid type: {maxsize!r}")
+            if maxsize <= 0:
+                raise ValueError("Lookup table size must be positive value !")
+
+        self.cls: typing.Type[BinField]  # Owner class, set after class creation
+        self.__mask = mask
+        self.__maxsize = maxsize
+        # Allocated on first access
+        self.__ints: typing.Optional[LookupStorageT[typing.Tuple[int, ...]]] = None
+        self.__objects: typing.Optional[LookupStorageT[BinField]] = None
+
+    def __allocate(self) -> LookupStorageT[typing.Any]:
+        """Create empty table: list for all masked values if unlimited, else dict."""
+        if self.__maxsize is None:
+            return [None] * (self.__mask + 1)
+        return {}
+
+    @staticmethod
+    def __lookup(table: LookupStorageT[_T], index: int) -> typing.Optional[_T]:
+        """Get stored entry or None."""
+        if isinstance(table, list):
+            return table[index]
+        return table.get(index)
+
+    def __store(self, table: LookupStorageT[_T], index: int, entry: _T) -> None:
+        """Store entry, if it is not stored yet and limit is not reached."""
+        if isinstance(table, list):
+            if table[index] is None:
+                table[index] = entry
+        elif self.__maxsize is not None and len(table) < self.__maxsize and index not in table:
+            table[index] = entry
+
+    def __fill_ints(self, value: int) -> typing.Tuple[int, ...]:
+        """Calculate records values and store, if limit is not reached."""
+        # pylint: disable=protected-access
+        entry = self.cls(value)._get_ints_()
+        if self.__ints is not None:
+            self.__store(self.__ints, value & self.__mask, entry)
+        return entry
+
+    def __fill_object(self, value: int) -> BinField:
+        """Create frozen instance and store, if limit is not reached."""
+        # pylint: disable=protected-access
+        obj = self.cls(value)
+        if not self.cls._frozen_:
+            obj = obj._freeze_()
+        if self.__objects is not None:
+            self.__store(self.__objects, value & self.__mask, obj)
+        return obj
+
+    def get_ints(self, value: int) -> typing.Tuple[int, ...]:
+        """Get top level mapping records values, the same as ``cls(value)._get_ints_()``.
+
+        :type value: int
+        :rtype: typing.Tuple[int, ...]
+        """
+        if self.__ints is None:
+            self.__ints = self.__allocate()
+        entry = self.__lookup(self.__ints, value & self.__mask)
+        if entry is None:
+            return self.__fill_ints(value)
+        return entry
+
+    def get_many(self, values: typing.Iterable[int]) -> typing.List[typing.Tuple[int, ...]]:
+        """Get top level mapping records values for many values.
+
+        :type values: typing.Iterable[int]
+        :rtype: typing.List[typing.Tuple[int, ...]]
+        """
+        if self.__ints is None:
+            self.__ints = self.__allocate()
+        if not isinstance(values, typing.Sequence):
+            values = list(values)
+        table = self.__ints
+        mask = self.__mask
+        result: typing.List[typing.Any]
+        if isinstance(table, list):
+            result = [table[value & mask] for value in values]
+        else:
+            get = table.get
+            result = [get(value & mask) for value in values]
+        for entry in result:
+            if entry is None:
+                break
+        else:  # All stored
+            return result
+        for pos, entry in enumerate(result):
+            if entry is None:
+                result[pos] = self.__fill_ints(values[pos])
+        return result
+
+    def get_frozen(self, value: int) -> BinField:
+        """Get shared frozen instance, equal to ``cls(value)``.
+
+        :type value: int
+        :rtype: BinField
+        """
+        if self.__objects is None:
+            self.__objects = self.__allocate()
+        obj = self.__lookup(self.__objects, value & self.__mask)
+        if obj is None:  # Frozen instance with value 0 is falsy
+            return self.__fill_object(value)
+        return obj
+
+    def cache_clear(self) -> None:
+        """Drop stored entries and release tables."""
+        self.__ints = None
+        self.__objects = None
+
+    @staticmethod
+    def __count(table: typing.Optional[LookupStorageT[typing.Any]]) -> int:
+        """Amount of stored entries in table."""
+        if table is None:
+            return 0
+        if isinstance(table, list):
+            return len(table) - table.count(None)
+        return len(table)
+
+    def __len__(self) -> int:
+        """Amount of stored entries."""
+        return self.__count(self.__ints) + self.__count(self.__objects)
+
+    def __repr__(self) -> str:
+        """Debug information."""
+        return (
+            f"<{self.__class__.__name__}: "
+            f"ints={self.__count(self.__ints)}, objects={self.__count(self.__objects)}, maxsize={self.__maxsize}>"
+        )
+
+
+class FieldMatch:
+    """Compiled mapping records constraints: single (mask, value) test on raw integer.
+
+    Produced by `BinField._match_()`. No BinField objects are created on check.
+    """
+
+    __slots__ = ("cls", "mask", "value")
+
+    def __init__(self, cls: typing.Type[BinField], mask: int, value: int) -> None:
+        """Compiled constraints.
+
+        :param cls: BinField class
+        :type cls: typing.Type[BinField]
+        :param mask: mask of constrained bits
+        :type mask: int
+        :param value: expected value of constrained bits
+        :type value: int
+        """
+        self.cls = cls
+        self.mask = mask
+        self.value = value
+
+    def __call__(self, value: typing.Union[int, BinField, typing.Any]) -> bool:
+        """Check value: int or BinField object.
+
+        :rtype: bool
+        """
+        return (operator.index(value) & self.mask) == self.value
+
+    def test_many(self, values: typing.Iterable[typing.Any]) -> typing.Any:
+        """Check many values without BinField construction.
+
+        :param values: integers or BinField objects (sequence, array.array, numpy array or iterable)
+        :type values: typing.Iterable[typing.Union[int, BinField]]
+        :return: numpy array of bool for numpy array on input, else list of bool
+        :rtype: typing.Union[typing.List[bool], numpy.ndarray]
+        """
+        numpy = sys.modules.get("numpy")  # ndarray could not exist without numpy import
+        if numpy is not None and isinstance(values, numpy.ndarray) and self.mask.bit_length() <= 64:
+            return self.__test_array(numpy, values)
+        mask, expected, index = self.mask, self.value, operator.index
+        return [(index(value) & mask) == expected for value in values]
+
+    def filter(self, values: typing.Iterable[typing.Any]) -> typing.Any:
+        """Select matching values without BinField construction.
+
+        :param values: integers or BinField objects (sequence, array.array, numpy array or iterable)
+        :type values: typing.Iterable[typing.Union[int, BinField]]
+        :return: numpy array for numpy array on input, else list of matching items
+        :rtype: typing.Union[typing.List[typing.Union[int, BinField]], numpy.ndarray]
+        """
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(values, numpy.ndarray) and self.mask.bit_length() <= 64:
+            return values[self.__test_array(numpy, values)]  # Source dtype is kept
+        mask, expected, index = self.mask, self.value, operator.index
+        return [value for value in values if (index(value) & mask) == expected]
+
+    def __test_array(self, numpy: typing.Any, values: typing.Any) -> typing.Any:
+        """Check numpy array of any integer dtype: signed data is processed as uint64, like python int masking."""
+        data = numpy.asarray(values, dtype=numpy.uint64)
+        return (data & numpy.uint64(self.mask)) == numpy.uint64(self.value)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<{self.__class__.__name__} {self.cls.__name__}: value & 0x{self.mask:X} == 0x{self.value:X}>"
+
+
 class BaseBinFieldMeta:  # pragma: no cover
     """Fake class for BinFieldMeta compilation and class instance creation."""
 
@@ -258,6 +1196,130 @@ class BinField(typing.MutableMapping[str, typing.Any]):  # pragma: no cover
     _mapping_: AllowedMappingT
     _value_: int
     _bit_size_: int
+    _frozen_: bool
+    _cache_: _ChildClassCache
+    _lookup_: typing.Optional[_LookupTable]
+    _accessors_: typing.Dict[str, _MappingRecord]
+    _int_accessors_: typing.Dict[str, IntAccessorT]
+    __parent_link: typing.Optional[typing.Tuple[BinField, int]]  # pylint: disable=unused-private-member
+
+    if typing.TYPE_CHECKING:  # Real implementation is defined below
+        # pylint: disable=unused-argument
+
+        def __init__(
+            self,
+            x: typing.Union[int, str] = 0,
+            base: int = 10,
+            _parent: typing.Optional[typing.Tuple[BinField, int]] = None,
+            **fields: int,
+        ) -> None:
+            ...
+
+        def __int__(self) -> int:
+            ...
+
+        def __index__(self) -> int:
+            ...
+
+        def __and__(self, other: typing.Any) -> BinField:
+            ...
+
+        def __or__(self, other: typing.Any) -> BinField:
+            ...
+
+        def __xor__(self, other: typing.Any) -> BinField:
+            ...
+
+        def __getitem__(self, item: KeyT) -> BinField:
+            ...
+
+        def __setitem__(self, key: KeyT, value: int) -> None:
+            ...
+
+        def _freeze_(self) -> BinField:
+            ...
+
+        @classmethod
+        def _schema_(cls) -> SchemaT:
+            ...
+
+        @classmethod
+        def _get_child_cls_(
+            cls,
+            mask: int,
+            name: str,
+            cls_mask: int,
+            size: int,
+            mapping: AllowedMappingT = None,
+        ) -> typing.Type[BinField]:
+            ...
+
+        def _get_int_(self, key: str) -> int:
+            ...
+
+        def _get_ints_(self, *keys: str) -> typing.Tuple[int, ...]:
+            ...
+
+        def _diff_(self, other: typing.Union[int, BinField]) -> typing.Dict[str, typing.Tuple[int, int]]:
+            ...
+
+        @classmethod
+        def _diff_many_(
+            cls,
+            values: typing.Iterable[typing.Union[int, BinField]],
+        ) -> typing.List[typing.Dict[str, typing.Tuple[int, int]]]:
+            ...
+
+        @classmethod
+        def _match_(
+            cls,
+            _constraints: typing.Optional[typing.Mapping[str, int]] = None,
+            **fields: int,
+        ) -> FieldMatch:
+            ...
+
+        @classmethod
+        def _decode_many_(
+            cls,
+            values: typing.Iterable[int],
+            *keys: str,
+            use_numpy: typing.Optional[bool] = None,
+        ) -> typing.Dict[str, typing.Any]:
+            ...
+
+        @classmethod
+        def _encode_many_(
+            cls,
+            columns: typing.Mapping[str, typing.Iterable[int]],
+            byteorder: typing.Optional[str] = None,
+        ) -> typing.Union[typing.List[int], bytes]:
+            ...
+
+        @classmethod
+        def _from_bytes_(
+            cls,
+            buf: typing.Union[bytes, bytearray, memoryview, typing.Any],
+            byteorder: str = "big",
+            offset: int = 0,
+        ) -> BinField:
+            ...
+
+        def _to_bytes_(self, byteorder: str = "big") -> bytes:
+            ...
+
+        def _getslice_(
+            self,
+            item: slice,
+            mapping: AllowedMappingT = None,
+            name: typing.Optional[str] = None,
+        ) -> BinField:
+            ...
+
+        def _setslice_(self, key: slice, value: int) -> None:
+            ...
+
+        def _update_(self, _records: typing.Optional[typing.Mapping[str, int]] = None, **fields: int) -> None:
+            ...
 
 
 class BaseMeta(type):  # pragma: no cover
@@ -271,7 +1333,7 @@ class BaseMeta(type):  # pragma: no cover
     @property
     def _size_(cls) -> typing.Any:
         """Only for sized (Not BaseClass)."""
-        return NotImplemented
+        return _get_static_value(cls, "_size_")
 
     @property
     def _bit_size_(cls) -> typing.Any:
@@ -281,22 +1343,45 @@ class BaseMeta(type):  # pragma: no cover
     @property
     def _mask_(cls) -> typing.Any:
         """Only if mask presents (Not BaseClass)."""
-        return NotImplemented
+        return _get_static_value(cls, "_mask_")
 
     @property
     def _mapping_(cls) -> typing.Any:
         """Only for indexed (Not BaseClass)."""
-        return NotImplemented
+        return _get_static_value(cls, "_mapping_")
+
+    @property
+    def _frozen_(cls) -> bool:
+        """Base class is mutable."""
+        return _get_static_value(cls, "_frozen_", False)  # type: ignore
+
+    def __setattr__(cls, name: str, value: typing.Any) -> None:
+        """Class layout is read-only.
+
+        :raises AttributeError: layout attribute or mapping record
+        """
+        if name in _LAYOUT_ATTRIBUTES or isinstance(cls.__dict__.get(name), _MappingRecord):
+            raise AttributeError(f"can't set attribute {name!r} of {cls.__name__}")
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        """Class layout is read-only.
+
+        :raises AttributeError: layout attribute or mapping record
+        """
+        if name in _LAYOUT_ATTRIBUTES or isinstance(cls.__dict__.get(name), _MappingRecord):
+            raise AttributeError(f"can't delete attribute {name!r} of {cls.__name__}")
+        super().__delattr__(name)
 
 
 class BinFieldMeta(BaseMeta):
     """Metaclass for BinField class and subclasses construction."""
 
     # noinspection PyInitNewSignature
-    def __new__(  # type: ignore
+    def __new__(
         mcs,  # noqa:N804
         name: str,
-        bases: typing.Tuple[type],
+        bases: typing.Tuple[typing.Type[typing.Any], ...],
         classdict: typing.Dict[str, typing.Any],
     ) -> typing.Type[BinField]:
         """Metaclass for BinField.
@@ -306,7 +1391,7 @@ class BinFieldMeta(BaseMeta):
         :type classdict: dict
         :returns: new class
         :raises ValueError: validation fail (size, mask, reserved keys in classdict)
-        :raises TypeError: Invalid type for size or mask, or unexpected data in classdict
+        :raises TypeError: Invalid type for size or mask, unexpected data in classdict or subclassing of BinField
         """
         if not (BaseBinFieldMeta in bases or any((issubclass(base, BaseBinFieldMeta) for base in bases))):
             # Top level baseclass: cleanup
@@ -314,8 +1399,17 @@ class BinFieldMeta(BaseMeta):
                 classdict.pop(key, None)
             return super().__new__(mcs, name, bases, classdict)
 
-        meta_dict = {}
-        meta_name = f"{name}Meta"
+        for base in bases:
+            if base is not BinField and issubclass(base, BinField):
+                raise TypeError("Cannot extend BinField")
+
+        is_base = BinField not in bases
+
+        def static(name: str, val: typing.Any) -> typing.Any:
+            """Class level value: read-only property on base class, shared value descriptor on subclasses."""
+            if is_base:
+                return _make_static_ro_property(name, val)
+            return _StaticValue(val)
 
         if "_index_" in classdict:
             raise ValueError("_index_ is reserved index for slicing nested BinFields")
@@ -344,15 +1438,22 @@ class BinFieldMeta(BaseMeta):
                 # noinspection PyUnresolvedReferences
                 size = mask.bit_length()
 
-        meta_dict["_size_"] = classdict["_size_"] = _make_static_ro_property("size", size)
-        meta_dict["_mask_"] = classdict["_mask_"] = _make_static_ro_property("mask", mask)
+        classdict["_size_"] = static("size", size)
+        classdict["_mask_"] = static("mask", mask)
+
+        frozen = classdict.pop("_frozen_", False)
+        frozen_base = classdict.pop("_frozen_base_", False)  # Frozen variant base class declares own slots
+        if not isinstance(frozen, bool):
+            raise TypeError(f"Pre-defined frozen flag has invalid type: {frozen!r}")
+        classdict["_frozen_"] = static("frozen", frozen)
 
         mapping = classdict.pop("_mapping_", None)
+        layout: typing.Optional[LayoutT] = classdict.pop("_layout_", None)
 
         if mapping is None:
             mapping = {}
 
-            for m_key, m_val in classdict.copy().items():
+            for m_key, m_val in list(classdict.items()):
                 if not _mapping_filter(m_key, m_val):
                     continue
                 if isinstance(m_val, (list, tuple)):
@@ -370,55 +1471,57 @@ class BinFieldMeta(BaseMeta):
         if garbage:
             raise TypeError(f"Several data is not recognized in class structure: {garbage!r}")
 
-        ready_mapping = _prepare_mapping(mapping)
+        if layout is None:
+            ready_mapping = _prepare_mapping(mapping)
+            int_accessors = _make_int_accessors(ready_mapping, mask, size)
+        else:  # Already validated and resolved
+            ready_mapping, int_accessors = layout
+        accessors: typing.Dict[str, _MappingRecord] = {}
 
         if ready_mapping:
-            meta_dict["_mapping_"] = classdict["_mapping_"] = _make_static_ro_property(
-                "mapping", copy.deepcopy(ready_mapping)
-            )
+            shared_mapping = _freeze_mapping(ready_mapping)  # Shared by class, instances and child classes
+            classdict["_mapping_"] = static("mapping", shared_mapping)
 
-            for m_key in ready_mapping:
-                classdict[m_key] = _make_mapping_property(m_key)
-                meta_dict[m_key] = _make_static_ro_property(m_key, _get_index(ready_mapping[m_key]))
+            for m_key, m_val in shared_mapping.items():
+                record = classdict[m_key] = _MappingRecord(m_key, m_val, mask, size, frozen, int_accessors)
+                if record.start is not None:
+                    accessors[m_key] = record
 
         else:
-            meta_dict["_mapping_"] = classdict["_mapping_"] = _make_static_ro_property("mapping", None)
-
-        classdict["_cache_"] = {}  # Use for subclasses memorize
-
-        if BinField not in bases:
-            return super().__new__(mcs, name, bases, classdict)
-
-        # noinspection PyPep8Naming
-        RealMeta = type(meta_name, (type,), meta_dict)  # noqa:N806  # pylint: disable=invalid-name  # NOSONAR
-
-        # pylint: disable=bad-mcs-classmethod-argument
-        class SubMeta(RealMeta, BinFieldMeta):  # type: ignore
-            """Mixin metaclass for creating BinField subclasses.
+            classdict["_mapping_"] = static("mapping", None)
 
-            Properties is made in RealMeta and here we are creating new class
-            by the single possible way (usage of super() is impossible).
-            :raises TypeError: Subclassing of BinField
-            """
+        classdict["_cache_"] = _ChildClassCache(classdict.pop("_cache_size_", DEFAULT_CACHE_SIZE))  # Memorize
 
-            # noinspection PyMethodParameters,PyInitNewSignature
-            def __new__(
-                smcs,  # noqa:N804  # NOSONAR
-                sname: str,
-                sbases: typing.Tuple[type],
-                sns: typing.Dict[str, typing.Any],
-            ) -> SubMeta:  # pylint: disable=undefined-variable
-                for base in sbases:
-                    if base is not BinField and issubclass(base, BinField):
-                        raise TypeError("Cannot extend BinField")
-
-                sns["__slots__"] = ()  # No any new fields on instances
-
-                return super().__new__(smcs, sname, sbases, sns)  # type: ignore
-
-        # pylint: enable=bad-mcs-classmethod-argument
-
-        return type.__new__(SubMeta, name, bases, classdict)
+        lookup_size = classdict.pop("_lookup_size_", 0)
+        if isinstance(lookup_size, bool):
+            raise TypeError(f"Lookup table size has invalid type: {lookup_size!r}")
+        lookup: typing.Optional[_LookupTable] = None
+        if lookup_size != 0:  # Opt-in
+            if size is None:
+                raise ValueError("Lookup table is supported only for classes with defined size")
+            if size > MAX_LOOKUP_SIZE:
+                raise ValueError(f"Lookup table is supported only for classes up to {MAX_LOOKUP_SIZE} bits")
+            if not ready_mapping:
+                raise ValueError("Lookup table is supported only for mapped classes")
+            lookup = _LookupTable(mask, lookup_size)
+        classdict["_lookup_"] = lookup
+        classdict["_accessors_"] = accessors  # Pre-calculated mapping records access
+        classdict["_int_accessors_"] = int_accessors
+
+        if not (is_base or frozen_base):
+            if frozen:
+                classdict["__slots__"] = ()  # No any new fields on instances
+                bases = (_FrozenBinField,)
+            else:
+                classdict["__slots__"] = ("_BinField__parent_link",)  # Only mutable objects could be linked
+                classdict["_linked_"] = True
+        elif is_base:  # Not linkable objects (base class and frozen) read class level default
+            classdict["_BinField__parent_link"] = None
+
+        new_cls: typing.Type[BinField] = super().__new__(mcs, name, bases, classdict)  # type: ignore[assignment]
+        if lookup is not None:
+            lookup.cls = new_cls
+        return new_cls
 
     @classmethod
     def makecls(
@@ -427,6 +1530,8 @@ class BinFieldMeta(BaseMeta):
         mapping: AllowedMappingT = None,
         mask: typing.Optional[int] = None,
         size: typing.Optional[int] = None,
+        frozen: bool = False,
+        _layout: typing.Optional[LayoutT] = None,
     ) -> typing.Type[BinField]:
         """Create new BinField subclass.
 
@@ -438,14 +1543,39 @@ class BinFieldMeta(BaseMeta):
         :type mask: int
         :param size: BinField bit length
         :type size: int
+        :param frozen: immutable and hashable class
+        :type frozen: bool
+        :param _layout: pre-resolved mapping and integer accessors, mapping validation is skipped.
+                        For internal usage only.
+        :type _layout: typing.Optional[typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, typing.Tuple]]]
         :returns: BinField subclass
         """
-        classdict: typing.Dict[str, typing.Any] = {"_size_": size, "_mask_": mask, "__slots__": ()}
+        classdict: typing.Dict[str, typing.Any] = {
+            "_size_": size,
+            "_mask_": mask,
+            "_frozen_": frozen,
+            "__slots__": (),
+        }
         if mapping is not None:
             classdict["_mapping_"] = mapping
+        if _layout is not None:
+            classdict["_layout_"] = _layout
         # noinspection PyTypeChecker
         return mcs.__new__(mcs, name, (BinField,), classdict)
 
+    @classmethod
+    def from_schema(mcs, schema: SchemaT) -> typing.Type[BinField]:  # noqa:N804
+        """Create BinField subclass from schema, produced by `BinField._schema_()`.
+
+        Classes are memorized: the same schema produces the same class.
+
+        :param schema: class schema: (name, size, mask, mapping records, frozen)
+        :type schema: typing.Tuple[str, typing.Optional[int], typing.Optional[int],
+                      typing.Optional[typing.Tuple[typing.Tuple[str, typing.Any], ...]], bool]
+        :returns: BinField subclass
+        """
+        return _make_cls_from_schema(tuple(schema))
+
 
 # noinspection PyRedeclaration
 BaseBinFieldMeta = type.__new__(BinFieldMeta, "BaseBinFieldMeta", (), {"__slots__": ()})  # type: ignore  # noqa: F811
@@ -455,20 +1585,28 @@ BaseBinFieldMeta = type.__new__(BinFieldMeta, "BaseBinFieldMeta", (), {"__slots_
 class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disable=function-redefined
     """BinField representation."""
 
-    __slots__ = ["__value", "__parent_link"]
+    __slots__ = ["__value"]
+    # Instance slot of mutable subclasses, class level None on not linkable classes: set by metaclass
+    __parent_link: typing.Optional[typing.Tuple[BinField, int]]  # pylint: disable=declare-non-slot
 
     # Will be replaced by the same by metaclass, but helps lint
-    _cache_: typing.Dict[typing.Tuple[int, str], BinField] = {}
+    _cache_: _ChildClassCache = _ChildClassCache(DEFAULT_CACHE_SIZE)
+    _lookup_: typing.Optional[_LookupTable] = None
+    _accessors_: typing.Dict[str, _MappingRecord] = {}
+    _int_accessors_: typing.Dict[str, IntAccessorT] = {}
 
     _size_: typing.Optional[int] = None
     _mask_: typing.Optional[int] = None
     _mapping_: AllowedMappingT = None
+    _frozen_: bool = False
+    _linked_: bool = False
 
     def __init__(
         self,
         x: typing.Union[int, str] = 0,  # type
         base: int = 10,
         _parent: typing.Optional[typing.Tuple[BinField, int]] = None,
+        **fields: int,
     ) -> None:
         """Create new BinField object from integer value.
 
@@ -478,11 +1616,30 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         :type base: int
         :param _parent: Parent link. For internal usage only.
         :type _parent: typing.Optional[typing.Tuple[BinField, int]]
+        :param fields: mapping records values, merged into start value at once
+        :type fields: int
+        :raises TypeError: record value type is not int
+        :raises IndexError: record not found or record bounds depend on value
+        :raises ValueError: negative record data or data bigger, than record
+
+        .. note:: Parent link is stored as root object and absolute offset: nested access does not depend on depth.
+        .. note:: Records, named ``x`` or ``base`` could not be set by keyword: use ``_update_()``.
         """
+        # pylint: disable=protected-access
         self.__value: int = x if isinstance(x, int) else int(x, base=base)
         if self._mask_:
             self.__value &= self._mask_
-        self.__parent_link = _parent
+        if fields:
+            mask, value = _merge_records(self.__class__, fields)
+            self.__value = self.__value & ~mask | value
+        if _parent is not None:
+            obj, offset = _parent
+            if obj.__parent_link is not None:  # Link directly to the root object
+                obj, root_offset = obj.__parent_link
+                _parent = obj, root_offset + offset
+        if self._linked_:
+            # Slot of mutable subclasses
+            self.__parent_link = _parent  # type: ignore[misc]
 
     @property
     def _bit_size_(self) -> int:
@@ -504,9 +1661,12 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
 
         :rtype: int
         """
-        if self.__parent_link is not None:  # Update value from parent
-            obj, offset = self.__parent_link
-            self.__value = (obj & (self._mask_ << offset)) >> offset  # type: ignore
+        # pylint: disable=protected-access
+        if self.__parent_link is not None:  # Update value from root
+            if _STATS is not None:
+                _count(self.__class__, "parent.read")
+            root, offset = self.__parent_link
+            self.__value = (root.__value >> offset) & self._mask_  # type: ignore
         return self.__value
 
     # noinspection PyProtectedMember
@@ -516,13 +1676,15 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
 
         :type new_value: int
         """
+        # pylint: disable=protected-access,unused-private-member
         if self._mask_:
             new_value &= self._mask_
 
-        if self.__parent_link is not None:
-            obj, offset = self.__parent_link
-
-            obj[:] = int(obj) & ~(self._mask_ << offset) | (new_value << offset)  # type: ignore
+        if self.__parent_link is not None:  # Write directly to the root: new value is limited by mask
+            if _STATS is not None:
+                _count(self.__class__, "parent.write")
+            root, offset = self.__parent_link
+            root.__value = root.__value & ~(self._mask_ << offset) | (new_value << offset)  # type: ignore
 
         self.__value = new_value
 
@@ -758,6 +1920,46 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         """
         return self.__class__(self._value_)
 
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickling: class reference and value. Not importable classes are restored from schema.
+
+        :raises ValueError: Pickle of linked instance
+        """
+        if self.__parent_link:
+            raise ValueError("Linked BinFields does not supports pickle")
+        return _reduce_value(self.__class__, self.__value)
+
+    def _freeze_(self) -> BinField:
+        """Get frozen copy: immutable and hashable object without parent link.
+
+        :rtype: BinField
+        """
+        frozen_cls = _FROZEN_CLASSES.get(self.__class__)
+        if frozen_cls is None:
+            name, size, mask, records, _ = self._schema_()
+            frozen_cls = _FROZEN_CLASSES[self.__class__] = BinFieldMeta.from_schema((name, size, mask, records, True))
+        return frozen_cls(self._value_)
+
+    @classmethod
+    def _schema_(cls) -> SchemaT:
+        """Compact class descriptor for class re-creation by `BinFieldMeta.from_schema`.
+
+        :return: class name, size, mask, mapping records (bit index, (start, stop) or nested records) and frozen flag
+        :rtype: typing.Tuple[str, typing.Optional[int], typing.Optional[int],
+                typing.Optional[typing.Tuple[typing.Tuple[str, typing.Any], ...]], bool]
+        """
+        schema = _SCHEMAS.get(cls)
+        if schema is None:
+            size, mask, mapping = cls._size_, cls._mask_, cls._mapping_
+            schema = _SCHEMAS[cls] = (
+                cls.__name__,
+                size if isinstance(size, int) else None,
+                mask if isinstance(mask, int) else None,
+                _mapping_to_schema(mapping) if isinstance(mapping, collections.abc.Mapping) else None,
+                cls._frozen_,
+            )
+        return schema
+
     def __getstate__(self) -> typing.Dict[str, int]:
         """Pickling.
 
@@ -793,11 +1995,317 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         :type mapping: typing.Optional[typing.Dict[str, typing.Union[slice, int, typing.Dict]]]
         """
         # Memorize
-        if (mask, name) not in cls._cache_:
-            new_cls = BinFieldMeta.makecls(name=name, mapping=mapping, mask=cls_mask, size=size)
-            cls._cache_[(mask, name)] = new_cls  # type: ignore
-        new_cls = cls._cache_[(mask, name)]  # type: ignore
-        return new_cls
+        new_cls = cls._cache_.get((mask, name))
+        if new_cls is not None:
+            if _STATS is not None:
+                _count(cls, "child_cls.hit", name)
+            return new_cls
+
+        if _STATS is not None:
+            _count(cls, "child_cls.miss", name)
+        return cls._cache_.get_or_create(
+            (mask, name),
+            lambda: BinFieldMeta.makecls(name=name, mapping=mapping, mask=cls_mask, size=size, frozen=cls._frozen_),
+        )
+
+    def _get_int_(self, key: str) -> int:
+        """Get mapping record value as integer without child BinField construction.
+
+        :param key: mapping key. Nested records are addressed by dotted path: "nested_block.single_bit"
+        :type key: str
+        :rtype: int
+        :raises IndexError: Mapping is not available or key not found
+        """
+        # pylint: disable=protected-access
+        accessor = self._int_accessors_.get(key)
+        if accessor is not None:
+            start, mask, _ = accessor
+            return (self._value_ & mask) >> start
+
+        # Bounds depend on value: use common way
+        obj = self
+        for part in key.split("."):
+            obj = obj[part]
+        return obj._value_
+
+    def _get_ints_(self, *keys: str) -> typing.Tuple[int, ...]:
+        """Get mapping records values as integers without child BinField construction.
+
+        :param keys: mapping keys. If not set: all top level mapping keys
+        :type keys: str
+        :rtype: typing.Tuple[int, ...]
+        :raises IndexError: Mapping is not available or key not found
+        """
+        if not keys:
+            if self._mapping_ is None:
+                raise IndexError("Mapping is not available")
+            keys = tuple(self._mapping_)
+
+        value = self._value_
+        result = []
+        for key in keys:
+            accessor = self._int_accessors_.get(key)
+            if accessor is None:
+                result.append(self._get_int_(key))
+            else:
+                start, mask, _ = accessor
+                result.append((value & mask) >> start)
+        return tuple(result)
+
+    def _diff_(self, other: typing.Union[int, BinField]) -> typing.Dict[str, typing.Tuple[int, int]]:
+        """Get changed mapping records without child BinField construction.
+
+        Values are compared by single XOR, changed bits are mapped to records.
+        Nested records are reported by dotted path: "nested_block.single_bit".
+
+        :param other: value to compare with: int or BinField object
+        :type other: typing.Union[int, BinField]
+        :return: changed leaf records: {key: (own value, other value)}
+        :rtype: typing.Dict[str, typing.Tuple[int, int]]
+        :raises IndexError: Mapping is not available
+        :raises TypeError: other is not integer
+        """
+        return _diff_values(self.__class__, self._value_, operator.index(other))
+
+    @classmethod
+    def _diff_many_(
+        cls,
+        values: typing.Iterable[typing.Union[int, BinField]],
+    ) -> typing.List[typing.Dict[str, typing.Tuple[int, int]]]:
+        """Get changed mapping records between consecutive values without BinField construction.
+
+        :param values: snapshots: integers or BinField objects
+        :type values: typing.Iterable[typing.Union[int, BinField]]
+        :return: changed leaf records for each pair of consecutive values: {key: (previous value, next value)}
+        :rtype: typing.List[typing.Dict[str, typing.Tuple[int, int]]]
+        :raises IndexError: Mapping is not available
+        :raises TypeError: value is not integer
+        """
+        data = list(map(operator.index, values))
+        return [_diff_values(cls, old, new) for old, new in zip(data, data[1:])]
+
+    @classmethod
+    def _match_(
+        cls,
+        _constraints: typing.Optional[typing.Mapping[str, int]] = None,
+        **fields: int,
+    ) -> FieldMatch:
+        """Compile mapping records constraints into single (mask, value) test on raw integer.
+
+        Usage: ``Frame._match_(FrameType=3, Security=1)(raw_int)`` or ``Frame._match_({"nested.record": 1})``.
+
+        :param _constraints: expected values by mapping key (nested records are addressed by dotted path)
+        :type _constraints: typing.Optional[typing.Mapping[str, int]]
+        :param fields: expected values by top level mapping key
+        :type fields: int
+        :rtype: FieldMatch
+        :raises TypeError: value type is not int
+        :raises IndexError: key not found or record bounds depend on value
+        :raises ValueError: negative data, data bigger, than record, masked bits or contradicting constraints
+        """
+        match_mask = match_value = 0
+        for key, value in itertools.chain(_constraints.items() if _constraints else (), fields.items()):
+            accessor = cls._int_accessors_.get(key)
+            if accessor is None:
+                raise IndexError(key)
+            start, mask, width = accessor
+
+            if not isinstance(value, int):
+                raise TypeError("BinField value could be set only as int")
+            if value < 0:
+                raise ValueError(f"Record {key} could not be negative!")
+            if value.bit_length() > width:
+                raise ValueError(f"Data size is bigger, than record {key} ({width} bits)")
+
+            value <<= start
+            if value & ~mask:
+                raise ValueError(f"Record {key} value has bits, excluded by mask: {value & ~mask:b}")
+            if (match_value ^ value) & match_mask & mask:
+                raise ValueError(f"Record {key} value contradicts other constraints")
+            match_mask |= mask
+            match_value |= value
+        return FieldMatch(cls, match_mask, match_value)
+
+    @classmethod
+    def _decode_many_(
+        cls,
+        values: typing.Iterable[int],
+        *keys: str,
+        use_numpy: typing.Optional[bool] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """Decode many integers into per-record columns without BinField construction.
+
+        :param values: source integers (sequence, array.array, numpy array or iterable)
+        :type values: typing.Iterable[int]
+        :param keys: mapping keys. If not set: all top level mapping keys
+        :type keys: str
+        :param use_numpy: produce numpy arrays. None: if numpy is available and data fits in uint64
+        :type use_numpy: typing.Optional[bool]
+        :return: columns by key: array.array("Q") (list, if record is bigger, than 64 bits) or numpy.ndarray
+        :rtype: typing.Dict[str, typing.Any]
+        :raises IndexError: Mapping is not available or key not found
+        :raises ImportError: numpy usage requested, but numpy is not available
+        :raises OverflowError: numpy usage requested, but data is bigger, than 64 bits
+        """
+        if not keys:
+            if not isinstance(cls._mapping_, collections.abc.Mapping):
+                raise IndexError("Mapping is not available")
+            keys = tuple(cls._mapping_)
+
+        wide = (isinstance(cls._size_, int) and cls._size_ > 64) or any(
+            accessor[1].bit_length() > 64 for accessor in map(cls._int_accessors_.get, keys) if accessor is not None
+        )
+
+        numpy: typing.Any = None if use_numpy is False else _get_numpy()
+        if use_numpy and numpy is None:
+            raise ImportError("numpy is not available")
+        if use_numpy and wide:
+            raise OverflowError(f"{cls.__name__} data is bigger, than 64 bits: numpy columns are not supported")
+        if use_numpy is None:
+            use_numpy = (
+                numpy is not None
+                and not wide
+                and (isinstance(values, numpy.ndarray) or (isinstance(cls._size_, int) and cls._size_ <= 64))
+            )
+
+        if use_numpy:
+            data = numpy.asarray(values, dtype=numpy.uint64)
+            if cls._mask_ is not None and int(cls._mask_).bit_length() <= 64:
+                data = data & numpy.uint64(cls._mask_)
+        elif hasattr(values, "tolist") and not isinstance(values, array.array):  # numpy array: python integers
+            data = values.tolist()
+        elif not isinstance(values, (typing.Sequence, array.array)):
+            data = list(values)
+        else:
+            data = values
+
+        result: typing.Dict[str, typing.Any] = {}
+        for key in keys:
+            accessor = cls._int_accessors_.get(key)
+            if accessor is None:  # Bounds depend on value
+                column: typing.Any = [cls(int(value))._get_int_(key) for value in data]
+                result[key] = numpy.array(column, dtype=numpy.uint64) if use_numpy else column
+                continue
+
+            start, mask, _ = accessor
+            if use_numpy:
+                result[key] = (data & numpy.uint64(mask)) >> numpy.uint64(start)
+                continue
+
+            column = [(value & mask) >> start for value in data]
+            result[key] = array.array("Q", column) if (mask >> start).bit_length() <= 64 else column
+        return result
+
+    @classmethod
+    def _encode_many_(
+        cls,
+        columns: typing.Mapping[str, typing.Iterable[int]],
+        byteorder: typing.Optional[str] = None,
+    ) -> typing.Union[typing.List[int], bytes]:
+        """Encode per-record columns into packed integers without BinField construction.
+
+        :param columns: columns by mapping key (nested records are addressed by dotted path). Missing records are 0.
+        :type columns: typing.Mapping[str, typing.Iterable[int]]
+        :param byteorder: if set: pack values into buffer, record size is used as item length ("big" or "little")
+        :type byteorder: typing.Optional[str]
+        :return: packed integers or packed buffer
+        :rtype: typing.Union[typing.List[int], bytes]
+        :raises TypeError: value type is not int
+        :raises IndexError: key not found or record bounds depend on value
+        :raises ValueError: columns length mismatch, records intersection, negative data or data bigger, than record
+        """
+        size: typing.Optional[int] = None
+        used_mask = 0
+        packed: typing.List[int] = []
+
+        for key, column in columns.items():
+            accessor = cls._int_accessors_.get(key)
+            if accessor is None:
+                raise IndexError(key)
+            start, mask, width = accessor
+
+            if used_mask & mask:
+                raise ValueError(f"Record {key} has intersection with other records by mask {used_mask & mask:b}")
+            used_mask |= mask
+
+            try:
+                data = list(map(operator.index, column))
+            except TypeError:
+                raise TypeError("BinField value could be set only as int") from None
+
+            if size is None:
+                size = len(data)
+                packed = [0] * size
+            elif len(data) != size:
+                raise ValueError(f"Column {key} length {len(data)} differs from {size}")
+
+            if data:
+                if min(data) < 0:
+                    raise ValueError(f"Column {key} contains negative data")
+                if max(data).bit_length() > width:
+                    raise ValueError(f"Data size is bigger, than record {key} ({width} bits)")
+
+            packed = [value | (item << start) & mask for value, item in zip(packed, data)]
+
+        if byteorder is None:
+            return packed
+
+        length = _get_byte_size(cls)
+        return b"".join([value.to_bytes(length, byteorder) for value in packed])  # type: ignore
+
+    @classmethod
+    def _from_bytes_(
+        cls,
+        buf: typing.Union[bytes, bytearray, memoryview, typing.Any],
+        byteorder: str = "big",
+        offset: int = 0,
+    ) -> BinField:
+        """Create new BinField object from buffer without slicing copy.
+
+        :param buf: source buffer: bytes, bytearray, memoryview, mmap or other object with buffer protocol support
+        :type buf: typing.Union[bytes, bytearray, memoryview, mmap.mmap]
+        :param byteorder: byte order: "big" or "little"
+        :type byteorder: str
+        :param offset: start position in buffer
+        :type offset: int
+        :return: new object. Amount of bytes is defined by class size, if not defined: all buffer after offset is used
+        :rtype: BinField
+        :raises ValueError: not enough data in buffer (no data at offset for unsized class), negative offset
+                            or unexpected byteorder
+        """
+        if offset < 0:
+            raise ValueError("Offset could not be negative!")
+
+        if not isinstance(cls._size_, int):  # Unsized: use buffer tail
+            with memoryview(buf) as view:
+                data = view.cast("B")[offset:]
+                if not data:
+                    raise ValueError(f"Not enough data in buffer for {cls.__name__} (no data at {offset})")
+                return cls(int.from_bytes(data, byteorder))  # type: ignore
+
+        length = _get_byte_size(cls)
+        unpacker = _get_struct(length, byteorder)
+        if unpacker is not None:
+            try:
+                return cls(unpacker.unpack_from(buf, offset)[0])
+            except struct.error:
+                raise ValueError(f"Not enough data in buffer for {cls.__name__} ({length} bytes at {offset})") from None
+
+        with memoryview(buf) as view:
+            data = view.cast("B")[offset : offset + length]
+            if len(data) != length:
+                raise ValueError(f"Not enough data in buffer for {cls.__name__} ({length} bytes at {offset})")
+            return cls(int.from_bytes(data, byteorder))  # type: ignore
+
+    def _to_bytes_(self, byteorder: str = "big") -> bytes:
+        """Convert to bytes. Data length is used as amount of bytes.
+
+        :param byteorder: byte order: "big" or "little"
+        :type byteorder: str
+        :rtype: bytes
+        :raises ValueError: unexpected byteorder
+        """
+        return self._value_.to_bytes(len(self), byteorder)  # type: ignore
 
     # Access as dict
     def _getslice_(
@@ -834,7 +2342,9 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
 
         # Memorize
         cls = self._get_child_cls_(mask=mask, name=name, cls_mask=cls_mask, size=stop - start, mapping=mapping)
-        return cls((self._value_ & mask) >> start, _parent=(self, start))  # type: ignore
+        if _STATS is not None:
+            _count(self.__class__, "child.alloc", name)
+        return cls((self._value_ & mask) >> start, _parent=(self, start))
 
     def __getitem__(self, item: KeyT) -> BinField:
         """Extract bits.
@@ -843,6 +2353,12 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         :rtype: BinField
         :raises IndexError: Mapping is not available
         """
+        if isinstance(item, str):
+            accessor = self._accessors_.get(item)
+            if accessor is not None:
+                record: BinField = accessor.__get__(self)
+                return record
+
         if isinstance(item, int):
             name = f"{self.__class__.__name__}_index_{item}"
             return self._getslice_(slice(item, item + 1), name=name)
@@ -866,14 +2382,11 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         if isinstance(idx, slice):
             return self._getslice_(idx, name=item)
 
-        if isinstance(idx, dict):  # Nested _mapping_
-            # Extract slice
-            slc = slice(*idx["_index_"])
-            # Build new _mapping_ dict
-            mapping: ResolvedMappingT = copy.deepcopy(idx)
-            del mapping["_index_"]
-            # Get new val
-            return self._getslice_(slc, mapping=mapping, name=item)  # type: ignore
+        if isinstance(idx, collections.abc.Mapping):  # Nested _mapping_
+            if _STATS is not None:
+                _count(self.__class__, "mapping.copy", item)
+            # Extract slice and get new val
+            return self._getslice_(slice(*idx["_index_"]), mapping=_get_nested_mapping(idx), name=item)
 
         raise IndexError(item)
 
@@ -913,6 +2426,15 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
 
         self._value_ = self._value_ & ~get_mask | value
 
+    def __counted_setslice(self, key: slice, value: int) -> None:
+        """Set value by slice: instrumented variant, installed as `_setslice_` if instrumentation is enabled.
+
+        :type key: slice
+        :type value: int
+        """
+        _count(self.__class__, "setslice", f"{key.start}:{key.stop}")
+        _INSTRUMENTED["_setslice_"][0](self, key, value)
+
     def __setitem__(self, key: KeyT, value: int) -> None:
         """Indexed setter.
 
@@ -943,12 +2465,51 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         if isinstance(idx, (int, slice)):
             return self.__setitem__(idx, value)
 
-        if isinstance(idx, dict) and _is_valid_slice_mapping(idx["_index_"]):  # Nested _mapping_
+        if isinstance(idx, collections.abc.Mapping) and _is_valid_slice_mapping(idx["_index_"]):  # Nested _mapping_
             # Extract slice from nested
             return self._setslice_(slice(*idx["_index_"]), value)
 
         raise IndexError(key)
 
+    def _update_(self, _records: typing.Optional[typing.Mapping[str, int]] = None, **fields: int) -> None:
+        """Update mapping records: ``obj._update_(record=1, other=2)`` or ``obj._update_({"nested.record": 1})``.
+
+        Mapping records (nested records are addressed by dotted path) are validated first
+        and merged into value by single write (single write to the parent object for linked objects).
+        If any record bounds depend on value, records are set one by one on detached copy, then copy value is written.
+
+        :param _records: values by mapping key (nested records are addressed by dotted path)
+        :type _records: typing.Optional[typing.Mapping[str, int]]
+        :param fields: values by top level mapping key
+        :type fields: int
+        :raises TypeError: value type is not int
+        :raises IndexError: key not found
+        :raises ValueError: negative data or data bigger, than record
+        """
+        # pylint: disable=protected-access
+        if _records:
+            fields = {**_records, **fields}
+
+        accessors = self._int_accessors_
+        if not all(key in accessors for key in fields):  # Bounds depend on value: use common way
+            # Records are validated and set on detached copy: nothing is written on failure
+            obj = self.__class__(self._value_)
+            for key, value in fields.items():
+                if not isinstance(value, int):
+                    raise TypeError("BinField value could be set only as int")
+                if value < 0:
+                    raise ValueError("BinField could not be negative!")
+                *path, name = key.split(".")
+                target = obj
+                for part in path:  # Nested record is linked to the copy
+                    target = target[part]
+                target[name] = value
+            self._value_ = obj._value_
+            return
+
+        mask, value = _merge_records(self.__class__, fields)
+        self._value_ = self._value_ & ~mask | value
+
     # Representations
     def __pretty_str__(self, parser: typing.Any, indent: int, no_indent_start: bool) -> str:
         """Real __str__ code."""
@@ -987,6 +2548,190 @@ class BinField(BaseBinFieldMeta):  # type: ignore  # noqa: F811  # pylint: disab
         return ["_bit_size_", "_mapping_", "_mask_", "_value_", "_size_"] + keys
 
 
+# Hot path methods with instrumentation: name -> (plain, instrumented). Instrumented variants are installed by
+# `_set_stats`: disabled instrumentation costs nothing on these paths.
+# Value property is not replaced (class layout is read-only): it counts only on the linked objects branch.
+_INSTRUMENTED: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {
+    "_setslice_": (BinField.__dict__["_setslice_"], BinField.__dict__["_BinField__counted_setslice"]),
+}
+
+
+class _FrozenBinField(BinField):
+    """Frozen BinField behaviour: immutable, hashable, without parent link.
+
+    Base class of classes with `_frozen_ = True`.
+    """
+
+    __slots__ = ("__hash",)
+    _frozen_base_ = True
+
+    def __init__(
+        self,
+        x: typing.Union[int, str] = 0,
+        base: int = 10,
+        _parent: typing.Optional[typing.Tuple[BinField, int]] = None,
+        **fields: int,
+    ) -> None:
+        """Create new frozen BinField object from integer value. Parent link is dropped."""
+        super().__init__(x, base, None, **fields)
+        self.__hash: typing.Optional[int] = None
+
+    @property
+    def _value_(self) -> int:
+        """Internal value (integer).
+
+        :rtype: int
+        """
+        return super()._value_
+
+    @_value_.setter
+    def _value_(self, new_value: int) -> None:
+        """Frozen BinField could not be modified.
+
+        :raises TypeError: frozen object
+        """
+        raise TypeError(f"Frozen {self.__class__.__name__} could not be modified")
+
+    def __setitem__(self, key: KeyT, value: int) -> None:
+        """Frozen BinField could not be modified.
+
+        :raises TypeError: frozen object
+        """
+        raise TypeError(f"Frozen {self.__class__.__name__} could not be modified")
+
+    def _setslice_(self, key: slice, value: int) -> None:
+        """Frozen BinField could not be modified.
+
+        :raises TypeError: frozen object
+        """
+        raise TypeError(f"Frozen {self.__class__.__name__} could not be modified")
+
+    def __hash__(self) -> int:
+        """Cached hash.
+
+        :rtype: int
+        """
+        if self.__hash is None:
+            self.__hash = hash((self.__class__, self._value_))
+        return self.__hash
+
+    # In-place operations produce new objects (like int)
+    def __iand__(self, other: typing.Any) -> BinField:
+        """Mimic int."""
+        return self & other  # type: ignore
+
+    def __ior__(self, other: typing.Any) -> BinField:
+        """Mimic int."""
+        return self | other  # type: ignore
+
+    def __ixor__(self, other: typing.Any) -> BinField:
+        """Mimic int."""
+        return self ^ other  # type: ignore
+
+    def __iadd__(self, other: typing.Any) -> typing.Union[int, BinField]:
+        """Mimic int."""
+        return self + other  # type: ignore
+
+    def __isub__(self, other: typing.Any) -> typing.Union[int, BinField]:
+        """Mimic int."""
+        return self - other  # type: ignore
+
+    def __copy__(self) -> BinField:
+        """Immutable: copy is not required.
+
+        :rtype: BinField
+        """
+        return self
+
+    def _freeze_(self) -> BinField:
+        """Already frozen.
+
+        :rtype: BinField
+        """
+        return self
+
+    def __pretty_repr__(self, _: typing.Any, indent: int, no_indent_start: bool) -> str:
+        """Real __repr__ code."""
+        indent = 0 if no_indent_start else indent
+        return f"{'':<{indent}}{self.__class__.__name__}(x=0x{self._value_:0{len(self) * 2}X}, base=16)"
+
+
+def _compile_format_plan(
+    cls: typing.Type[BinField],
+    max_indent: int,
+    indent_step: int,
+    indent: int,
+    no_indent_start: bool,
+) -> typing.Optional[FormatPlanT]:
+    """Compile str() layout of class: only values are substituted on format.
+
+    :param cls: BinField class
+    :type cls: typing.Type[BinField]
+    :param max_indent: maximal indent before classic repr() call
+    :type max_indent: int
+    :param indent_step: step for the next indentation level
+    :type indent_step: int
+    :param indent: start indentation
+    :type indent: int
+    :param no_indent_start: do not indent open bracket and simple parameters
+    :type no_indent_start: bool
+    :return: template and records extractors. None if layout depends on value (size is not defined).
+    :rtype: typing.Optional[typing.Tuple[str, typing.Tuple[typing.Tuple[int, int], ...]]]
+    """
+    extractors: typing.List[typing.Tuple[int, int]] = []
+
+    def compile_node(
+        node_cls: typing.Type[BinField],
+        shift: int,
+        node_indent: int,
+        node_no_indent_start: bool,
+    ) -> typing.Optional[str]:
+        # pylint: disable=protected-access
+        size = node_cls._size_
+        if not isinstance(size, int) or not size:  # Base class or size is not defined
+            return None
+
+        pos = len(extractors)
+        # Root value is used as is, records values are extracted by shift and mask.
+        extractors.append((shift, node_cls._mask_ if pos and node_cls._mask_ is not None else -1))
+
+        mask = "" if node_cls._mask_ is None else f" & 0b{node_cls._mask_:b}"
+        head = f"<{{{pos}}} == 0x{{{pos}:0{(size + 7) // 8 * 2}X}} == (0b{{{pos}:0{size}b}}{mask})"
+
+        mapping = node_cls._mapping_
+        if not mapping or node_indent >= max_indent:
+            return f"{'':<{0 if node_no_indent_start else node_indent}}{head}>"
+
+        max_len = max(len(str(key)) for key in mapping)
+        items = []
+        for key in mapping:
+            accessor = node_cls._accessors_.get(key)
+            if accessor is None or accessor.start is None:  # Value dependent record
+                return None
+            child = compile_node(accessor.child_cls, shift + accessor.start, node_indent + 2 * indent_step, True)
+            if child is None:
+                return None
+            name = f"{key!s:{max_len}}".replace("{", "{{").replace("}", "}}")
+            items.append(f"\n{'':<{node_indent + indent_step}}{name} = {child}")
+
+        newline = "\n" if node_no_indent_start else ""
+        return f"{newline}{'':<{node_indent}}{head}{''.join(items)}\n{'':<{node_indent}}>"
+
+    template = compile_node(cls, 0, indent, no_indent_start)
+    if template is None:
+        return None
+    return template, tuple(extractors)
+
+
+# Leaf records accessors per class for diff
+_DIFF_PLANS: weakref.WeakKeyDictionary[typing.Type[BinField], DiffPlanT] = weakref.WeakKeyDictionary()
+
+# Compiled str() layouts per class and formatter parameters
+_FORMAT_PLANS: weakref.WeakKeyDictionary[
+    typing.Type[BinField], typing.Dict[typing.Tuple[int, int, int, bool], typing.Optional[FormatPlanT]]
+] = weakref.WeakKeyDictionary()
+
+
 class _Formatter:
     def __init__(self, max_indent: int = 20, indent_step: int = 4) -> None:
         """Dedicated str formatter for BinField.
@@ -1026,6 +2771,26 @@ class _Formatter:
         """
         return self.__max_indent
 
+    def __get_plan(
+        self,
+        cls: typing.Type[BinField],
+        indent: int,
+        no_indent_start: bool,
+    ) -> typing.Optional[FormatPlanT]:
+        """Get compiled layout of class.
+
+        :rtype: typing.Optional[typing.Tuple[str, typing.Tuple[typing.Tuple[int, int], ...]]]
+        """
+        plans = _FORMAT_PLANS.get(cls)
+        if plans is None:
+            plans = _FORMAT_PLANS.setdefault(cls, {})
+        key = (self.max_indent, self.indent_step, indent, no_indent_start)
+        try:
+            return plans[key]
+        except KeyError:
+            plan = plans[key] = _compile_format_plan(cls, *key)
+            return plan
+
     def _str_bf_items(self, src: typing.Dict[str, BinField], indent: int = 0) -> typing.Iterator[str]:
         """Wrapper for repr dict items.
 
@@ -1055,6 +2820,12 @@ class _Formatter:
         :rtype: str
         """
         # pylint: disable=protected-access
+        plan = self.__get_plan(src.__class__, indent, no_indent_start)
+        if plan is not None:
+            template, extractors = plan
+            root = src._value_
+            return template.format(*[root >> shift & mask for shift, mask in extractors])
+
         if src._mask_ is None:
             mask = ""
         else:
@@ -1087,5 +2858,7 @@ class _Formatter:
         :type no_indent_start: bool
         :return: formatted string
         """
+        if _STATS is not None:
+            _count(src.__class__, "format")
         result = self.process_element(src, indent=indent, no_indent_start=no_indent_start)
         return result
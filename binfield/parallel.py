@@ -0,0 +1,171 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Parallel decode of fixed size records from files.
+
+File is split on records boundaries, ranges are decoded in worker processes over shared `mmap`.
+Workers return per-record columns: BinField objects are not pickled.
+Not importable classes (generated) are passed to workers as schema.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import mmap
+import os
+import typing
+
+from .binfield import _BYTEORDER_CODES
+from .binfield import BinField
+from .binfield import _get_byte_size
+from .binfield import _get_class_ref
+from .binfield import _resolve_class_ref
+from .stream import _unpack_block
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import array
+    import concurrent.futures  # Import is expensive: imported on usage
+
+__all__ = ("decode_parallel",)
+
+DEFAULT_TASK_RECORDS = 1 << 20  # Records per worker task
+
+ColumnT = typing.Union["array.array[int]", typing.List[int]]
+
+
+def _decode_range(
+    path: str,
+    class_ref: typing.Any,
+    offset: int,
+    count: int,
+    byteorder: str,
+    keys: typing.Tuple[str, ...],
+) -> typing.Dict[str, ColumnT]:
+    """Worker task: decode records range from file to columns.
+
+    :param path: file path
+    :param class_ref: class or class schema
+    :param offset: range start in bytes
+    :param count: amount of records
+    :param byteorder: "big" or "little"
+    :param keys: mapping keys
+    :return: columns by key
+    """
+    # pylint: disable=protected-access
+    cls = _resolve_class_ref(class_ref)
+    size = _get_byte_size(cls)
+    with open(path, "rb") as src, mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        with memoryview(data)[offset : offset + count * size] as view:  # View should be released before mmap close
+            values = _unpack_block(view, size, byteorder)
+    columns: typing.Dict[str, ColumnT] = cls._decode_many_(values, *keys, use_numpy=False)
+    return columns
+
+
+def _check_key(cls: typing.Type[BinField], key: str) -> None:
+    """Check, that mapping key exists. Nested records are resolved by whole dotted path.
+
+    :raises IndexError: key not found
+    """
+    # pylint: disable=protected-access
+    if key in cls._int_accessors_:
+        return
+    records: typing.Any = cls._mapping_
+    for part in key.split("."):
+        if not isinstance(records, collections.abc.Mapping) or part == "_index_" or part not in records:
+            raise IndexError(key)
+        records = records[part]
+
+
+def _merge_columns(results: typing.Iterable[typing.Dict[str, ColumnT]]) -> typing.Dict[str, ColumnT]:
+    """Concatenate columns of ranges in order. Column type depends only on key: types are consistent."""
+    merged: typing.Dict[str, ColumnT] = {}
+    for result in results:
+        if not merged:
+            merged = result
+            continue
+        for key, column in result.items():
+            merged[key].extend(column)
+    return merged
+
+
+def decode_parallel(
+    path: typing.Union[str, "os.PathLike[str]"],
+    cls: typing.Type[BinField],
+    *keys: str,
+    byteorder: str = "big",
+    workers: typing.Optional[int] = None,
+    task_records: int = DEFAULT_TASK_RECORDS,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+) -> typing.Dict[str, ColumnT]:
+    """Decode fixed size records from file into per-record columns in parallel.
+
+    :param path: file path
+    :type path: typing.Union[str, os.PathLike]
+    :param cls: BinField subclass with defined size
+    :type cls: typing.Type[BinField]
+    :param keys: mapping keys (nested records are addressed by dotted path). If not set: all top level mapping keys
+    :type keys: str
+    :param byteorder: records byte order: "big" or "little"
+    :type byteorder: str
+    :param workers: amount of worker processes. Default: CPU count. 1: decode in current process
+    :type workers: typing.Optional[int]
+    :param task_records: amount of records, decoded by worker task
+    :type task_records: int
+    :param executor: executor for tasks instead of new process pool (``workers`` is ignored)
+    :type executor: typing.Optional[concurrent.futures.Executor]
+    :return: columns by key in file order: ``array.array("Q")`` (list, if record is bigger, than 64 bits)
+    :rtype: typing.Dict[str, typing.Union[array.array, typing.List[int]]]
+    :raises ValueError: class size is not defined, unexpected byteorder, not positive task size
+                        or trailing data is not a whole record
+    :raises IndexError: Mapping is not available or key not found
+    """
+    # pylint: disable=protected-access
+    size = _get_byte_size(cls)
+    if byteorder not in _BYTEORDER_CODES:
+        raise ValueError("byteorder must be either 'little' or 'big'")
+    if task_records <= 0:
+        raise ValueError("Task size must be positive value !")
+
+    if not keys:
+        if cls._mapping_ is None:
+            raise IndexError("Mapping is not available")
+        keys = tuple(cls._mapping_)
+    for key in keys:  # Fail early: not in worker
+        _check_key(cls, key)
+
+    path = os.fspath(path)
+    length = os.path.getsize(path)
+    if length % size:
+        raise ValueError(f"Trailing data is shorter, than record: {length % size} bytes of {size}")
+
+    total = length // size
+    if not total:
+        columns: typing.Dict[str, ColumnT] = cls._decode_many_((), *keys, use_numpy=False)
+        return columns
+
+    class_ref = _get_class_ref(cls)
+    tasks = [
+        (path, class_ref, start * size, min(task_records, total - start), byteorder, keys)
+        for start in range(0, total, task_records)
+    ]
+
+    if executor is None and (workers == 1 or len(tasks) == 1):
+        return _merge_columns(_decode_range(*task) for task in tasks)
+
+    if executor is not None:
+        return _merge_columns(executor.map(_decode_range, *zip(*tasks)))
+
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        return _merge_columns(pool.map(_decode_range, *zip(*tasks)))
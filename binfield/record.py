@@ -0,0 +1,328 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Composite records: several sized BinField members laid out back to back.
+
+Members are stored as separate integers: combined integer is never built.
+"""
+
+from __future__ import annotations
+
+import operator
+import struct
+import typing
+
+from .binfield import _BYTEORDER_CODES
+from .binfield import _STRUCT_CODES
+from .binfield import BinField
+from .binfield import _get_byte_size
+from .binfield import _is_descriptor
+from .binfield import _is_dunder
+from .binfield import _is_sunder
+
+__all__ = ("Record",)
+
+# member name -> (member class, offset in bytes, length in bytes)
+MembersT = typing.Dict[str, typing.Tuple[typing.Type[BinField], int, int]]
+
+
+class _Member:
+    """Member descriptor.
+
+    Class level: member class. Instance level: member as BinField object.
+    """
+
+    __slots__ = ("index", "cls")
+
+    def __init__(self, index: int, cls: typing.Type[BinField]) -> None:
+        """Member descriptor.
+
+        :param index: member position
+        :type index: int
+        :param cls: member class
+        :type cls: typing.Type[BinField]
+        """
+        self.index = index
+        self.cls = cls
+
+    def __get__(self, instance: typing.Optional[Record], owner: typing.Any = None) -> typing.Any:
+        """Get member class (class level) or member object (instance level)."""
+        if instance is None:
+            return self.cls
+        return instance._get_member_(self.index)
+
+    def __set__(self, instance: Record, value: typing.Union[int, BinField]) -> None:
+        """Set member value."""
+        instance._set_member_(self.index, value)
+
+
+class RecordMeta(type):
+    """Metaclass for Record subclasses: collect members and precompile decoding."""
+
+    def __new__(
+        mcs,  # noqa:N804
+        name: str,
+        bases: typing.Tuple[typing.Type[typing.Any], ...],
+        classdict: typing.Dict[str, typing.Any],
+    ) -> RecordMeta:
+        """Collect BinField subclasses from class body as members.
+
+        :raises TypeError: subclassing of record, no members or unexpected data in class body
+        :raises ValueError: member size is not defined
+        """
+        if not any(isinstance(base, RecordMeta) for base in bases):  # Record itself
+            return super().__new__(mcs, name, bases, classdict)
+
+        for base in bases:
+            if base is not Record and issubclass(base, Record):
+                raise TypeError("Cannot extend Record")
+
+        members: MembersT = {}
+        offset = 0
+        for m_name, m_val in list(classdict.items()):
+            if not (isinstance(m_val, type) and issubclass(m_val, BinField)):
+                continue
+            length = _get_byte_size(m_val)
+            members[m_name] = m_val, offset, length
+            classdict[m_name] = _Member(len(members) - 1, m_val)
+            offset += length
+
+        if not members:
+            raise TypeError(f"Record {name} has no BinField members")
+
+        garbage = {
+            m_name: obj
+            for m_name, obj in classdict.items()
+            if not (_is_dunder(m_name) or _is_sunder(m_name) or _is_descriptor(obj))
+        }
+        if garbage:
+            raise TypeError(f"Several data is not recognized in class structure: {garbage!r}")
+
+        # Whole record is processed by single struct call, not native sizes are processed as bytes
+        codes = "".join(_STRUCT_CODES.get(length, f"{length}s") for _, _, length in members.values())
+        classdict["_structs_"] = {
+            byteorder: struct.Struct(f"{code}{codes}") for byteorder, code in _BYTEORDER_CODES.items()
+        }
+        classdict["_raw_"] = tuple(  # (position, length) of members, processed as bytes
+            (idx, length) for idx, (_, _, length) in enumerate(members.values()) if length not in _STRUCT_CODES
+        )
+        classdict["_masks_"] = tuple(  # (position, mask) of members, where not all bits are used
+            (idx, cls._mask_)
+            for idx, (cls, _, length) in enumerate(members.values())
+            if cls._mask_ is not None and cls._mask_ != (1 << length * 8) - 1
+        )
+        classdict["_members_"] = members
+        classdict["_classes_"] = tuple(cls for cls, _, _ in members.values())
+        classdict["_positions_"] = {m_name: idx for idx, m_name in enumerate(members)}
+        classdict["_size_"] = offset * 8
+        classdict["__slots__"] = ()
+        return super().__new__(mcs, name, bases, classdict)
+
+
+class Record(metaclass=RecordMeta):
+    """Composite record: sized BinField subclasses in class body are members, laid out back to back.
+
+    Each member occupies whole bytes. Member objects are created on first access,
+    assignment to member replaces member object.
+    """
+
+    __slots__ = ("__values", "__objects")
+
+    # Will be replaced by metaclass, but helps lint
+    _members_: MembersT = {}
+    _classes_: typing.Tuple[typing.Type[BinField], ...] = ()
+    _positions_: typing.Dict[str, int] = {}
+    _structs_: typing.Dict[str, struct.Struct] = {}
+    _raw_: typing.Tuple[typing.Tuple[int, int], ...] = ()
+    _masks_: typing.Tuple[typing.Tuple[int, int], ...] = ()
+    _size_: int = 0
+
+    def __init__(self, *args: typing.Union[int, BinField], **kwargs: typing.Union[int, BinField]) -> None:
+        """Create record from members values. Not set members are 0.
+
+        :param args: members values in declaration order
+        :type args: typing.Union[int, BinField]
+        :param kwargs: members values by name
+        :type kwargs: typing.Union[int, BinField]
+        :raises TypeError: unexpected members or value is not integer
+        """
+        amount = len(self._classes_)
+        if len(args) > amount:
+            raise TypeError(f"{self.__class__.__name__} takes {amount} members, but {len(args)} were given")
+
+        self.__setup([0] * amount)
+
+        for idx, value in enumerate(args):
+            self._set_member_(idx, value)
+        for m_name, value in kwargs.items():
+            position = self._positions_.get(m_name)
+            if position is None:
+                raise TypeError(f"{self.__class__.__name__} has no member {m_name!r}")
+            self._set_member_(position, value)
+
+    @classmethod
+    def _from_values_(cls, values: typing.List[int]) -> Record:
+        """Create record from members integers without validation.
+
+        :param values: members values in declaration order, already masked
+        :type values: typing.List[int]
+        :rtype: Record
+        """
+        obj = cls.__new__(cls)
+        obj.__setup(values)
+        return obj
+
+    def __setup(self, values: typing.List[int]) -> None:
+        """Set members values, member objects are not created."""
+        self.__values = values
+        self.__objects: typing.List[typing.Optional[BinField]] = [None] * len(values)
+
+    @classmethod
+    def _from_bytes_(
+        cls,
+        buf: typing.Union[bytes, bytearray, memoryview, typing.Any],
+        byteorder: str = "big",
+        offset: int = 0,
+    ) -> Record:
+        """Decode record from buffer by single pass without slicing copy.
+
+        :param buf: source buffer: bytes, bytearray, memoryview, mmap or other object with buffer protocol support
+        :type buf: typing.Union[bytes, bytearray, memoryview, mmap.mmap]
+        :param byteorder: members byte order: "big" or "little"
+        :type byteorder: str
+        :param offset: start position in buffer
+        :type offset: int
+        :rtype: Record
+        :raises ValueError: not enough data in buffer, negative offset or unexpected byteorder
+        """
+        if offset < 0:
+            raise ValueError("Offset could not be negative!")
+        unpacker = cls._structs_.get(byteorder)
+        if unpacker is None:
+            raise ValueError("byteorder must be either 'little' or 'big'")
+
+        try:
+            values = list(unpacker.unpack_from(buf, offset))
+        except struct.error:
+            raise ValueError(
+                f"Not enough data in buffer for {cls.__name__} ({unpacker.size} bytes at {offset})"
+            ) from None
+
+        for idx, _ in cls._raw_:
+            values[idx] = int.from_bytes(values[idx], byteorder)  # type: ignore
+        for idx, mask in cls._masks_:
+            values[idx] &= mask
+        return cls._from_values_(values)
+
+    def _to_bytes_(self, byteorder: str = "big") -> bytes:
+        """Convert to bytes.
+
+        :param byteorder: members byte order: "big" or "little"
+        :type byteorder: str
+        :rtype: bytes
+        :raises ValueError: unexpected byteorder
+        """
+        packer = self._structs_.get(byteorder)
+        if packer is None:
+            raise ValueError("byteorder must be either 'little' or 'big'")
+
+        values: typing.List[typing.Any] = self._get_values_()
+        for idx, length in self._raw_:
+            values[idx] = values[idx].to_bytes(length, byteorder)
+        return packer.pack(*values)
+
+    def _get_values_(self) -> typing.List[int]:
+        """Get members values as integers in declaration order.
+
+        :rtype: typing.List[int]
+        """
+        # pylint: disable=protected-access
+        return [value if obj is None else obj._value_ for value, obj in zip(self.__values, self.__objects)]
+
+    def _get_member_(self, index: int) -> BinField:
+        """Get member object by position. Object is created on first access.
+
+        :type index: int
+        :rtype: BinField
+        """
+        obj = self.__objects[index]
+        if obj is None:
+            obj = self.__objects[index] = self._classes_[index](self.__values[index])
+        return obj
+
+    def _set_member_(self, index: int, value: typing.Union[int, BinField]) -> None:
+        """Set member value by position. Existing member object is detached.
+
+        :type index: int
+        :type value: typing.Union[int, BinField]
+        :raises TypeError: value is not integer
+        """
+        # pylint: disable=protected-access
+        mask = self._classes_[index]._mask_
+        value = operator.index(value)
+        self.__values[index] = value & mask if mask is not None else value
+        self.__objects[index] = None
+
+    def _get_int_(self, key: str) -> int:
+        """Get member or member mapping record value as integer without BinField construction.
+
+        :param key: member name, member records are addressed by dotted path: "member.record"
+        :type key: str
+        :rtype: int
+        :raises IndexError: member or record not found
+        """
+        # pylint: disable=protected-access
+        m_name, _, rest = key.partition(".")
+        index = self._positions_.get(m_name)
+        if index is None:
+            raise IndexError(key)
+
+        obj = self.__objects[index]
+        if obj is not None:
+            return obj._value_ if not rest else obj._get_int_(rest)
+
+        value = self.__values[index]
+        if not rest:
+            return value
+        accessor = self._classes_[index]._int_accessors_.get(rest)
+        if accessor is None:
+            return self._get_member_(index)._get_int_(rest)
+        start, mask, _ = accessor
+        return (value & mask) >> start
+
+    def __len__(self) -> int:
+        """Record length in bytes."""
+        return self._size_ // 8
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Comparing logic: same class and members values.
+
+        :rtype: bool
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._get_values_() == other._get_values_()
+
+    __hash__ = None  # type: ignore  # Mutable
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Pickle support: class and members values."""
+        return self.__class__, tuple(self._get_values_())
+
+    def __repr__(self) -> str:
+        """Public __repr__ for logging/debugging usage."""
+        members = ", ".join(
+            f"{m_name}=0x{value:0{length * 2}X}"
+            for (m_name, (_, _, length)), value in zip(self._members_.items(), self._get_values_())
+        )
+        return f"{self.__class__.__name__}({members})"
@@ -0,0 +1,245 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""BinField layouts from plain data (dict or JSON).
+
+Validated and resolved layouts are stored in local cache directory keyed by descriptor hash:
+next processes create classes without mapping validation and resolution.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import hashlib
+import json
+import os
+import tempfile
+import typing
+
+from .binfield import BinField
+from .binfield import BinFieldMeta
+
+__all__ = ("make_class", "load_schema", "CACHE_DIR_ENV")
+
+DescriptorT = typing.Mapping[str, typing.Any]
+PathT = typing.Union[str, "os.PathLike[str]"]
+
+CACHE_DIR_ENV = "BINFIELD_SCHEMA_CACHE"  # Default cache directory, if not set explicitly
+LAYOUT_FORMAT = 1  # Cached layout format version: part of cache key
+_DESCRIPTOR_KEYS = frozenset(("size", "mask", "mapping", "frozen"))
+
+
+def _get_cache_dir(cache_dir: typing.Optional[PathT]) -> typing.Optional[PathT]:
+    """Get cache directory: explicit or from environment. None: cache is disabled."""
+    if cache_dir is not None:
+        return cache_dir
+    return os.environ.get(CACHE_DIR_ENV) or None
+
+
+def _get_hash(schema: typing.Mapping[str, DescriptorT]) -> str:
+    """Calculate schema hash: cache key.
+
+    :raises TypeError: schema is not JSON serializable
+    """
+    canonical = json.dumps([LAYOUT_FORMAT, schema], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _encode_mapping(mapping: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Resolved mapping -> JSON compatible data. Slices are stored as [start, stop]."""
+    result: typing.Dict[str, typing.Any] = {}
+    for key, val in mapping.items():
+        if isinstance(val, collections.abc.Mapping):
+            result[key] = _encode_mapping(val)
+        elif isinstance(val, slice):
+            result[key] = [val.start, val.stop]
+        else:  # int or _index_
+            result[key] = val if isinstance(val, int) else list(val)
+    return result
+
+
+def _decode_mapping(data: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """JSON compatible data -> resolved mapping."""
+    result: typing.Dict[str, typing.Any] = {}
+    for key, val in data.items():
+        if key == "_index_":
+            result[key] = tuple(val)
+        elif isinstance(val, dict):
+            result[key] = _decode_mapping(val)
+        elif isinstance(val, list):
+            result[key] = slice(*val)
+        else:
+            result[key] = val
+    return result
+
+
+def _open_records(mapping: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Descriptor mapping -> class body mapping. Records [start, null] are open-ended slices."""
+    result: typing.Dict[str, typing.Any] = {}
+    for key, val in mapping.items():
+        if isinstance(val, collections.abc.Mapping):
+            result[key] = _open_records(val)
+        elif isinstance(val, (list, tuple)) and len(val) == 2 and val[1] is None and key != "_index_":
+            result[key] = slice(*val)
+        else:
+            result[key] = val
+    return result
+
+
+def _dump_layout(cls: typing.Type[BinField]) -> typing.Dict[str, typing.Any]:
+    """Get resolved class layout as JSON compatible data."""
+    # pylint: disable=protected-access
+    mapping = cls._mapping_
+    return {
+        "name": cls.__name__,
+        "size": cls._size_,
+        "mask": cls._mask_,
+        "frozen": cls._frozen_,
+        "mapping": _encode_mapping(mapping) if mapping is not None else None,
+        "int_accessors": {key: list(accessor) for key, accessor in cls._int_accessors_.items()},
+    }
+
+
+def _load_layout(data: typing.Mapping[str, typing.Any]) -> typing.Type[BinField]:
+    """Create class from resolved layout: mapping validation and resolution are skipped."""
+    mapping = _decode_mapping(data["mapping"]) if data["mapping"] is not None else {}
+    int_accessors = {key: tuple(accessor) for key, accessor in data["int_accessors"].items()}
+    return BinFieldMeta.makecls(
+        name=data["name"],
+        mask=data["mask"],
+        size=data["size"],
+        frozen=data["frozen"],
+        _layout=(mapping, int_accessors),
+    )
+
+
+def _read_cache(path: str) -> typing.Optional[typing.Dict[str, typing.Type[BinField]]]:
+    """Create classes from cached layouts. Missing or broken cache entry: None."""
+    try:
+        with open(path, encoding="utf-8") as src:
+            data = json.load(src)
+        if data["format"] != LAYOUT_FORMAT:
+            return None
+        return {layout["name"]: _load_layout(layout) for layout in data["layouts"]}
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _write_cache(path: str, classes: typing.Iterable[typing.Type[BinField]]) -> None:
+    """Store classes layouts in cache. Cache is optional: write errors are ignored.
+
+    Entry is written to temporary file and renamed: concurrent readers never see partial data.
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as dst:
+                json.dump({"format": LAYOUT_FORMAT, "layouts": [_dump_layout(cls) for cls in classes]}, dst)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _make_class(name: str, descriptor: DescriptorT) -> typing.Type[BinField]:
+    """Create BinField subclass from layout descriptor with validation.
+
+    :raises ValueError: unexpected descriptor keys or layout validation fail
+    :raises TypeError: invalid types in descriptor
+    :raises IndexError: mapping records intersection
+    """
+    if not isinstance(descriptor, collections.abc.Mapping):
+        raise TypeError(f"Layout descriptor of {name} should be mapping, got {type(descriptor)!r}")
+    unexpected = set(descriptor) - _DESCRIPTOR_KEYS
+    if unexpected:
+        raise ValueError(f"Layout descriptor of {name} contains unexpected keys: {sorted(unexpected)!r}")
+
+    # Same as class body: mask is calculated from size and vice versa
+    classdict = {f"_{key}_": val for key, val in descriptor.items() if val is not None}
+    if isinstance(classdict.get("_mapping_"), collections.abc.Mapping):
+        classdict["_mapping_"] = _open_records(classdict["_mapping_"])
+    classdict["__slots__"] = ()
+    return BinFieldMeta(name, (BinField,), classdict)
+
+
+def load_schema(
+    source: typing.Union[typing.Mapping[str, DescriptorT], PathT, typing.TextIO],
+    cache_dir: typing.Optional[PathT] = None,
+) -> typing.Dict[str, typing.Type[BinField]]:
+    """Create BinField subclasses from schema: mapping of class names to layout descriptors.
+
+    Descriptor keys (all optional): ``size``, ``mask``, ``mapping``, ``frozen``.
+    Mapping records are defined like in class body: bit index, [start, stop] or nested dict with ``_index_``.
+    Open-ended record (till the end of data) is defined as [start, null].
+
+    :param source: schema as dict, JSON file path or text file object with JSON
+    :type source: typing.Union[typing.Mapping[str, typing.Mapping[str, typing.Any]], str, os.PathLike, typing.TextIO]
+    :param cache_dir: resolved layouts cache directory. Default: ``BINFIELD_SCHEMA_CACHE`` environment variable.
+                      If not set: cache is not used.
+    :type cache_dir: typing.Optional[typing.Union[str, os.PathLike]]
+    :returns: classes by names in schema order
+    :rtype: typing.Dict[str, typing.Type[BinField]]
+    :raises ValueError: unexpected descriptor keys or layout validation fail
+    :raises TypeError: invalid types in schema or schema is not JSON serializable
+    :raises IndexError: mapping records intersection
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as src:
+            schema = json.load(src)
+    elif isinstance(source, collections.abc.Mapping):
+        schema = source
+    else:
+        schema = json.load(source)
+
+    if not isinstance(schema, collections.abc.Mapping):
+        raise TypeError(f"Schema should be mapping of class names to layout descriptors, got {type(schema)!r}")
+
+    directory = _get_cache_dir(cache_dir)
+    path = None
+    if directory is not None:
+        path = os.path.join(directory, f"{_get_hash(schema)}.json")
+        classes = _read_cache(path)
+        if classes is not None:
+            return classes
+
+    classes = {name: _make_class(name, descriptor) for name, descriptor in schema.items()}
+    if path is not None:
+        _write_cache(path, classes.values())
+    return classes
+
+
+def make_class(
+    name: str,
+    descriptor: DescriptorT,
+    cache_dir: typing.Optional[PathT] = None,
+) -> typing.Type[BinField]:
+    """Create BinField subclass from layout descriptor.
+
+    :param name: class name
+    :type name: str
+    :param descriptor: layout descriptor, see :py:func:`load_schema`
+    :type descriptor: typing.Mapping[str, typing.Any]
+    :param cache_dir: resolved layouts cache directory. Default: ``BINFIELD_SCHEMA_CACHE`` environment variable.
+                      If not set: cache is not used.
+    :type cache_dir: typing.Optional[typing.Union[str, os.PathLike]]
+    :returns: BinField subclass
+    :rtype: typing.Type[BinField]
+    :raises ValueError: unexpected descriptor keys or layout validation fail
+    :raises TypeError: invalid types in descriptor or descriptor is not JSON serializable
+    :raises IndexError: mapping records intersection
+    """
+    return load_schema({name: descriptor}, cache_dir=cache_dir)[name]
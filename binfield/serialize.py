@@ -0,0 +1,77 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Batch pickling of same class BinField records.
+
+Class (or schema of not importable class) is stored once, values are packed.
+"""
+
+from __future__ import annotations
+
+import pickle  # nosec  # Same trust model as pickle
+import typing
+
+from .binfield import BinField
+from .binfield import _get_byte_size
+from .binfield import _get_class_ref
+from .binfield import _resolve_class_ref
+from .stream import _pack_block
+from .stream import _unpack_block
+
+__all__ = ("dumps_many", "loads_many")
+
+
+def dumps_many(records: typing.Sequence[BinField], protocol: typing.Optional[int] = None) -> bytes:
+    """Pickle same class records: class is stored once, values are packed.
+
+    Parent links are not stored (like on copy).
+
+    :param records: BinField objects of the same class
+    :type records: typing.Sequence[BinField]
+    :param protocol: pickle protocol
+    :type protocol: typing.Optional[int]
+    :rtype: bytes
+    :raises TypeError: records of different classes
+    """
+    # pylint: disable=protected-access
+    if not records:
+        return pickle.dumps((None, None, ()), protocol)
+
+    cls = records[0].__class__
+    if any(record.__class__ is not cls for record in records):
+        raise TypeError(f"All records should be instances of {cls.__name__}")
+
+    values = [record._value_ for record in records]
+    try:
+        size: typing.Optional[int] = _get_byte_size(cls)
+    except ValueError:  # Not sized: values as is
+        size = None
+    packed = values if size is None else _pack_block(values, size, "big")
+    return pickle.dumps((_get_class_ref(cls), size, packed), protocol)
+
+
+def loads_many(data: bytes) -> typing.List[BinField]:
+    """Restore records, pickled by `dumps_many`.
+
+    .. warning:: Like pickle, not secure against erroneous or maliciously constructed data.
+
+    :param data: pickled records
+    :type data: bytes
+    :rtype: typing.List[BinField]
+    """
+    ref, size, packed = pickle.loads(data)  # nosec  # Same trust model as pickle
+    if ref is None:
+        return []
+    cls = _resolve_class_ref(ref)
+    values = packed if size is None else _unpack_block(memoryview(packed), size, "big")
+    return [cls(value) for value in values]
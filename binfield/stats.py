@@ -0,0 +1,100 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Opt-in instrumentation counters for BinField hot paths.
+
+Disabled by default: instrumented paths check single module variable,
+bits modification is replaced by instrumented variant only while enabled.
+Counters are not synchronized between threads: concurrent increments could be lost.
+Counters are keyed by class object: generated child classes with the same name are counted separately.
+Classes are referenced weakly: counters do not keep classes alive, counters of collected classes are not reported.
+
+Events:
+
+* ``child_cls.hit``, ``child_cls.miss``: child classes cache lookup by slicing, record is child class name;
+* ``child.alloc``: child object creation (mapping record or slice access), record is child class name;
+* ``parent.read``, ``parent.write``: linked child object value read from / written to parent object;
+* ``setslice``: bits modification with validation, record is ``"start:stop"``;
+* ``mapping.copy``: nested mapping copy on access to nested record with value dependent bounds;
+* ``format``: ``str()`` formatting.
+"""
+
+from __future__ import annotations
+
+import collections
+import typing
+
+from .binfield import _get_stats
+from .binfield import _set_stats
+
+__all__ = ("StatKey", "enable", "disable", "is_enabled", "snapshot", "reset")
+
+
+class StatKey(typing.NamedTuple):
+    """Counter key."""
+
+    cls: type
+    event: str
+    record: typing.Optional[str]
+
+
+def enable() -> None:
+    """Enable counters collection. Already collected counters are kept."""
+    if _get_stats() is None:
+        _set_stats(collections.Counter())
+
+
+def disable() -> None:
+    """Disable counters collection and drop collected counters."""
+    _set_stats(None)
+
+
+def is_enabled() -> bool:
+    """Counters collection is enabled.
+
+    :rtype: bool
+    """
+    return _get_stats() is not None
+
+
+def snapshot(
+    cls: typing.Union[type, str, None] = None,
+    event: typing.Optional[str] = None,
+) -> typing.Dict[StatKey, int]:
+    """Get copy of collected counters, most common first.
+
+    :param cls: filter by class or by class name (all classes with this name)
+    :type cls: typing.Union[type, str, None]
+    :param event: filter by event
+    :type event: typing.Optional[str]
+    :return: counters by (class, event, record)
+    :rtype: typing.Dict[StatKey, int]
+    """
+    counters = _get_stats()
+    if counters is None:
+        return {}
+    result: typing.Dict[StatKey, int] = {}
+    for (ref, key_event, record), count in counters.copy().most_common():
+        key_cls = ref()
+        if key_cls is None:  # Class is collected
+            continue
+        if (cls is None or key_cls is cls or key_cls.__name__ == cls) and (event is None or key_event == event):
+            result[StatKey(key_cls, key_event, record)] = count
+    return result
+
+
+def reset() -> None:
+    """Reset collected counters. Collection state is not changed."""
+    counters = _get_stats()
+    if counters is not None:
+        counters.clear()
@@ -0,0 +1,428 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Streaming decode of fixed size BinField records.
+
+Records are read in large blocks and decoded per block.
+Async variants work with asyncio streams: single read per batch, coalesced writes.
+"""
+
+from __future__ import annotations
+
+import array
+import mmap
+import operator
+import os
+import struct
+import typing
+
+from .binfield import _BYTEORDER_CODES
+from .binfield import _STRUCT_CODES
+from .binfield import BinField
+from .binfield import _get_byte_size
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import asyncio  # asyncio import is expensive: not required in runtime
+
+__all__ = ("iter_chunks", "iter_records", "aiter_chunks", "aiter_records", "AsyncRecordWriter")
+
+BufferT = typing.Union[bytes, bytearray, memoryview, mmap.mmap, "array.array[typing.Any]"]
+SourceT = typing.Union[str, "os.PathLike[str]", typing.BinaryIO, BufferT]
+DEFAULT_CHUNK_RECORDS = 4096
+
+
+def _unpack_block(view: memoryview, size: int, byteorder: str) -> typing.Sequence[int]:
+    """Convert block of whole records to integers.
+
+    :param view: block of records
+    :type view: memoryview
+    :param size: record size in bytes
+    :type size: int
+    :param byteorder: "big" or "little"
+    :type byteorder: str
+    :rtype: typing.Sequence[int]
+    """
+    if size in _STRUCT_CODES:
+        return struct.unpack_from(f"{_BYTEORDER_CODES[byteorder]}{len(view) // size}{_STRUCT_CODES[size]}", view)
+    return [int.from_bytes(view[pos : pos + size], byteorder) for pos in range(0, len(view), size)]  # type: ignore
+
+
+def _pack_block(values: typing.Sequence[int], size: int, byteorder: str) -> bytes:
+    """Convert integers to block of records.
+
+    :param values: records values
+    :type values: typing.Sequence[int]
+    :param size: record size in bytes
+    :type size: int
+    :param byteorder: "big" or "little"
+    :type byteorder: str
+    :rtype: bytes
+    """
+    if size in _STRUCT_CODES:
+        return struct.pack(f"{_BYTEORDER_CODES[byteorder]}{len(values)}{_STRUCT_CODES[size]}", *values)
+    return b"".join([value.to_bytes(size, byteorder) for value in values])  # type: ignore
+
+
+def _decode_block(
+    block: memoryview,
+    cls: typing.Type[BinField],
+    size: int,
+    byteorder: str,
+    raw: bool,
+    keys: typing.Sequence[str],
+) -> typing.List[typing.Any]:
+    """Decode block of whole records to BinField objects or tuples of mapping records values."""
+    # pylint: disable=protected-access
+    values = _unpack_block(block, size, byteorder)
+    if raw:
+        if not keys and cls._lookup_ is not None:  # Small class with lookup table: single index per record
+            return cls._lookup_.get_many(values)
+        return list(zip(*cls._decode_many_(values, *keys, use_numpy=False).values()))
+    return [cls(value) for value in values]
+
+
+def _check_params(cls: typing.Type[BinField], byteorder: str, chunk_records: int) -> int:
+    """Validate common parameters.
+
+    :return: record size in bytes
+    :raises ValueError: class size is not defined, unexpected byteorder or not positive chunk size
+    """
+    size = _get_byte_size(cls)
+    if byteorder not in _BYTEORDER_CODES:
+        raise ValueError("byteorder must be either 'little' or 'big'")
+    if chunk_records <= 0:
+        raise ValueError("Chunk size must be positive value !")
+    return size
+
+
+def _iter_buffer_blocks(source: BufferT, size: int, block_size: int) -> typing.Iterator[memoryview]:
+    """Split buffer to blocks of whole records without copy.
+
+    :raises ValueError: trailing data is not a whole record
+    """
+    with memoryview(source) as view:
+        data = view.cast("B")
+        tail = len(data) % size
+        end = len(data) - tail
+        for pos in range(0, end, block_size):
+            yield data[pos : min(pos + block_size, end)]
+        if tail:
+            raise ValueError(f"Trailing data is shorter, than record: {tail} bytes of {size}")
+
+
+def _iter_file_blocks(source: typing.BinaryIO, size: int, block_size: int) -> typing.Iterator[memoryview]:
+    """Read file by blocks of whole records.
+
+    Block buffer is re-used: yielded view is valid only until next iteration.
+
+    :raises ValueError: trailing data is not a whole record
+    """
+    block = bytearray(block_size)
+    view = memoryview(block)
+    filled = 0
+    readinto = getattr(source, "readinto", None)
+
+    while True:
+        if readinto is not None:
+            count = readinto(view[filled:])
+        else:
+            data = source.read(block_size - filled)
+            count = len(data)
+            view[filled : filled + count] = data
+
+        if not count:
+            break
+        filled += count
+        if filled == block_size:
+            yield view
+            filled = 0
+
+    tail = filled % size
+    if filled - tail:
+        yield view[: filled - tail]
+    if tail:
+        raise ValueError(f"Trailing data is shorter, than record: {tail} bytes of {size}")
+
+
+def _is_buffer(source: typing.Any) -> bool:
+    """Check, that object supports buffer protocol (mmap, array and etc.)."""
+    try:
+        memoryview(source).release()
+    except TypeError:
+        return False
+    return True
+
+
+def _iter_blocks(source: SourceT, size: int, block_size: int) -> typing.Iterator[memoryview]:
+    """Get blocks of whole records from path, buffer or file object."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as src:
+            yield from _iter_file_blocks(src, size, block_size)
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap, array.array)):
+        yield from _iter_buffer_blocks(source, size, block_size)
+    elif _is_buffer(source):  # Other objects, which support buffer protocol
+        yield from _iter_buffer_blocks(typing.cast(BufferT, source), size, block_size)
+    else:  # File object
+        yield from _iter_file_blocks(source, size, block_size)
+
+
+def iter_chunks(
+    source: SourceT,
+    cls: typing.Type[BinField],
+    byteorder: str = "big",
+    raw: bool = False,
+    keys: typing.Sequence[str] = (),
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> typing.Iterator[typing.List[typing.Any]]:
+    """Lazily decode fixed size records by chunks.
+
+    :param source: file path, binary file object or buffer (bytes, bytearray, memoryview, mmap)
+    :type source: typing.Union[str, os.PathLike, typing.BinaryIO, bytes, bytearray, memoryview, mmap.mmap]
+    :param cls: BinField subclass with defined size
+    :type cls: typing.Type[BinField]
+    :param byteorder: records byte order: "big" or "little"
+    :type byteorder: str
+    :param raw: yield tuples of mapping records values instead of BinField instances
+    :type raw: bool
+    :param keys: mapping keys for raw tuples. If not set: all top level mapping keys
+    :type keys: typing.Sequence[str]
+    :param chunk_records: amount of records to read and decode at once
+    :type chunk_records: int
+    :return: iterator over lists of decoded records
+    :rtype: typing.Iterator[typing.List[typing.Union[BinField, typing.Tuple[int, ...]]]]
+    :raises ValueError: class size is not defined, unexpected byteorder or trailing data is not a whole record
+    """
+    size = _check_params(cls, byteorder, chunk_records)
+    for block in _iter_blocks(source, size, size * chunk_records):
+        yield _decode_block(block, cls, size, byteorder, raw, keys)
+
+
+def iter_records(
+    source: SourceT,
+    cls: typing.Type[BinField],
+    byteorder: str = "big",
+    raw: bool = False,
+    keys: typing.Sequence[str] = (),
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> typing.Iterator[typing.Any]:
+    """Lazily decode fixed size records.
+
+    Data is read and decoded by chunks of `chunk_records` records.
+
+    :param source: file path, binary file object or buffer (bytes, bytearray, memoryview, mmap)
+    :type source: typing.Union[str, os.PathLike, typing.BinaryIO, bytes, bytearray, memoryview, mmap.mmap]
+    :param cls: BinField subclass with defined size
+    :type cls: typing.Type[BinField]
+    :param byteorder: records byte order: "big" or "little"
+    :type byteorder: str
+    :param raw: yield tuples of mapping records values instead of BinField instances
+    :type raw: bool
+    :param keys: mapping keys for raw tuples. If not set: all top level mapping keys
+    :type keys: typing.Sequence[str]
+    :param chunk_records: amount of records to read and decode at once
+    :type chunk_records: int
+    :return: iterator over decoded records
+    :rtype: typing.Iterator[typing.Union[BinField, typing.Tuple[int, ...]]]
+    :raises ValueError: class size is not defined, unexpected byteorder or trailing data is not a whole record
+    """
+    for chunk in iter_chunks(source, cls, byteorder=byteorder, raw=raw, keys=keys, chunk_records=chunk_records):
+        yield from chunk
+
+
+async def aiter_chunks(
+    reader: asyncio.StreamReader,
+    cls: typing.Type[BinField],
+    byteorder: str = "big",
+    raw: bool = False,
+    keys: typing.Sequence[str] = (),
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> typing.AsyncIterator[typing.List[typing.Any]]:
+    """Decode fixed size records from asyncio stream by batches.
+
+    Single read per batch: batch contains all whole records, available in stream (up to `chunk_records`),
+    incomplete record is kept for the next batch. Batch is not delayed until `chunk_records` records arrive.
+
+    :param reader: asyncio stream reader (or any object with ``async read(n)``)
+    :type reader: asyncio.StreamReader
+    :param cls: BinField subclass with defined size
+    :type cls: typing.Type[BinField]
+    :param byteorder: records byte order: "big" or "little"
+    :type byteorder: str
+    :param raw: yield tuples of mapping records values instead of BinField instances
+    :type raw: bool
+    :param keys: mapping keys for raw tuples. If not set: all top level mapping keys
+    :type keys: typing.Sequence[str]
+    :param chunk_records: maximal amount of records to read and decode at once
+    :type chunk_records: int
+    :return: async iterator over lists of decoded records
+    :rtype: typing.AsyncIterator[typing.List[typing.Union[BinField, typing.Tuple[int, ...]]]]
+    :raises ValueError: class size is not defined, unexpected byteorder or stream ends with incomplete record
+    """
+    size = _check_params(cls, byteorder, chunk_records)
+    block_size = size * chunk_records
+    buffer = bytearray()
+
+    while True:
+        data = await reader.read(block_size - len(buffer))
+        if not data:
+            break
+        buffer += data
+        whole = len(buffer) - len(buffer) % size
+        if whole:
+            with memoryview(buffer) as view:
+                chunk = _decode_block(view[:whole], cls, size, byteorder, raw, keys)
+            del buffer[:whole]
+            yield chunk
+
+    if buffer:
+        raise ValueError(f"Trailing data is shorter, than record: {len(buffer)} bytes of {size}")
+
+
+async def aiter_records(
+    reader: asyncio.StreamReader,
+    cls: typing.Type[BinField],
+    byteorder: str = "big",
+    raw: bool = False,
+    keys: typing.Sequence[str] = (),
+    chunk_records: int = DEFAULT_CHUNK_RECORDS,
+) -> typing.AsyncIterator[typing.Any]:
+    """Decode fixed size records from asyncio stream.
+
+    Data is read and decoded by batches, see :py:func:`aiter_chunks`.
+
+    :param reader: asyncio stream reader (or any object with ``async read(n)``)
+    :type reader: asyncio.StreamReader
+    :param cls: BinField subclass with defined size
+    :type cls: typing.Type[BinField]
+    :param byteorder: records byte order: "big" or "little"
+    :type byteorder: str
+    :param raw: yield tuples of mapping records values instead of BinField instances
+    :type raw: bool
+    :param keys: mapping keys for raw tuples. If not set: all top level mapping keys
+    :type keys: typing.Sequence[str]
+    :param chunk_records: maximal amount of records to read and decode at once
+    :type chunk_records: int
+    :return: async iterator over decoded records
+    :rtype: typing.AsyncIterator[typing.Union[BinField, typing.Tuple[int, ...]]]
+    :raises ValueError: class size is not defined, unexpected byteorder or stream ends with incomplete record
+    """
+    async for chunk in aiter_chunks(reader, cls, byteorder=byteorder, raw=raw, keys=keys, chunk_records=chunk_records):
+        for record in chunk:
+            yield record
+
+
+class AsyncRecordWriter:
+    """Coalescing writer of fixed size records to asyncio stream.
+
+    Records are packed and written by batches of `chunk_records`. Call `flush()` (or use as async context manager)
+    to write pending records.
+    """
+
+    __slots__ = ("__writer", "__cls", "__size", "__limit", "__mask", "__byteorder", "__chunk_records", "__pending")
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        cls: typing.Type[BinField],
+        byteorder: str = "big",
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+    ) -> None:
+        """Coalescing writer of fixed size records. Records are masked by class mask on add.
+
+        :param writer: asyncio stream writer (or any object with ``write(data)`` and ``async drain()``)
+        :type writer: asyncio.StreamWriter
+        :param cls: BinField subclass with defined size
+        :type cls: typing.Type[BinField]
+        :param byteorder: records byte order: "big" or "little"
+        :type byteorder: str
+        :param chunk_records: amount of records to pack and write at once
+        :type chunk_records: int
+        :raises ValueError: class size is not defined, unexpected byteorder or not positive chunk size
+        """
+        self.__size = _check_params(cls, byteorder, chunk_records)
+        self.__limit = 1 << cls._size_  # type: ignore  # Size is checked
+        self.__mask = cls._mask_
+        self.__writer = writer
+        self.__cls = cls
+        self.__byteorder = byteorder
+        self.__chunk_records = chunk_records
+        self.__pending: typing.List[int] = []
+
+    @property
+    def pending(self) -> int:
+        """Amount of records, not written to stream yet.
+
+        :rtype: int
+        """
+        return len(self.__pending)
+
+    def __check(self, value: int) -> None:
+        """Validate record value before adding to pending records.
+
+        :raises ValueError: negative data or data bigger, than record
+        """
+        # pylint: disable=protected-access
+        if value < 0:
+            raise ValueError("BinField could not be negative!")
+        if value >= self.__limit:
+            raise ValueError(f"Data size is bigger, than {self.__cls.__name__} size ({self.__cls._size_} bits)")
+
+    async def write(self, record: typing.Union[int, BinField]) -> None:
+        """Add record. Stream is written and drained only if batch is complete.
+
+        :param record: record: BinField object or integer
+        :type record: typing.Union[int, BinField]
+        :raises TypeError: record is not integer
+        :raises ValueError: negative data or data bigger, than record. Record is not added.
+        """
+        value = operator.index(record)
+        self.__check(value)
+        self.__pending.append(value & self.__mask if self.__mask is not None else value)
+        if len(self.__pending) >= self.__chunk_records:
+            await self.flush()
+
+    async def write_many(self, records: typing.Iterable[typing.Union[int, BinField]]) -> None:
+        """Add records. If batch is complete: all pending records are written by single write call and drained.
+
+        :param records: records: BinField objects or integers
+        :type records: typing.Iterable[typing.Union[int, BinField]]
+        :raises TypeError: record is not integer
+        :raises ValueError: negative data or data bigger, than record. No records are added.
+        """
+        values = list(map(operator.index, records))
+        if values:
+            self.__check(min(values))
+            self.__check(max(values))
+            if self.__mask is not None:
+                values = [value & self.__mask for value in values]
+        self.__pending.extend(values)
+        if len(self.__pending) >= self.__chunk_records:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write pending records by single write call and drain stream. Records are validated on add."""
+        values = self.__pending
+        if not values:
+            return
+        self.__pending = []
+        self.__writer.write(_pack_block(values, self.__size, self.__byteorder))
+        await self.__writer.drain()
+
+    async def __aenter__(self) -> AsyncRecordWriter:
+        """Async context manager: flush on exit."""
+        return self
+
+    async def __aexit__(self, exc_type: typing.Any, *args: typing.Any) -> None:
+        """Async context manager: flush on exit without errors."""
+        if exc_type is None:
+            await self.flush()
@@ -0,0 +1,309 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Buffer-backed BinField view.
+
+Reads and writes touch only bytes, covered by the record.
+"""
+
+from __future__ import annotations
+
+import typing
+import weakref
+
+from .binfield import _BYTEORDER_CODES
+from .binfield import BinField
+from .binfield import KeyT
+from .binfield import _get_byte_size
+from .binfield import _get_field_bounds
+from .binfield import _get_mask
+from .binfield import _is_valid_slice
+from .binfield import _is_valid_slice_mapping
+
+__all__ = ("BinFieldView",)
+
+# (first byte position, last byte position + 1, shift in bytes block, mask in bytes block, record width)
+PlanT = typing.Tuple[int, int, int, int, int]
+PlanKeyT = typing.Union[str, int, typing.Tuple[typing.Optional[int], typing.Optional[int]]]
+ClassPlansT = typing.Dict[typing.Tuple[PlanKeyT, str], PlanT]
+
+# Resolved records per class: key and byteorder -> plan
+_PLANS: weakref.WeakKeyDictionary[typing.Type[BinField], ClassPlansT] = weakref.WeakKeyDictionary()
+
+
+def _compile_plan(cls: typing.Type[BinField], key: PlanKeyT, byteorder: str) -> PlanT:
+    """Resolve record to bytes block in buffer.
+
+    :param cls: BinField layout class
+    :type cls: typing.Type[BinField]
+    :param key: mapping key, index or (start, stop) of slice
+    :type key: typing.Union[str, int, typing.Tuple[typing.Optional[int], typing.Optional[int]]]
+    :param byteorder: "big" or "little"
+    :type byteorder: str
+    :return: first byte position, last byte position + 1, shift and mask in bytes block, record width
+    :rtype: typing.Tuple[int, int, int, int, int]
+    :raises IndexError: key not found
+    """
+    # pylint: disable=protected-access
+    length = _get_byte_size(cls)
+
+    if isinstance(key, str):
+        accessor = cls._int_accessors_.get(key)
+        if accessor is None:
+            raise IndexError(key)
+        start, mask, width = accessor
+    else:
+        bounds = _get_field_bounds(key if isinstance(key, int) else slice(*key), cls._size_)
+        if bounds is None:
+            raise IndexError(f"Index {key} is out of data length {cls._size_}")
+        start, stop = bounds
+        width = stop - start
+        mask = _get_mask(start, stop)
+        if cls._mask_ is not None:
+            mask &= cls._mask_
+
+    first, last = start // 8, (start + width - 1) // 8
+    if byteorder == "big":
+        pos_start, pos_end = length - 1 - last, length - first
+    else:
+        pos_start, pos_end = first, last + 1
+    return pos_start, pos_end, start - first * 8, mask >> (first * 8), width
+
+
+def _get_plan(cls: typing.Type[BinField], key: PlanKeyT, byteorder: str) -> PlanT:
+    """Get resolved record. Plans are cached per class and do not keep class alive.
+
+    :rtype: typing.Tuple[int, int, int, int, int]
+    :raises IndexError: key not found
+    """
+    plans = _PLANS.get(cls)
+    if plans is None:
+        plans = _PLANS.setdefault(cls, {})
+    try:
+        return plans[key, byteorder]
+    except KeyError:
+        plan = plans[key, byteorder] = _compile_plan(cls, key, byteorder)
+        return plan
+
+
+class BinFieldView:
+    """BinField layout over region of buffer (bytearray, mmap, memoryview).
+
+    Mapping records are read and written as integers, writes modify only affected bytes of buffer.
+    Buffer is exported while view is not released: use as context manager or call `_release_()`.
+    """
+
+    __slots__ = ("__cls", "__view", "__byteorder")
+
+    def __init__(
+        self,
+        cls: typing.Type[BinField],
+        buf: typing.Union[bytearray, memoryview, typing.Any],
+        offset: int = 0,
+        byteorder: str = "big",
+    ) -> None:
+        """BinField layout over region of buffer.
+
+        :param cls: BinField subclass with defined size
+        :type cls: typing.Type[BinField]
+        :param buf: buffer: bytearray, mmap, memoryview or other object with buffer protocol support
+        :type buf: typing.Union[bytearray, memoryview, mmap.mmap]
+        :param offset: region start in buffer
+        :type offset: int
+        :param byteorder: byte order: "big" or "little"
+        :type byteorder: str
+        :raises ValueError: class size is not defined, not enough data, negative offset or unexpected byteorder
+        """
+        length = _get_byte_size(cls)
+        if byteorder not in _BYTEORDER_CODES:
+            raise ValueError("byteorder must be either 'little' or 'big'")
+        if offset < 0:
+            raise ValueError("Offset could not be negative!")
+
+        view = memoryview(buf).cast("B")[offset : offset + length]
+        if len(view) != length:
+            view.release()
+            raise ValueError(f"Not enough data in buffer for {cls.__name__} ({length} bytes at {offset})")
+
+        self.__cls = cls
+        self.__view = view
+        self.__byteorder: typing.Literal["big", "little"] = "big" if byteorder == "big" else "little"
+
+    @property
+    def _cls_(self) -> typing.Type[BinField]:
+        """BinField layout class.
+
+        :rtype: typing.Type[BinField]
+        """
+        return self.__cls
+
+    @property
+    def _value_(self) -> int:
+        """Full value (integer).
+
+        :rtype: int
+        """
+        # pylint: disable=protected-access
+        value = int.from_bytes(self.__view, self.__byteorder)
+        mask = self.__cls._mask_
+        return value & mask if mask is not None else value
+
+    @_value_.setter
+    def _value_(self, new_value: int) -> None:
+        """Full value (integer).
+
+        :type new_value: int
+        :raises TypeError: value type is not int
+        :raises OverflowError: Data value to set is bigger, than BinField size
+        :raises ValueError: negative value
+        """
+        # pylint: disable=protected-access
+        if not isinstance(new_value, int):
+            raise TypeError("BinField value could be set only as int")
+        if new_value < 0:
+            raise ValueError("BinField could not be negative!")
+        size = self.__cls._size_
+        if size is not None and new_value.bit_length() > size:
+            raise OverflowError(f"Data value to set is bigger, than BinField size: {new_value.bit_length()} > {size}")
+        if self.__cls._mask_ is not None:
+            new_value &= self.__cls._mask_
+        self.__view[:] = new_value.to_bytes(len(self.__view), self.__byteorder)
+
+    def __get_plan(self, key: KeyT) -> PlanT:
+        """Get record plan for key.
+
+        :raises IndexError: unexpected key or key not found
+        """
+        if isinstance(key, (str, int)):
+            return _get_plan(self.__cls, key, self.__byteorder)
+        if isinstance(key, slice) and _is_valid_slice(key):
+            return _get_plan(self.__cls, (key.start, key.stop), self.__byteorder)
+        if isinstance(key, (tuple, list)) and _is_valid_slice_mapping(key):
+            start, stop = key
+            return _get_plan(self.__cls, (start, stop), self.__byteorder)
+        raise IndexError(key)
+
+    def __getitem__(self, key: KeyT) -> int:
+        """Read mapping record or bits as integer.
+
+        :param key: mapping key (nested records are addressed by dotted path), index or slice
+        :type key: typing.Union[str, int, slice, typing.Tuple[int, int], typing.List[int, int]]
+        :rtype: int
+        :raises IndexError: key not found
+        """
+        pos_start, pos_end, shift, mask, _ = self.__get_plan(key)
+        block = int.from_bytes(self.__view[pos_start:pos_end], self.__byteorder)
+        return (block & mask) >> shift
+
+    def __setitem__(self, key: KeyT, value: int) -> None:
+        """Write mapping record or bits, only affected bytes are modified.
+
+        :param key: mapping key (nested records are addressed by dotted path), index or slice
+        :type key: typing.Union[str, int, slice, typing.Tuple[int, int], typing.List[int, int]]
+        :type value: int
+        :raises TypeError: value type is not int
+        :raises IndexError: key not found
+        :raises ValueError: negative data or data bigger, than record
+        """
+        if not isinstance(value, int):
+            raise TypeError("BinField value could be set only as int")
+
+        pos_start, pos_end, shift, mask, width = self.__get_plan(key)
+
+        if value < 0:
+            raise ValueError("BinField could not be negative!")
+        if value.bit_length() > width:
+            raise ValueError("Data size is bigger, than slice")
+
+        region = self.__view[pos_start:pos_end]
+        block = int.from_bytes(region, self.__byteorder)
+        block = block & ~mask | (value << shift) & mask
+        region[:] = block.to_bytes(len(region), self.__byteorder)
+
+    def __getattr__(self, name: str) -> int:
+        """Mapping records access.
+
+        :raises AttributeError: not a mapping record
+        """
+        if not name.startswith("_") and name in self.__cls._int_accessors_:
+            return self[name]
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """Mapping records modification."""
+        if not name.startswith("_") and name in self.__cls._int_accessors_:
+            self[name] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __int__(self) -> int:
+        """Conversion to normal int.
+
+        :rtype: int
+        """
+        return self._value_
+
+    def __index__(self) -> int:
+        """Special method used for bin()/hex/oct/slicing support.
+
+        :rtype: int
+        """
+        return self._value_
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Comparing logic.
+
+        :rtype: bool
+        """
+        if isinstance(other, (int, BinField, BinFieldView)):
+            return self._value_ == int(other)
+        return False
+
+    def __ne__(self, other: typing.Any) -> bool:
+        """Comparing logic.
+
+        :rtype: bool
+        """
+        return not self == other
+
+    __hash__ = None  # type: ignore  # Mutable
+
+    def _snapshot_(self) -> BinField:
+        """Get detached BinField object with current data.
+
+        :rtype: BinField
+        """
+        return self.__cls(self._value_)
+
+    def _release_(self) -> None:
+        """Release buffer. View could not be used after release."""
+        self.__view.release()
+
+    def __enter__(self) -> BinFieldView:
+        """Context manager: release buffer on exit."""
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        """Context manager: release buffer on exit."""
+        self._release_()
+
+    def __str__(self) -> str:
+        """Public __str__ for usage in print."""
+        return str(self._snapshot_())
+
+    def __repr__(self) -> str:
+        """Public __repr__ for logging/debugging usage."""
+        return (
+            f"<{self.__class__.__name__} {self.__cls.__name__}"
+            f"(x=0x{self._value_:0{len(self.__view) * 2}X}, base=16) at 0x{id(self):X}>"
+        )
@@ -21,6 +21,13 @@ import sys
 # External Dependencies
 import setuptools
 import typing
+from setuptools.command import build_ext
+
+try:
+    # noinspection PyPackageRequirements
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 
 PACKAGE_NAME = "binfield"
@@ -105,6 +112,46 @@ def get_simple_vars_from_src(
 
 VARIABLES = get_simple_vars_from_src(SOURCE)
 
+# Hot paths: compiled version is used if available, pure python sources are shipped as fallback.
+REQUIRES_OPTIMIZATION = [setuptools.Extension(f"{PACKAGE_NAME}.binfield", [f"{PACKAGE_NAME}/binfield.py"])]
+
+if cythonize is not None and "BINFIELD_NO_EXTENSIONS" not in os.environ:
+    EXT_MODULES = cythonize(
+        REQUIRES_OPTIMIZATION,
+        compiler_directives=dict(
+            always_allow_keywords=True,
+            annotation_typing=False,
+            binding=True,
+            embedsignature=True,
+            overflowcheck=True,
+            language_level=3,
+        ),
+    )
+else:
+    EXT_MODULES = []
+
+
+class BuildFailed(Exception):
+    """For install clear scripts."""
+
+
+class AllowFailRepair(build_ext.build_ext):
+    """This class allows C extension building to fail."""
+
+    def run(self) -> None:
+        """Pass if no compiler."""
+        try:
+            build_ext.build_ext.run(self)
+        except Exception:  # pylint: disable=broad-except
+            raise BuildFailed()
+
+    def build_extension(self, ext: setuptools.Extension) -> None:
+        """Do not fail package installation on compiler errors."""
+        try:
+            build_ext.build_ext.build_extension(self, ext)
+        except Exception:  # pylint: disable=broad-except
+            raise BuildFailed()
+
 CLASSIFIERS = [
     "Development Status :: 4 - Beta",
     "Intended Audience :: Developers",
@@ -124,7 +171,7 @@ KEYWORDS = [
     "development"
 ]
 
-setuptools.setup(
+SETUP_ARGS = dict(
     name="BinField",
     author=VARIABLES["__author__"],
     author_email=VARIABLES["__author_email__"],
@@ -149,3 +196,15 @@ setuptools.setup(
     install_requires=REQUIRED,
     package_data={PACKAGE_NAME: ["py.typed"]},
 )
+
+if EXT_MODULES:
+    SETUP_ARGS["ext_modules"] = EXT_MODULES
+    SETUP_ARGS["cmdclass"] = dict(build_ext=AllowFailRepair)
+
+try:
+    setuptools.setup(**SETUP_ARGS)
+except BuildFailed:
+    print("*" * 80 + "\n* Build Failed!\n* Use clear scripts version.\n" + "*" * 80 + "\n")
+    del SETUP_ARGS["ext_modules"]
+    del SETUP_ARGS["cmdclass"]
+    setuptools.setup(**SETUP_ARGS)
@@ -0,0 +1,39 @@
+#    Copyright 2016 - 2020 Alexey Stepanov aka penguinolog
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import subprocess
+import sys
+import unittest
+
+import binfield
+
+CHECK_SCRIPT = """
+import binfield, binfield.stream, binfield.view
+assert binfield.stream.BinField is binfield.view.BinField is binfield.BinField
+print(binfield.COMPILED, binfield.binfield.__file__)
+"""
+
+
+class TestImplementationSelection(unittest.TestCase):
+    def test_flag(self):
+        self.assertEqual(not binfield.binfield.__file__.endswith(".py"), binfield.COMPILED)
+
+    def test_force_pure(self):
+        env = dict(os.environ, BINFIELD_NO_EXTENSIONS="1")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(binfield.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, (root, env.get("PYTHONPATH"))))
+        output = subprocess.check_output([sys.executable, "-c", CHECK_SCRIPT], env=env, universal_newlines=True)
+        compiled, path = output.split()
+        self.assertEqual("False", compiled)
+        self.assertTrue(path.endswith("binfield.py"))
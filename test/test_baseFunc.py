@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 
 import copy
 import pickle
+import sys
 import unittest
 
 from binfield import BinField
@@ -393,6 +394,25 @@ class BaseFunctionality(unittest.TestCase):
         with self.assertRaises(AttributeError):
             ROValue._value_ = 1
 
+        class ROLayout(BinField):
+            _size_ = 8
+            record = (0, 4)
+
+        for name in '_size_', '_mask_', '_mapping_', '_frozen_', 'record':
+            with self.assertRaises(AttributeError):
+                setattr(ROLayout, name, 1)
+            with self.assertRaises(AttributeError):
+                delattr(ROLayout, name)
+            with self.assertRaises(AttributeError):
+                setattr(ROLayout(1), name if name != 'record' else '_size_', 1)
+        self.assertEqual(ROLayout.record, slice(0, 4))
+        self.assertEqual(ROLayout._size_, 8)
+
+        with self.assertRaises(TypeError):
+            # noinspection PyUnusedLocal
+            class Extended(ROLayout):
+                pass
+
     def test_class(self):
         """Test base class and override."""
         self.assertEqual(BinField._value_, NotImplemented)
@@ -456,3 +476,343 @@ class BaseFunctionality(unittest.TestCase):
 
         self.assertEqual(1 << value, 1 << 42)
         self.assertEqual(1 >> value, 0)
+
+    def test_precompiled_accessors(self):
+        """Mapping records access is resolved on class creation."""
+        class AccessorBinField(BinField):
+            _size_ = 8
+            _mask_ = 0b11110111
+            test_index = 0
+            test_slc = (1, 5)
+            test_nested = {
+                '_index_': (5, 8),
+                'single_bit': 0,
+                'multiple': (1, 3)
+            }
+
+        class OpenSliceBinField(BinField):
+            head = 0
+            tail = slice(1, None)
+
+        self.assertEqual(
+            sorted(AccessorBinField._accessors_),
+            ['test_index', 'test_nested', 'test_slc']
+        )
+        accessor = AccessorBinField._accessors_['test_slc']
+        self.assertEqual(accessor.start, 1)
+        self.assertEqual(accessor.mask, 0b00010110)
+        self.assertIsNone(accessor._MappingRecord__child_cls)  # Created on first access
+        self.assertEqual(accessor.child_cls._mask_, 0b1011)
+        self.assertIs(accessor.child_cls, accessor.child_cls)
+
+        bf = AccessorBinField(0xFF)
+        self.assertIs(bf.test_slc.__class__, bf['test_slc'].__class__)
+        self.assertEqual(bf.test_slc, 0b1011)
+        self.assertEqual(bf.test_nested.multiple, 0b11)
+
+        bf.test_nested.single_bit = 0
+        self.assertEqual(bf, 0b11010111)
+
+        # Open slice on unsized data depends on value
+        self.assertEqual(list(OpenSliceBinField._accessors_), ['head'])
+        self.assertEqual(OpenSliceBinField(0xFF).tail, 0x7F)
+
+    def test_int_access(self):
+        """Mapping records could be read as integers."""
+        class IntAccessBinField(BinField):
+            _size_ = 8
+            test_index = 0
+            test_nested = {
+                '_index_': (1, 6),
+                'single_bit': 0,
+                'multiple': (1, 3)
+            }
+            test_open = slice(6, None)
+
+        class OpenSliceBinField(BinField):
+            head = 0
+            tail = slice(1, None)
+
+        bf = IntAccessBinField(0b11010101)
+
+        self.assertEqual(bf._get_int_('test_index'), 1)
+        self.assertEqual(bf._get_int_('test_nested'), 0b01010)
+        self.assertEqual(bf._get_int_('test_nested.single_bit'), 0)
+        self.assertEqual(bf._get_int_('test_nested.multiple'), 0b01)
+        self.assertEqual(bf._get_int_('test_open'), 0b11)
+        self.assertIsInstance(bf._get_int_('test_open'), int)
+
+        self.assertEqual(bf._get_ints_(), (1, 0b01010, 0b11))
+        self.assertEqual(bf._get_ints_('test_nested.multiple', 'test_index'), (0b01, 1))
+
+        nested = bf.test_nested
+        self.assertEqual(nested._get_int_('multiple'), 0b01)
+        bf.test_nested.multiple = 0b10
+        self.assertEqual(nested._get_int_('multiple'), 0b10)
+
+        self.assertEqual(OpenSliceBinField(0xFF)._get_ints_(), (1, 0x7F))
+
+        with self.assertRaises(IndexError):
+            bf._get_int_('nonexistent')
+
+        with self.assertRaises(IndexError):
+            bf._get_int_('test_nested.nonexistent')
+
+        with self.assertRaises(IndexError):
+            BinField(1)._get_ints_()
+
+    def test_child_class_cache(self):
+        """Child classes cache is limited in size."""
+        class LimitedCache(BinField):
+            _size_ = 32
+            _cache_size_ = 4
+
+        bf = LimitedCache(0xFFFFFFFF)
+        self.assertEqual(LimitedCache._cache_.cache_info(), (0, 0, 0, 4, 0))
+
+        first = bf[0:2]
+        self.assertIs(bf[0:2].__class__, first.__class__)
+        self.assertEqual(LimitedCache._cache_.cache_info(), (1, 1, 0, 4, 1))
+
+        for stop in range(3, 13):
+            self.assertEqual(bf[0:stop], (1 << stop) - 1)
+
+        info = LimitedCache._cache_.cache_info()
+        self.assertEqual(info.misses, 11)
+        self.assertEqual(info.evictions, 7)
+        self.assertEqual(info.currsize, 4)
+        self.assertEqual(len(LimitedCache._cache_), 4)
+
+        LimitedCache._cache_.cache_clear()
+        self.assertEqual(LimitedCache._cache_.cache_info(), (0, 0, 0, 4, 0))
+
+        class NoCache(BinField):
+            _cache_size_ = 0
+
+        self.assertIsNot(NoCache(3)[0].__class__, NoCache(3)[0].__class__)
+        self.assertEqual(NoCache._cache_.cache_info().currsize, 0)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyUnusedLocal
+            class NegativeCacheSize(BinField):
+                _cache_size_ = -1
+
+        with self.assertRaises(TypeError):
+            # noinspection PyUnusedLocal
+            class IncorrectCacheSizeType(BinField):
+                _cache_size_ = 'big'
+
+    def test_mapping_view(self):
+        """Mapping is shared as read-only view and source is not modified."""
+        nested = {
+            '_index_': (1, 6),
+            'single_bit': 0,
+            'multiple': (1, 3)
+        }
+        mapping = {'test_index': 0, 'nested_block': nested}
+
+        MappedBinField = BinField.__class__.makecls('MappedBinField', mapping=mapping, size=8)
+
+        self.assertIn('_index_', nested)  # Source is untouched
+
+        self.assertIs(MappedBinField._mapping_, MappedBinField(1)._mapping_)
+        with self.assertRaises(TypeError):
+            MappedBinField._mapping_['test_index'] = 1
+        with self.assertRaises(TypeError):
+            MappedBinField._mapping_['nested_block']['single_bit'] = 1
+
+        bf = MappedBinField(0xFF)
+        self.assertIs(bf.nested_block.__class__, MappedBinField(0).nested_block.__class__)
+        self.assertEqual(bf.nested_block.multiple, 0b11)
+
+        # Copies are plain dicts, as mapping records before sharing
+        expected = {'test_index': 0, 'nested_block': {'_index_': (1, 6), 'single_bit': 0, 'multiple': slice(1, 3)}}
+        for mapping_copy in (
+            copy.deepcopy(MappedBinField._mapping_),
+            pickle.loads(pickle.dumps(MappedBinField._mapping_)),
+        ):
+            self.assertEqual(mapping_copy, expected)
+            self.assertIs(type(mapping_copy['nested_block']), dict)
+            mapping_copy['nested_block']['single_bit'] = 1
+        self.assertEqual(MappedBinField._mapping_['nested_block']['single_bit'], 0)
+        self.assertEqual(copy.copy(MappedBinField._mapping_), MappedBinField._mapping_)
+
+        # Read-only view could be used as source for new class
+        CopiedBinField = BinField.__class__.makecls('CopiedBinField', mapping=MappedBinField._mapping_, size=8)
+        self.assertEqual(CopiedBinField(0xFF).nested_block.multiple, 0b11)
+
+    def test_bytes(self):
+        """Buffer conversion."""
+        class Word(BinField):
+            _size_ = 16
+            low = (0, 8)
+            high = (8, 16)
+
+        class Triple(BinField):
+            _size_ = 24
+
+        buf = bytearray(b'\x00\x12\x34\x56\x78')
+
+        word = Word._from_bytes_(buf, offset=1)
+        self.assertIsInstance(word, Word)
+        self.assertEqual(word, 0x1234)
+        self.assertEqual(Word._from_bytes_(memoryview(buf), byteorder='little', offset=1), 0x3412)
+        self.assertEqual(word._to_bytes_(), b'\x12\x34')
+        self.assertEqual(word._to_bytes_('little'), b'\x34\x12')
+        self.assertEqual(word.high._to_bytes_(), b'\x12')
+
+        self.assertEqual(Triple._from_bytes_(buf, offset=2), 0x345678)
+        self.assertEqual(Triple._from_bytes_(buf, byteorder='little', offset=2), 0x785634)
+        self.assertEqual(Triple(0x345678)._to_bytes_('little'), b'\x78\x56\x34')
+
+        self.assertEqual(BinField._from_bytes_(b'\x01\x02\x03', offset=1), 0x0203)
+        self.assertEqual(BinField(0x0203)._to_bytes_(), b'\x02\x03')
+
+        with self.assertRaises(ValueError):
+            Word._from_bytes_(buf, offset=4)
+        with self.assertRaises(ValueError):
+            Triple._from_bytes_(buf, offset=3)
+        with self.assertRaises(ValueError):
+            BinField._from_bytes_(b'\x01\x02\x03', offset=3)
+        with self.assertRaises(ValueError):
+            BinField._from_bytes_(b'\x01\x02\x03', offset=5)
+        with self.assertRaises(ValueError):
+            Word._from_bytes_(buf, offset=-1)
+        with self.assertRaises(ValueError):
+            Word._from_bytes_(buf, byteorder='middle')
+        with self.assertRaises(ValueError):
+            word._to_bytes_('middle')
+
+    def test_deep_link(self):
+        """Nested objects are linked directly to the root object."""
+        class Header(BinField):
+            _size_ = 32
+            outer = {
+                '_index_': (4, 28),
+                'middle': {
+                    '_index_': (2, 18),
+                    'inner': {
+                        '_index_': (3, 11),
+                        'leaf': (2, 5)
+                    }
+                }
+            }
+
+        header = Header(0)
+        leaf = header.outer.middle.inner.leaf
+        self.assertIs(leaf._BinField__parent_link[0], header)
+        self.assertEqual(leaf._BinField__parent_link[1], 4 + 2 + 3 + 2)
+
+        leaf._value_ = 0b101
+        self.assertEqual(header, 0b101 << 11)
+        self.assertEqual(header.outer.middle.inner, 0b101 << 2)
+
+        header[:] = 0b011 << 11 | 1
+        self.assertEqual(leaf, 0b011)
+        self.assertEqual(header._get_int_('outer.middle.inner.leaf'), 0b011)
+
+        inner = header.outer.middle.inner
+        inner[:] = 0xFF
+        self.assertEqual(header, 0xFF << 9 | 1)
+        self.assertEqual(leaf, 0b111)
+
+        sliced = header[8:24][2:10][1:3]
+        self.assertEqual(sliced._BinField__parent_link, (header, 11))
+        sliced[:] = 0
+        self.assertEqual(header, 0b11110011 << 9 | 1)
+
+    def test_str_plan(self):
+        """Layout of sized classes is compiled once."""
+        from binfield import binfield as binfield_module
+
+        class Frame(BinField):
+            _size_ = 12
+            _mask_ = 0xFBF
+            kind = (0, 2)
+            body = {
+                '_index_': (4, 12),
+                'flag': 0,
+                'data': (4, 8)
+            }
+
+        self.assertEqual(
+            '<2562 == 0x0A02 == (0b101000000010 & 0b111110111111)\n'
+            '  kind = <2 == 0x02 == (0b10 & 0b11)>\n'
+            '  body = \n'
+            '    <160 == 0xA0 == (0b10100000 & 0b11111011)\n'
+            '      flag = <0 == 0x00 == (0b0 & 0b1)>\n'
+            '      data = <10 == 0x0A == (0b1010 & 0b1111)>\n'
+            '    >\n'
+            '>',
+            str(Frame(0xA02))
+        )
+        self.assertIn(Frame, binfield_module._FORMAT_PLANS)
+        self.assertEqual('<10 == 0x0A == (0b1010 & 0b1111)>', str(Frame(0xA02).body.data))
+
+    def test_frozen(self):
+        """Frozen classes are immutable and hashable."""
+        class Key(BinField):
+            _size_ = 16
+            _frozen_ = True
+            kind = (0, 4)
+            body = {
+                '_index_': (4, 16),
+                'flag': 0,
+                'data': (1, 12)
+            }
+
+        class Header(BinField):
+            _size_ = 16
+            kind = (0, 4)
+
+        key = Key(0x1234)
+        self.assertTrue(Key._frozen_)
+        self.assertTrue(key._frozen_)
+        self.assertFalse(Header._frozen_)
+        self.assertFalse(BinField._frozen_)
+        self.assertIs(key._freeze_(), key)
+        self.assertIs(copy.copy(key), key)
+
+        self.assertEqual(hash(key), hash(Key(0x1234)))
+        self.assertEqual({key: 1}[Key(0x1234)], 1)
+        self.assertEqual(key._FrozenBinField__hash, hash(key))  # Cached in own slot
+
+        body = key.body
+        self.assertTrue(body._frozen_)
+        self.assertIsNone(body._BinField__parent_link)
+        self.assertEqual(body.data, 0x91)
+        self.assertTrue(key[0:2]._frozen_)
+        self.assertEqual('body(x=0x0123, base=16)', repr(body))
+
+        with self.assertRaises(TypeError):
+            key.kind = 1
+        with self.assertRaises(TypeError):
+            key[0:4] = 1
+        with self.assertRaises(TypeError):
+            key._value_ = 1
+        with self.assertRaises(TypeError):
+            key._setslice_(slice(0, 4), 1)
+        with self.assertRaises(TypeError):
+            body.flag = 1
+
+        changed = key
+        changed |= 0x0F
+        self.assertEqual(changed, 0x123F)
+        self.assertEqual(key, 0x1234)
+        self.assertTrue(changed._frozen_)
+
+        # Frozen copy of mutable object
+        header = Header(0x1234)
+        frozen = header._freeze_()
+        self.assertTrue(frozen._frozen_)
+        self.assertEqual(sys.getsizeof(frozen), sys.getsizeof(header))  # Hash slot instead of parent link slot
+        self.assertIs(frozen.__class__, Header(0)._freeze_().__class__)
+        self.assertEqual(frozen, header)
+        header.kind = 0
+        self.assertEqual(frozen.kind, 4)
+        self.assertEqual(pickle.loads(pickle.dumps(frozen, -1)), frozen)
+        self.assertTrue(pickle.loads(pickle.dumps(frozen, -1))._frozen_)
+        self.assertEqual(header[4:8]._freeze_(), 3)
+
+        with self.assertRaises(TypeError):
+            BinField.__class__.makecls('Invalid', size=8, frozen=1)
@@ -0,0 +1,150 @@
+"""Batch processing tests."""
+
+import array
+import unittest
+
+from binfield import BinField
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class ZBFrameControl(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    FrameType = [0, 3]
+    Security = 3
+    FramePending = 4
+    AckRequest = 5
+    PAN_ID_Compression = 6
+    SecurityNumberSuppress = 8
+    InformationPresent = 9
+    DstAddrMode = [10, 12]
+    FrameVersion = [12, 14]
+    SrcAddrMode = [14, 16]
+
+
+class NestedBinField(BinField):
+    test_index = 0
+    nested_block = {
+        '_index_': (1, 6),
+        'single_bit': 0,
+        'multiple': (1, 3)
+    }
+    tail = slice(6, None)
+
+
+VALUES = [0x0803, 0xFFFF, 0x0000, 0x8841, 0x1234]
+NESTED_VALUES = [0x0803, 0xFFFF, 0x00C0, 0x8841, 0x1234]
+
+
+class TestDecodeMany(unittest.TestCase):
+    def test_decode(self):
+        columns = ZBFrameControl._decode_many_(VALUES, use_numpy=False)
+        self.assertEqual(list(columns), list(ZBFrameControl._mapping_))
+        for key, column in columns.items():
+            self.assertIsInstance(column, array.array)
+            self.assertEqual(list(column), [int(ZBFrameControl(value)[key]) for value in VALUES])
+
+    def test_decode_keys(self):
+        source = array.array('H', VALUES)
+        columns = ZBFrameControl._decode_many_(source, 'DstAddrMode', 'Security', use_numpy=False)
+        self.assertEqual(list(columns), ['DstAddrMode', 'Security'])
+        self.assertEqual(list(columns['DstAddrMode']), [2, 3, 0, 2, 0])
+
+    def test_decode_nested(self):
+        columns = NestedBinField._decode_many_(
+            iter(NESTED_VALUES), 'nested_block', 'nested_block.multiple', 'tail', use_numpy=False
+        )
+        for idx, value in enumerate(NESTED_VALUES):
+            bf = NestedBinField(value)
+            self.assertEqual(columns['nested_block'][idx], bf.nested_block)
+            self.assertEqual(columns['nested_block.multiple'][idx], bf.nested_block.multiple)
+            self.assertEqual(columns['tail'][idx], bf.tail)
+
+    def test_decode_wide(self):
+        class WideBinField(BinField):
+            _size_ = 128
+            low = (0, 64)
+            high = (64, 128)
+
+        value = (0xDEADBEEF << 64) | 0x0123456789ABCDEF
+        columns = WideBinField._decode_many_([value], use_numpy=False)
+        self.assertEqual(columns['low'][0], 0x0123456789ABCDEF)
+        self.assertEqual(columns['high'][0], 0xDEADBEEF)
+
+    def test_negative(self):
+        with self.assertRaises(IndexError):
+            BinField._decode_many_(VALUES)
+        with self.assertRaises(IndexError):
+            ZBFrameControl._decode_many_(VALUES, 'nonexistent', use_numpy=False)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_numpy(self):
+        columns = ZBFrameControl._decode_many_(numpy.array(VALUES, dtype=numpy.uint16))
+        for key, column in columns.items():
+            self.assertIsInstance(column, numpy.ndarray)
+            self.assertEqual(column.tolist(), [int(ZBFrameControl(value)[key]) for value in VALUES])
+
+        columns = NestedBinField._decode_many_(NESTED_VALUES, 'nested_block.multiple', 'tail', use_numpy=True)
+        self.assertEqual(columns['tail'].tolist(), [int(NestedBinField(value).tail) for value in NESTED_VALUES])
+
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_numpy_wide(self):
+        wide = BinField.__class__.makecls('Wide', mapping={'low': (0, 4), 'high': (4, 72)}, size=72)
+        values = [0x12 | (1 << 70), 0xFF | (0xABCDEF << 40)]
+        with self.assertRaises(OverflowError):
+            wide._decode_many_(values, use_numpy=True)
+        columns = wide._decode_many_(values)  # Fallback to python integers
+        self.assertEqual(columns['low'], array.array('Q', [0x2, 0xF]))
+        self.assertEqual(columns['high'], [value >> 4 for value in values])  # 68 bits: list
+
+        unsized = BinField.__class__.makecls('Unsized', mapping={'low': (0, 8), 'high': (64, 72)})
+        with self.assertRaises(OverflowError):
+            unsized._decode_many_(numpy.array([0x1234], dtype=numpy.uint64), use_numpy=True)
+        columns = unsized._decode_many_(numpy.array([0x1234], dtype=numpy.uint64))
+        self.assertEqual(columns['low'], array.array('Q', [0x34]))
+        self.assertEqual(columns['high'], array.array('Q', [0]))
+
+        self.assertIsInstance(unsized._decode_many_(numpy.array([0x1234]), 'low')['low'], numpy.ndarray)
+
+
+class TestEncodeMany(unittest.TestCase):
+    def test_encode(self):
+        columns = ZBFrameControl._decode_many_(VALUES, use_numpy=False)
+        self.assertEqual(ZBFrameControl._encode_many_(columns), [value & 0xFF7F for value in VALUES])
+
+    def test_encode_partial_nested(self):
+        packed = NestedBinField._encode_many_({'test_index': [1, 0], 'nested_block.multiple': array.array('B', [3, 1])})
+        self.assertEqual(packed, [0b1101, 0b0100])
+        self.assertEqual(NestedBinField(packed[0]).nested_block.multiple, 3)
+
+    def test_encode_buffer(self):
+        columns = {'FrameType': [3, 1], 'DstAddrMode': [2, 3]}
+        self.assertEqual(ZBFrameControl._encode_many_(columns, byteorder='little'), b'\x03\x08\x01\x0c')
+        self.assertEqual(ZBFrameControl._encode_many_(columns, byteorder='big'), b'\x08\x03\x0c\x01')
+        self.assertEqual(ZBFrameControl._encode_many_({}), [])
+
+    def test_negative(self):
+        with self.assertRaises(ValueError):
+            ZBFrameControl._encode_many_({'FrameType': [8]})  # bigger, than record
+        with self.assertRaises(ValueError):
+            ZBFrameControl._encode_many_({'FrameType': [-1]})
+        with self.assertRaises(ValueError):
+            ZBFrameControl._encode_many_({'FrameType': [1, 2], 'Security': [1]})
+        with self.assertRaises(ValueError):
+            NestedBinField._encode_many_({'nested_block': [1], 'nested_block.single_bit': [1]})
+        with self.assertRaises(TypeError):
+            ZBFrameControl._encode_many_({'FrameType': [1.0]})
+        with self.assertRaises(IndexError):
+            ZBFrameControl._encode_many_({'nonexistent': [1]})
+        with self.assertRaises(IndexError):
+            NestedBinField._encode_many_({'tail': [1]})  # bounds depend on value
+        with self.assertRaises(ValueError):
+            NestedBinField._encode_many_({'test_index': [1]}, byteorder='big')  # size is not defined
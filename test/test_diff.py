@@ -0,0 +1,56 @@
+"""Field-level diff tests."""
+
+import unittest
+
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class Register(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    mode = (0, 3)
+    enabled = 3
+    status = {'_index_': (8, 16), 'error': 0, 'code': (1, 4), 'inner': {'_index_': (4, 8), 'low': (0, 2), 'high': (2, 4)}}
+
+
+class Unsized(BinField):
+    head = (0, 4)
+    tail = slice(4, None)
+
+
+class TestDiff(unittest.TestCase):
+    def test_diff(self):
+        old = Register(0x1234)
+        self.assertEqual(old._diff_(0x1234), {})
+        self.assertEqual(old._diff_(0x1234 | 0x80), {})  # Masked bits are not compared
+        self.assertEqual(old._diff_(Register(0x123C)), {'enabled': (0, 1)})
+        self.assertEqual(
+            old._diff_(0x9235),
+            {'mode': (4, 5), 'status.inner.high': (0, 2)},
+        )
+        self.assertEqual(
+            old._diff_(0x1334),
+            {'status.error': (0, 1)},
+        )
+        self.assertEqual(old.status._diff_(0x13), {'error': (0, 1)})  # Linked child
+
+    def test_diff_many(self):
+        snapshots = [0x1234, Register(0x1234), 0x123C, 0x133C]
+        self.assertEqual(
+            Register._diff_many_(snapshots),
+            [{}, {'enabled': (0, 1)}, {'status.error': (0, 1)}],
+        )
+        self.assertEqual(Register._diff_many_(iter([0x1234])), [])
+
+    def test_unsized(self):
+        self.assertEqual(Unsized(0x123)._diff_(0x1233), {'tail': (0x12, 0x123)})
+        self.assertEqual(Unsized._diff_many_([0x123, 0x124, 0x1234]), [{'head': (3, 4)}, {'tail': (0x12, 0x123)}])
+
+    def test_negative(self):
+        with self.assertRaises(IndexError):
+            BinField(1)._diff_(2)
+        with self.assertRaises(TypeError):
+            Register(1)._diff_('2')
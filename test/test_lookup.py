@@ -0,0 +1,158 @@
+"""Lookup table decode tests."""
+
+import unittest
+
+import binfield
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member,unused-variable
+
+
+class Plain(BinField):
+    _size_ = 12
+    low = (0, 4)
+    flag = 4
+    high = (5, 12)
+
+
+class Tabled(BinField):
+    _size_ = 12
+    _lookup_size_ = None
+    low = (0, 4)
+    flag = 4
+    high = (5, 12)
+
+
+class Capped(BinField):
+    _size_ = 8
+    _lookup_size_ = 2
+    low = (0, 4)
+    high = (4, 8)
+
+
+class FrozenTabled(BinField):
+    _size_ = 8
+    _frozen_ = True
+    _lookup_size_ = None
+    low = (0, 4)
+    high = (4, 8)
+
+
+class TestLookup(unittest.TestCase):
+    def setUp(self):
+        for cls in (Tabled, Capped, FrozenTabled):
+            cls._lookup_.cache_clear()
+
+    def test_disabled(self):
+        self.assertIsNone(Plain._lookup_)
+        self.assertIsNone(BinField._lookup_)
+        self.assertIsNone(Tabled(0xABC)[0:4]._lookup_)  # Child classes are not opted in
+        self.assertIsNone(Tabled(0xABC).high._lookup_)
+
+    def test_ints(self):
+        for value in (0, 1, 0x10, 0xABC, 0xFFF, 0x1ABC, -1):
+            self.assertEqual(Tabled._lookup_.get_ints(value), Plain(value)._get_ints_())
+        self.assertEqual(Tabled._lookup_.get_ints(0xABC), Tabled(0xABC)._get_ints_())
+        self.assertIs(Tabled._lookup_.get_ints(0xABC), Tabled._lookup_.get_ints(0xABC))  # Stored
+
+        values = list(range(0, 0x1000, 7))
+        self.assertEqual(Tabled._lookup_.get_many(values), [Plain(value)._get_ints_() for value in values])
+        self.assertEqual(Tabled._lookup_.get_many(iter(values)), [Plain(value)._get_ints_() for value in values])
+        self.assertEqual(Capped._lookup_.get_many([0, 1, 2, 0]), [(0, 0), (1, 0), (2, 0), (0, 0)])
+
+    def test_frozen(self):
+        obj = Tabled._lookup_.get_frozen(0xABC)
+        self.assertIs(obj, Tabled._lookup_.get_frozen(0xABC))
+        self.assertTrue(obj._frozen_)
+        self.assertEqual(obj, Tabled(0xABC))
+        self.assertEqual(obj.high, Tabled(0xABC).high)
+        with self.assertRaises(TypeError):
+            obj.low = 0
+
+        zero = Tabled._lookup_.get_frozen(0)  # Falsy object is stored too
+        self.assertFalse(zero)
+        self.assertIs(zero, Tabled._lookup_.get_frozen(0))
+        self.assertIs(Capped._lookup_.get_frozen(0), Capped._lookup_.get_frozen(0))
+
+        obj = FrozenTabled._lookup_.get_frozen(0x12)
+        self.assertIsInstance(obj, FrozenTabled)
+        self.assertIs(obj, FrozenTabled._lookup_.get_frozen(0x12))
+
+    def test_cap(self):
+        table = Capped._lookup_
+        self.assertEqual([table.get_ints(value) for value in (1, 2, 3)], [(1, 0), (2, 0), (3, 0)])
+        self.assertEqual(len(table), 2)
+        self.assertIsNot(table.get_ints(3), table.get_ints(3))  # Not stored: limit reached
+        self.assertIs(table.get_ints(1), table.get_ints(1))
+        self.assertEqual(repr(table), '<_LookupTable: ints=2, objects=0, maxsize=2>')
+
+        self.assertIsInstance(table._LookupTable__ints, dict)  # Capped: memory is limited by stored entries
+        self.assertEqual(len(table._LookupTable__ints), 2)
+        self.assertIsInstance(Tabled._lookup_.get_many([1]), list)
+        self.assertIsInstance(Tabled._lookup_._LookupTable__ints, list)
+
+        table.cache_clear()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.get_ints(0x21), (1, 2))
+
+    def test_stream(self):
+        data = bytes(range(256)) * 2
+        expected = list(binfield.iter_records(data, Plain, byteorder='little', raw=True, chunk_records=10))
+        records = list(binfield.iter_records(data, Tabled, byteorder='little', raw=True, chunk_records=10))
+        self.assertEqual(records, expected)
+        self.assertEqual(
+            list(binfield.iter_records(data, Tabled, byteorder='little', raw=True, keys=('high',))),
+            [(value,) for _, _, value in expected],
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, 'up to 16 bits'):
+
+            class Big(BinField):
+                _size_ = 17
+                _lookup_size_ = None
+                low = (0, 4)
+
+        with self.assertRaisesRegex(ValueError, 'mapped classes'):
+
+            class Unmapped(BinField):
+                _size_ = 8
+                _lookup_size_ = None
+
+        with self.assertRaisesRegex(ValueError, 'defined size'):
+
+            class Unsized(BinField):
+                _lookup_size_ = None
+                low = (0, 4)
+
+        with self.assertRaises(ValueError):
+
+            class Negative(BinField):
+                _size_ = 8
+                _lookup_size_ = -1
+                low = (0, 4)
+
+        with self.assertRaises(TypeError):
+
+            class Invalid(BinField):
+                _size_ = 8
+                _lookup_size_ = 'all'
+                low = (0, 4)
+
+        with self.assertRaises(TypeError):
+
+            class Enabled(BinField):
+                _size_ = 8
+                _lookup_size_ = True
+                low = (0, 4)
+
+        with self.assertRaises(TypeError):
+
+            class Disabled(BinField):
+                _size_ = 8
+                _lookup_size_ = False
+                low = (0, 4)
+
+        with self.assertRaises(TypeError):
+            binfield.binfield._LookupTable(0xFF, True)
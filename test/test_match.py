@@ -0,0 +1,94 @@
+"""Compiled match predicates tests."""
+
+import array
+import unittest
+
+from binfield import BinField
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class ZBFrameControl(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    FrameType = [0, 3]
+    Security = 3
+    FramePending = 4
+    DstAddrMode = [10, 12]
+    nested = {'_index_': (12, 16), 'low': (0, 2), 'high': (2, 4)}
+
+
+VALUES = list(range(0, 0x10000, 0x0123))
+
+
+def expected(**fields):
+    return [value for value in VALUES if all(ZBFrameControl(value)._get_int_(key) == val for key, val in fields.items())]
+
+
+class TestMatch(unittest.TestCase):
+    def test_match(self):
+        match = ZBFrameControl._match_(FrameType=3, Security=1)
+        self.assertEqual((match.mask, match.value), (0b1111, 0b1011))
+        self.assertTrue(match(0x120B))
+        self.assertFalse(match(0x1203))
+        self.assertTrue(match(ZBFrameControl(0x120B)))
+        self.assertTrue(match(ZBFrameControl(0xFF0B)[0:8]))
+        self.assertEqual(match.test_many([0x0B, 0x03]), [True, False])
+        self.assertEqual(match.filter(VALUES), expected(FrameType=3, Security=1))
+        self.assertIn('value & 0xF == 0xB', repr(match))
+
+    def test_nested(self):
+        match = ZBFrameControl._match_({'nested.high': 2}, DstAddrMode=1)
+        self.assertEqual(match.filter(VALUES), expected(**{'nested.high': 2, 'DstAddrMode': 1}))
+        # Consistent intersection is allowed
+        match = ZBFrameControl._match_({'nested.high': 2, 'nested': 0b1001})
+        self.assertEqual(match.filter(VALUES), expected(nested=0b1001))
+
+    def test_sources(self):
+        match = ZBFrameControl._match_(FramePending=1)
+        objects = [ZBFrameControl(value) for value in VALUES]
+        filtered = match.filter(objects)
+        self.assertEqual([VALUES[objects.index(obj)] for obj in filtered], expected(FramePending=1))
+        self.assertTrue(all(isinstance(obj, ZBFrameControl) for obj in filtered))
+        self.assertEqual(match.filter(array.array('Q', VALUES)), expected(FramePending=1))
+        self.assertEqual(match.filter(iter(VALUES)), expected(FramePending=1))
+        self.assertEqual(match.test_many(VALUES), [match(value) for value in VALUES])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        match = ZBFrameControl._match_(FrameType=1, DstAddrMode=2)
+        data = numpy.array(VALUES, dtype=numpy.uint64)
+        flags = match.test_many(data)
+        self.assertIsInstance(flags, numpy.ndarray)
+        self.assertEqual(flags.tolist(), match.test_many(VALUES))
+        self.assertEqual(match.filter(data).tolist(), expected(FrameType=1, DstAddrMode=2))
+
+        # Default integer dtype is signed
+        data = numpy.array(VALUES)
+        self.assertEqual(data.dtype, numpy.int64)
+        self.assertEqual(match.test_many(data).tolist(), match.test_many(VALUES))
+        filtered = match.filter(data)
+        self.assertEqual(filtered.dtype, numpy.int64)
+        self.assertEqual(filtered.tolist(), expected(FrameType=1, DstAddrMode=2))
+        self.assertEqual(match.test_many(numpy.array([-1, 0x0409])).tolist(), [match(-1), match(0x0409)])
+
+    def test_negative(self):
+        with self.assertRaises(IndexError):
+            ZBFrameControl._match_(unknown=1)
+        with self.assertRaises(TypeError):
+            ZBFrameControl._match_(Security='1')
+        with self.assertRaises(ValueError):
+            ZBFrameControl._match_(Security=-1)
+        with self.assertRaises(ValueError):
+            ZBFrameControl._match_(FrameType=8)
+        with self.assertRaises(ValueError):
+            ZBFrameControl._match_({'nested.low': 1}, nested=0)
+        masked = BinField.__class__.makecls('Masked', mapping={'record': (0, 4)}, mask=0b1011, size=4)
+        with self.assertRaises(ValueError):
+            masked._match_(record=0b0100)
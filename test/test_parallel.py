@@ -0,0 +1,114 @@
+"""Parallel file decode tests."""
+
+import array
+import concurrent.futures
+import os
+import tempfile
+import unittest
+
+import binfield
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class Word(BinField):
+    _size_ = 16
+    low = (0, 8)
+    high = (8, 16)
+
+
+class Nested(BinField):
+    _size_ = 16
+    low = (0, 8)
+    high = {
+        '_index_': (8, 16),
+        'flag': 0,
+        'rest': (1, 8),
+    }
+
+
+class Triple(BinField):
+    _size_ = 24
+    head = (0, 4)
+    tail = (4, 24)
+
+
+VALUES = list(range(0, 0xFFFF, 0x0FF1))
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as dst:
+            dst.write(b''.join(value.to_bytes(2, 'little') for value in VALUES))
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def check(self, columns, keys=('low', 'high')):
+        expected = Word._decode_many_(VALUES, *keys, use_numpy=False)
+        self.assertEqual(list(columns), list(keys))
+        for key in keys:
+            self.assertIsInstance(columns[key], array.array)
+            self.assertEqual(columns[key], expected[key])
+
+    def test_in_process(self):
+        self.check(binfield.decode_parallel(self.path, Word, byteorder='little', workers=1, task_records=3))
+
+    def test_executor(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            columns = binfield.decode_parallel(
+                self.path, Word, 'high', byteorder='little', task_records=4, executor=executor
+            )
+        self.check(columns, keys=('high',))
+
+    def test_process_pool_generated_class(self):
+        # Not importable class: workers receive schema
+        cls = BinField.__class__.makecls('Generated', mapping={'low': (0, 8), 'high': (8, 16)}, size=16)
+        columns = binfield.decode_parallel(self.path, cls, byteorder='little', workers=2, task_records=5)
+        self.check(columns)
+
+    def test_process_pool_open_slice(self):
+        cls = BinField.__class__.makecls('OpenTail', mapping={'low': (0, 8), 'high': slice(8, None)}, size=16)
+        columns = binfield.decode_parallel(self.path, cls, byteorder='little', workers=2, task_records=5)
+        self.check(columns)
+
+    def test_not_native_size(self):
+        data = bytes(range(12))
+        with open(self.path, 'wb') as dst:
+            dst.write(data)
+        columns = binfield.decode_parallel(self.path, Triple, workers=1, task_records=3)
+        records = [0x000102, 0x030405, 0x060708, 0x090A0B]
+        self.assertEqual(list(columns['head']), [record & 0xF for record in records])
+        self.assertEqual(list(columns['tail']), [record >> 4 for record in records])
+
+    def test_nested(self):
+        columns = binfield.decode_parallel(self.path, Nested, 'high.rest', byteorder='little', workers=1)
+        self.assertEqual(list(columns['high.rest']), [value >> 9 for value in VALUES])
+
+    def test_empty(self):
+        with open(self.path, 'wb'):
+            pass
+        self.assertEqual(binfield.decode_parallel(self.path, Word, 'low'), {'low': array.array('Q')})
+
+    def test_errors(self):
+        with open(self.path, 'ab') as dst:
+            dst.write(b'\x00')
+        with self.assertRaises(ValueError):
+            binfield.decode_parallel(self.path, Word)
+        with self.assertRaises(ValueError):
+            binfield.decode_parallel(self.path, Word, byteorder='middle')
+        with self.assertRaises(ValueError):
+            binfield.decode_parallel(self.path, Word, task_records=0)
+        with self.assertRaises(ValueError):
+            binfield.decode_parallel(self.path, BinField)
+        with self.assertRaises(IndexError):
+            binfield.decode_parallel(self.path, Word, 'unknown')
+        with self.assertRaises(IndexError):
+            binfield.decode_parallel(self.path, Word, 'low.unknown')
+        with self.assertRaises(IndexError):
+            binfield.decode_parallel(self.path, Nested, 'high.unknown')
+        with self.assertRaises(IndexError):
+            binfield.decode_parallel(self.path, Nested, 'high.flag.unknown')
@@ -0,0 +1,141 @@
+"""Pickle protocol tests."""
+
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+import binfield
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class Frame(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    kind = (0, 3)
+    flag = 3
+    body = {
+        '_index_': (8, 16),
+        'low': (0, 4),
+        'high': (4, 8)
+    }
+
+
+def make_dynamic():
+    return BinField.__class__.makecls(
+        'Dynamic',
+        mapping={'low': (0, 4), 'nested': {'_index_': (4, 20), 'bit': 0, 'rest': (1, 16)}},
+        size=24,
+    )
+
+
+RESTORE_SCRIPT = """
+import pickle, sys
+records = pickle.loads(sys.stdin.buffer.read())
+print(type(records).__name__, records._get_int_('nested.rest'), type(records)._schema_())
+"""
+
+
+class TestPickle(unittest.TestCase):
+    def test_importable(self):
+        obj = Frame(0x1234)
+        restored = pickle.loads(pickle.dumps(obj, -1))
+        self.assertIs(restored.__class__, Frame)
+        self.assertEqual(restored, obj)
+        self.assertIsNot(restored, obj)
+
+    def test_schema(self):
+        self.assertEqual(
+            ('Frame', 16, 0xFF7F, (('kind', (0, 3)), ('flag', 3), ('body', (('_index_', (8, 16)), ('low', (0, 4)), ('high', (4, 8))))), False),
+            Frame._schema_()
+        )
+
+        cls = BinField.__class__.from_schema(Frame._schema_())
+        self.assertIsNot(cls, Frame)
+        self.assertIs(cls, BinField.__class__.from_schema(list(Frame._schema_())))  # memorized
+        self.assertEqual(cls._schema_(), Frame._schema_())
+        self.assertEqual(str(cls(0x1234)), str(Frame(0x1234)))
+
+    def test_dynamic(self):
+        dynamic = make_dynamic()
+        obj = dynamic(0xABCDEF)
+
+        restored = pickle.loads(pickle.dumps(obj, -1))
+        self.assertEqual(restored, obj)
+        self.assertEqual(restored._schema_(), dynamic._schema_())
+        self.assertIs(restored.__class__, pickle.loads(pickle.dumps(obj)).__class__)
+        self.assertEqual(restored.nested.rest, obj.nested.rest)
+
+        # Child classes are not importable by name
+        child = pickle.loads(pickle.dumps(Frame(0x1234).body.__copy__()))
+        self.assertEqual(child, 0x12)
+        self.assertEqual(child.high, 1)
+        self.assertEqual(pickle.loads(pickle.dumps(Frame(0x1234)[4:12].__copy__())), 0x23)
+
+        with self.assertRaises(ValueError):
+            pickle.dumps(Frame(0x1234).body, -1)  # Linked object
+
+    def test_open_slice(self):
+        cls = BinField.__class__.makecls('OpenTail', mapping={'head': (0, 4), 'tail': slice(4, None)})
+        self.assertEqual(('OpenTail', None, None, (('head', (0, 4)), ('tail', (4, None))), False), cls._schema_())
+
+        obj = cls(0x1234)
+        restored = pickle.loads(pickle.dumps(obj, -1))
+        self.assertEqual(restored, obj)
+        self.assertEqual(restored.tail, 0x123)
+        self.assertEqual(restored._schema_(), cls._schema_())
+        self.assertEqual(binfield.loads_many(binfield.dumps_many([obj, cls(0x56)])), [obj, cls(0x56)])
+
+        frozen = obj._freeze_()
+        self.assertTrue(frozen._frozen_)
+        self.assertEqual(frozen.tail, 0x123)
+
+    def test_other_process(self):
+        env = dict(os.environ)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(binfield.__file__)))
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, (root, env.get('PYTHONPATH'))))
+        output = subprocess.check_output(
+            [sys.executable, '-c', RESTORE_SCRIPT],
+            input=pickle.dumps(make_dynamic()(0xABCDEF)),
+            env=env,
+        )
+        self.assertEqual(
+            "Dynamic 24175 ('Dynamic', 24, None, (('low', (0, 4)), "
+            "('nested', (('_index_', (4, 20)), ('bit', 0), ('rest', (1, 16))))), False)",
+            output.decode().strip()
+        )
+
+
+class TestBatch(unittest.TestCase):
+    def test_sized(self):
+        for cls, values in (
+            (Frame, [0, 0x1234, 0xFF7F]),
+            (make_dynamic(), [0, 0xABCDEF, 0xFFFFFF]),
+        ):
+            records = [cls(value) for value in values]
+            data = binfield.dumps_many(records)
+            restored = binfield.loads_many(data)
+            self.assertEqual(restored, values)
+            self.assertEqual(restored[0]._schema_(), cls._schema_())
+            self.assertLess(len(data), len(pickle.dumps(records)))
+
+    def test_not_sized(self):
+        values = [0, 1, 2 ** 70]
+        restored = binfield.loads_many(binfield.dumps_many([BinField(value) for value in values], protocol=2))
+        self.assertEqual(restored, values)
+        self.assertIsInstance(restored[0], BinField)
+
+    def test_special(self):
+        self.assertEqual([], binfield.loads_many(binfield.dumps_many([])))
+
+        linked = Frame(0x1234).body
+        restored = binfield.loads_many(binfield.dumps_many([linked]))
+        self.assertEqual(restored, [0x12])
+        self.assertEqual(restored[0].__class__._schema_(), linked.__class__._schema_())
+
+        with self.assertRaises(TypeError):
+            binfield.dumps_many([Frame(1), BinField(1)])
@@ -0,0 +1,111 @@
+"""Composite records tests."""
+
+import pickle
+import struct
+import unittest
+
+import binfield
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class FrameControl(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    FrameType = [0, 3]
+    Security = 3
+    DstAddrMode = [10, 12]
+
+
+class Sequence(BinField):
+    _size_ = 8
+
+
+class Address(BinField):
+    _size_ = 24  # Not native size
+    low = (0, 8)
+    high = (8, 24)
+
+
+class Header(binfield.Record):
+    control = FrameControl
+    sequence = Sequence
+    address = Address
+    pan = Sequence
+
+
+DATA = struct.pack('<HB', 0x88C1, 0x05) + (0x123456).to_bytes(3, 'little') + b'\xAA'
+
+
+class TestRecord(unittest.TestCase):
+    def test_layout(self):
+        self.assertEqual(Header._size_, 56)
+        self.assertEqual(Header.control, FrameControl)
+        self.assertEqual(
+            Header._members_,
+            {'control': (FrameControl, 0, 2), 'sequence': (Sequence, 2, 1), 'address': (Address, 3, 3), 'pan': (Sequence, 6, 1)},
+        )
+
+    def test_decode(self):
+        header = Header._from_bytes_(b'\x00' + DATA, byteorder='little', offset=1)
+        self.assertEqual(len(header), 7)
+        self.assertEqual(header.control, 0x8841)  # Masked
+        self.assertIsInstance(header.control, FrameControl)
+        self.assertIs(header.control, header.control)
+        self.assertEqual(header.address.high, 0x1234)
+        self.assertEqual(header._get_int_('address.low'), 0x56)
+        self.assertEqual(header._get_int_('control.DstAddrMode'), 2)
+        self.assertEqual(header._get_int_('pan'), 0xAA)
+        self.assertEqual(header._to_bytes_('little'), DATA[:0] + struct.pack('<HB', 0x8841, 5) + DATA[3:])
+        self.assertEqual(Header._from_bytes_(header._to_bytes_()), header)
+        self.assertEqual(repr(header), 'Header(control=0x8841, sequence=0x05, address=0x123456, pan=0xAA)')
+
+    def test_modify(self):
+        header = Header(0x8841, pan=0xAB)
+        self.assertEqual(header._get_values_(), [0x8841, 0, 0, 0xAB])
+        header.control.FrameType = 2  # Member object is kept
+        self.assertEqual(header._get_int_('control'), 0x8842)
+        header.address.low = 0xFF
+        self.assertEqual(header._get_int_('address.low'), 0xFF)
+        header.sequence = Sequence(7)
+        header.pan = 0x1FF  # Masked by member class
+        self.assertEqual(header._get_values_(), [0x8842, 7, 0xFF, 0xFF])
+        self.assertEqual(pickle.loads(pickle.dumps(header)), header)
+
+    def test_negative(self):
+        with self.assertRaises(TypeError):
+            Header(1, 2, 3, 4, 5)
+        with self.assertRaises(TypeError):
+            Header(unknown=1)
+        with self.assertRaises(TypeError):
+            Header(control='1')
+        with self.assertRaises(ValueError):
+            Header._from_bytes_(DATA[:-1])
+        with self.assertRaises(ValueError):
+            Header._from_bytes_(DATA, byteorder='middle')
+        with self.assertRaises(ValueError):
+            Header._from_bytes_(DATA, offset=-1)
+        with self.assertRaises(IndexError):
+            Header()._get_int_('unknown')
+        with self.assertRaises(TypeError):
+
+            class Empty(binfield.Record):
+                pass
+
+        with self.assertRaises(ValueError):
+
+            class Unsized(binfield.Record):
+                member = BinField
+
+        with self.assertRaises(TypeError):
+
+            class Extended(Header):
+                pass
+
+        with self.assertRaises(TypeError):
+
+            class Garbage(binfield.Record):
+                seq = Sequence
+                junk = 5
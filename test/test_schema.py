@@ -0,0 +1,133 @@
+"""Layouts from plain data tests."""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import binfield
+from binfield import BinField
+from binfield import schema
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class Frame(BinField):
+    _size_ = 16
+    kind = (0, 3)
+    flag = 3
+    body = {'_index_': (8, 16), 'low': (0, 4), 'high': {'_index_': (4, 8), 'bit': 1}}
+
+
+DESCRIPTOR = {
+    'size': 16,
+    'mapping': {'kind': [0, 3], 'flag': 3, 'body': {'_index_': [8, 16], 'low': [0, 4], 'high': {'_index_': [4, 8], 'bit': 1}}},
+}
+
+
+class TestSchema(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def assertSameLayout(self, cls, reference):
+        self.assertEqual(cls._size_, reference._size_)
+        self.assertEqual(cls._mask_, reference._mask_)
+        self.assertEqual(cls._mapping_, reference._mapping_)
+        self.assertEqual(cls._int_accessors_, reference._int_accessors_)
+        for value in (0, 0x1234, 0xFFFF):
+            self.assertEqual(str(cls(value)), str(reference(value)).replace('<Frame(', f'<{cls.__name__}('))
+
+    def test_no_cache(self):
+        cls = binfield.make_class('Frame', DESCRIPTOR)
+        self.assertSameLayout(cls, Frame)
+        self.assertEqual(cls(0x1234).body.high.bit, Frame(0x1234).body.high.bit)
+
+    def test_cache(self):
+        cold = binfield.make_class('Frame', DESCRIPTOR, cache_dir=self.tmp.name)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+
+        with mock.patch('binfield.binfield._prepare_mapping') as prepare, mock.patch(
+            'binfield.binfield._make_int_accessors'
+        ) as resolve:
+            warm = binfield.make_class('Frame', DESCRIPTOR, cache_dir=self.tmp.name)
+            obj = warm(0x1234)
+            obj.body.high.bit = 1  # Nested classes are created from resolved layout too
+            prepare.assert_not_called()
+            resolve.assert_not_called()
+
+        self.assertIsNot(warm, cold)
+        self.assertSameLayout(warm, Frame)
+        self.assertEqual(obj, 0x1234 | 1 << 13)
+
+    def test_cache_env(self):
+        with mock.patch.dict(os.environ, {binfield.schema.CACHE_DIR_ENV: self.tmp.name}):
+            binfield.make_class('Frame', DESCRIPTOR)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+
+    def test_cache_key(self):
+        binfield.make_class('Frame', DESCRIPTOR, cache_dir=self.tmp.name)
+        binfield.make_class('Frame', dict(DESCRIPTOR, frozen=True), cache_dir=self.tmp.name)
+        binfield.make_class('Other', DESCRIPTOR, cache_dir=self.tmp.name)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 3)
+
+    def test_broken_cache(self):
+        binfield.make_class('Frame', DESCRIPTOR, cache_dir=self.tmp.name)
+        (entry,) = os.listdir(self.tmp.name)
+        with open(os.path.join(self.tmp.name, entry), 'w') as dst:
+            dst.write('{"format": 1')
+
+        self.assertSameLayout(binfield.make_class('Frame', DESCRIPTOR, cache_dir=self.tmp.name), Frame)
+        with open(os.path.join(self.tmp.name, entry)) as src:
+            self.assertEqual(json.load(src)['format'], schema.LAYOUT_FORMAT)  # Re-written
+
+    def test_frozen_masked(self):
+        cls = binfield.make_class(
+            'Flags', {'mask': 0b1011, 'frozen': True, 'mapping': {'a': [0, 2], 'b': 3}}, cache_dir=self.tmp.name
+        )
+        warm = binfield.make_class(
+            'Flags', {'mask': 0b1011, 'frozen': True, 'mapping': {'a': [0, 2], 'b': 3}}, cache_dir=self.tmp.name
+        )
+        for item in cls, warm:
+            self.assertTrue(item._frozen_)
+            self.assertEqual(item._mask_, 0b1011)
+            self.assertEqual(item._int_accessors_, {'a': (0, 0b11, 2), 'b': (3, 0b1000, 1)})
+            self.assertEqual(hash(item(0b1111).a), hash(item(0b11).a))
+
+    def test_load_schema(self):
+        source = {'Frame': DESCRIPTOR, 'Word': {'size': 16, 'mapping': {'low': [0, 8], 'high': [8, 16]}}}
+        path = os.path.join(self.tmp.name, 'schema.json')
+        with open(path, 'w') as dst:
+            json.dump(source, dst)
+
+        for src in (source, path, io.StringIO(json.dumps(source))):
+            classes = binfield.load_schema(src)
+            self.assertEqual(list(classes), ['Frame', 'Word'])
+            self.assertSameLayout(classes['Frame'], Frame)
+            self.assertEqual(classes['Word'](0x1234).high, 0x12)
+
+    def test_open_slice(self):
+        class Tail(BinField):
+            head = (0, 4)
+            tail = slice(4, None)
+
+        for cache_dir in (None, self.tmp.name, self.tmp.name):  # Cache miss and hit
+            cls = binfield.make_class('Tail', {'mapping': {'head': [0, 4], 'tail': [4, None]}}, cache_dir=cache_dir)
+            self.assertEqual(cls._mapping_, Tail._mapping_)
+            self.assertEqual(cls._schema_(), Tail._schema_())
+            self.assertEqual(cls(0x1234).tail, 0x123)
+
+        with self.assertRaises(IndexError):
+            binfield.make_class('Tail', {'mapping': {'head': [0, None], 'tail': [4, None]}})
+
+    def test_negative(self):
+        with self.assertRaises(ValueError):
+            binfield.make_class('Frame', {'size': 16, 'unexpected': 1})
+        with self.assertRaises(IndexError):
+            binfield.make_class('Frame', {'size': 16, 'mapping': {'a': [0, 4], 'b': [2, 6]}}, cache_dir=self.tmp.name)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+        with self.assertRaises(TypeError):
+            binfield.load_schema(io.StringIO('[]'))
@@ -0,0 +1,123 @@
+"""Instrumentation counters tests."""
+
+import gc
+import unittest
+import weakref
+
+from binfield import BinField
+from binfield import stats
+from binfield import binfield as binfield_module
+
+
+# pylint: disable=protected-access,missing-docstring,no-member,pointless-statement
+
+
+class Frame(BinField):
+    _size_ = 16
+    kind = (0, 4)
+    body = {'_index_': (8, 16), 'low': (0, 4)}
+
+
+class Unsized(BinField):
+    head = (0, 8)
+    rest = slice(8, None)
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(stats.disable)
+
+    def test_disabled(self):
+        Frame(0x1234).body.low = 1
+        self.assertFalse(stats.is_enabled())
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_counters(self):
+        body = Frame(0).body.__class__
+        stats.enable()
+        self.assertTrue(stats.is_enabled())
+
+        obj = Frame(0x1234)
+        for _ in range(3):
+            obj.kind
+        obj.body.low = 5
+        obj[0:2]
+        obj[0:2]
+        str(obj)
+
+        counters = stats.snapshot()
+        self.assertEqual(counters[stats.StatKey(Frame, 'child.alloc', 'kind')], 3)
+        self.assertEqual(counters[stats.StatKey(Frame, 'child.alloc', 'body')], 1)
+        self.assertEqual(counters[stats.StatKey(body, 'setslice', '0:4')], 1)
+        self.assertEqual(counters[stats.StatKey(body, 'parent.write', None)], 1)
+        self.assertEqual(counters[stats.StatKey(body, 'parent.read', None)], 1)
+        self.assertEqual(counters[stats.StatKey(Frame, 'child_cls.hit', 'Frame_slice_0_2')], 1)
+        self.assertEqual(counters[stats.StatKey(Frame, 'format', None)], 1)
+        self.assertEqual(list(counters.values()), sorted(counters.values(), reverse=True))
+        self.assertEqual(
+            stats.snapshot(cls='Frame', event='child.alloc'),
+            {
+                stats.StatKey(Frame, 'child.alloc', 'kind'): 3,
+                stats.StatKey(Frame, 'child.alloc', 'Frame_slice_0_2'): 2,
+                stats.StatKey(Frame, 'child.alloc', 'body'): 1,
+            },
+        )
+
+        Unsized(0xFFF).rest  # Bounds depend on value
+        self.assertEqual(stats.snapshot(cls='Unsized', event='child.alloc'), {(Unsized, 'child.alloc', 'rest'): 1})
+
+        self.assertEqual(stats.snapshot(cls=Frame), stats.snapshot(cls='Frame'))
+
+        stats.reset()
+        self.assertTrue(stats.is_enabled())
+        self.assertEqual(stats.snapshot(), {})
+        stats.disable()
+        obj.kind
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_same_name_classes(self):
+        class Other(BinField):
+            _size_ = 16
+            body = {'_index_': (0, 8), 'low': (0, 4)}
+
+        stats.enable()
+        Frame(0).body.low
+        Other(0).body.low
+        Other(0)[0:2]
+        Other(0)[0:2]
+
+        frame_body, other_body = Frame(0).body.__class__, Other(0).body.__class__
+        counters = stats.snapshot(event='child.alloc')
+        self.assertEqual(counters[stats.StatKey(frame_body, 'child.alloc', 'low')], 1)
+        self.assertEqual(counters[stats.StatKey(other_body, 'child.alloc', 'low')], 1)
+        self.assertEqual(len(stats.snapshot(cls='body', event='child.alloc')), 2)  # Filter by name: all classes
+
+        self.assertEqual(
+            stats.snapshot(cls=Other, event='child_cls.miss'), {(Other, 'child_cls.miss', 'Other_slice_0_2'): 1}
+        )
+        self.assertEqual(
+            stats.snapshot(cls=Other, event='child_cls.hit'), {(Other, 'child_cls.hit', 'Other_slice_0_2'): 1}
+        )
+
+    def test_classes_not_kept_alive(self):
+        stats.enable()
+        cls = BinField.__class__.makecls('Generated', mapping={'low': (0, 4)}, size=8)
+        obj = cls(0x12)
+        obj.low = 1
+        obj[4:8]
+        self.assertEqual(len(stats.snapshot(cls='Generated')), 3)
+
+        ref = weakref.ref(cls)
+        del cls, obj
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(stats.snapshot(cls='Generated'), {})
+
+    def test_instrumented_methods(self):
+        plain = BinField.__dict__['_setslice_']
+        stats.enable()
+        self.assertIsNot(BinField.__dict__['_setslice_'], plain)
+        stats.disable()
+        self.assertIs(BinField.__dict__['_setslice_'], plain)
+        self.assertIs(binfield_module._INSTRUMENTED['_setslice_'][0], plain)
+
@@ -0,0 +1,207 @@
+"""Streaming decode tests."""
+
+import asyncio
+import io
+import mmap
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import binfield
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class Word(BinField):
+    _size_ = 16
+    low = (0, 8)
+    high = (8, 16)
+
+
+class Masked(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    low = (0, 8)
+    high = (8, 16)
+
+
+class Triple(BinField):
+    _size_ = 24
+    head = (0, 4)
+    tail = (4, 24)
+
+
+VALUES = list(range(0, 0xFFFF, 0x0FFF))
+DATA = b''.join(value.to_bytes(2, 'little') for value in VALUES)
+
+
+class TestStream(unittest.TestCase):
+    def test_buffer(self):
+        for source in (DATA, bytearray(DATA), memoryview(DATA)):
+            records = list(binfield.iter_records(source, Word, byteorder='little', chunk_records=3))
+            self.assertEqual(records, VALUES)
+            self.assertIsInstance(records[0], Word)
+
+    def test_file_object(self):
+        chunks = list(binfield.iter_chunks(io.BytesIO(DATA), Word, byteorder='little', chunk_records=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 4, 4, 1])
+        self.assertEqual(sum(chunks, []), VALUES)
+
+    def test_raw(self):
+        records = list(binfield.iter_records(DATA, Word, byteorder='little', raw=True))
+        self.assertEqual(records, [(value & 0xFF, value >> 8) for value in VALUES])
+
+        records = list(binfield.iter_records(DATA, Word, byteorder='little', raw=True, keys=('high',)))
+        self.assertEqual(records, [(value >> 8,) for value in VALUES])
+
+    def test_not_native_size(self):
+        data = bytes(range(12))
+        records = list(binfield.iter_records(io.BytesIO(data), Triple, chunk_records=3))
+        self.assertEqual(records, [0x000102, 0x030405, 0x060708, 0x090A0B])
+        self.assertEqual(
+            list(binfield.iter_records(data, Triple, raw=True, chunk_records=3)),
+            [(record & 0xF, record >> 4) for record in records],
+        )
+
+    def test_path_mmap(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'capture.bin')
+            with open(path, 'wb') as dst:
+                dst.write(DATA)
+
+            self.assertEqual(list(binfield.iter_records(path, Word, byteorder='little', chunk_records=5)), VALUES)
+
+            with open(path, 'rb') as src, mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(list(binfield.iter_records(mapped, Word, byteorder='little')), VALUES)
+
+    def test_negative(self):
+        with self.assertRaises(ValueError):
+            list(binfield.iter_records(DATA + b'\x01', Word))
+        with self.assertRaises(ValueError):
+            list(binfield.iter_records(io.BytesIO(DATA + b'\x01'), Word))
+        with self.assertRaises(ValueError):
+            list(binfield.iter_records(DATA, BinField))  # size is not defined
+        with self.assertRaises(ValueError):
+            list(binfield.iter_records(DATA, Word, byteorder='middle'))
+        with self.assertRaises(ValueError):
+            list(binfield.iter_records(DATA, Word, chunk_records=0))
+
+
+class FakeWriter:
+    def __init__(self):
+        self.chunks = []
+        self.drained = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+
+    async def drain(self):
+        self.drained += 1
+
+
+def make_reader(*parts):
+    reader = asyncio.StreamReader()
+    for part in parts:
+        reader.feed_data(part)
+    reader.feed_eof()
+    return reader
+
+
+def collect(func, *parts, **kwargs):
+    async def run():
+        return [item async for item in func(make_reader(*parts), Word, byteorder='little', **kwargs)]
+
+    return asyncio.run(run())
+
+
+class TestAsyncStream(unittest.TestCase):
+    def test_batches(self):
+        # Records are split between parts: incomplete record is kept for the next batch
+        chunks = collect(binfield.aiter_chunks, DATA[:3], DATA[3:8], DATA[8:], chunk_records=4)
+        self.assertEqual([value for chunk in chunks for value in chunk], VALUES)
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        self.assertIsInstance(chunks[0][0], Word)
+
+    def test_single_read_per_batch(self):
+        calls = []
+        read = asyncio.StreamReader.read
+
+        async def counted_read(reader, n=-1):
+            calls.append(n)
+            return await read(reader, n)
+
+        with mock.patch.object(asyncio.StreamReader, 'read', counted_read):
+            records = collect(binfield.aiter_records, DATA, chunk_records=8)
+        self.assertEqual(records, VALUES)
+        self.assertEqual(len(calls), -(-len(VALUES) // 8) + 1)  # batches + EOF
+        self.assertEqual(calls[0], 16)
+
+    def test_raw(self):
+        records = collect(binfield.aiter_records, DATA, raw=True)
+        self.assertEqual(records, [(value & 0xFF, value >> 8) for value in VALUES])
+
+    def test_trailing(self):
+        with self.assertRaises(ValueError):
+            collect(binfield.aiter_records, DATA + b'\x01')
+
+    def test_writer(self):
+        async def write(writer):
+            async with binfield.AsyncRecordWriter(writer, Word, byteorder='little', chunk_records=4) as records:
+                await records.write(Word(VALUES[0]))
+                await records.write_many(VALUES[1:3])
+                self.assertEqual((records.pending, writer.chunks), (3, []))
+                await records.write_many(VALUES[3:9])  # Batch is complete: all pending records are written
+                self.assertEqual((records.pending, len(writer.chunks)), (0, 1))
+                await records.write_many(VALUES[9:])
+                await records.write_many([])
+            return records
+
+        writer = FakeWriter()
+        records = asyncio.run(write(writer))
+        self.assertEqual(records.pending, 0)
+        self.assertEqual(b''.join(writer.chunks), DATA)
+        self.assertEqual(len(writer.chunks), 2)
+        self.assertEqual(writer.drained, 2)
+
+        async def write_tail(writer):
+            async with binfield.AsyncRecordWriter(writer, Word, byteorder='little') as records:
+                await records.write_many(VALUES)
+
+        writer = FakeWriter()
+        asyncio.run(write_tail(writer))
+        self.assertEqual(writer.chunks, [DATA])  # Flushed on exit
+
+    def test_writer_mask(self):
+        async def write(writer):
+            async with binfield.AsyncRecordWriter(writer, Masked) as records:
+                await records.write(0x0080)
+                await records.write_many([0x01FF, 0x0080])
+
+        writer = FakeWriter()
+        asyncio.run(write(writer))
+        self.assertEqual(writer.chunks, [b'\x00\x00\x01\x7F\x00\x00'])
+        self.assertEqual(Masked(0x0080), 0)
+
+    def test_writer_negative(self):
+        async def write(writer, value):
+            records = binfield.AsyncRecordWriter(writer, Word)
+            with self.assertRaises(ValueError):
+                await records.write(value)
+            with self.assertRaises(ValueError):
+                await records.write_many([1, value, 2])
+            self.assertEqual(records.pending, 0)  # Invalid data is not added: writer is usable
+            await records.write(1)
+            await records.write_many([2, 3])
+            await records.flush()
+            self.assertEqual(writer.chunks, [b'\x00\x01\x00\x02\x00\x03'])
+
+        asyncio.run(write(FakeWriter(), 0x10000))
+        asyncio.run(write(FakeWriter(), 0x1FFFF))
+        asyncio.run(write(FakeWriter(), -1))
+        with self.assertRaises(TypeError):
+            asyncio.run(binfield.AsyncRecordWriter(FakeWriter(), Word).write('1'))
+        with self.assertRaises(ValueError):
+            binfield.AsyncRecordWriter(FakeWriter(), BinField)
@@ -0,0 +1,98 @@
+"""Multi-record update and keyword construction tests."""
+
+import unittest
+
+from binfield import BinField
+
+
+# pylint: disable=protected-access,missing-docstring,no-member
+
+
+class Frame(BinField):
+    _size_ = 16
+    _mask_ = 0xFF7F
+    kind = (0, 3)
+    secure = 3
+    body = {'_index_': (8, 16), 'low': (0, 4), 'high': (4, 8)}
+
+
+class Frozen(BinField):
+    _size_ = 8
+    _frozen_ = True
+    low = (0, 4)
+    high = (4, 8)
+
+
+class Unsized(BinField):
+    head = (0, 4)
+    tail = slice(4, None)
+
+
+class UnsizedNested(BinField):
+    head = (0, 4)
+    nest = {'_index_': (4, 12), 'lo': (0, 4), 'hi': (4, 8)}
+    tail = slice(12, None)
+
+
+class TestUpdate(unittest.TestCase):
+    def test_construct(self):
+        self.assertEqual(Frame(kind=5, secure=1), 0b1101)
+        self.assertEqual(Frame(0xFFFF, kind=0, body=0), 0x78)
+        self.assertEqual(Frozen(low=1, high=2), 0x21)
+        self.assertEqual(hash(Frozen(low=1, high=2)), hash(Frozen(0x21)))
+
+    def test_update(self):
+        obj = Frame(0x1234)
+        obj._update_(kind=7, secure=0)
+        self.assertEqual(obj, 0x1237)
+        obj._update_({'body.high': 0xA, 'body.low': 5}, kind=0)
+        self.assertEqual(obj, 0xA530)
+        # Applied in order: like sequential assignment
+        obj._update_({'body': 0xFF, 'body.low': 0})
+        self.assertEqual(obj, 0xF030)
+
+    def test_linked(self):
+        obj = Frame(0x1234)
+        body = obj.body
+        body._update_(low=0xF, high=0)
+        self.assertEqual(obj, 0x0F34)
+        self.assertEqual(body, 0x0F)
+
+    def test_unsized(self):
+        obj = Unsized(0x12)
+        obj._update_(head=3, tail=0)
+        self.assertEqual(obj, 0x03)
+        obj = UnsizedNested(0x31FF)
+        obj._update_({'nest.lo': 0xA}, head=1, tail=0)  # tail: bounds depend on value
+        self.assertEqual(obj, 0x1A1)
+
+    def test_unsized_negative(self):
+        obj = UnsizedNested(0x31FF)
+        for fields, error in (
+            ({'head': 1, 'unknown': 1}, IndexError),
+            ({'head': 1, 'nest.unknown': 1}, IndexError),
+            ({'head': 1, 'tail': -1}, ValueError),
+            ({'head': 1, 'nest.lo': 0x10}, ValueError),
+            ({'head': 1, 'tail': '1'}, TypeError),
+        ):
+            with self.subTest(fields=fields):
+                with self.assertRaises(error):
+                    obj._update_(fields)
+                self.assertEqual(obj, 0x31FF)  # Nothing is written on failure
+
+    def test_negative(self):
+        obj = Frame(0x1234)
+        for fields, error in (
+            ({'kind': 8, 'secure': 0}, ValueError),
+            ({'kind': -1}, ValueError),
+            ({'kind': 1, 'secure': '1'}, TypeError),
+            ({'kind': 1, 'unknown': 1}, IndexError),
+        ):
+            with self.subTest(fields=fields):
+                with self.assertRaises(error):
+                    obj._update_(fields)
+                self.assertEqual(obj, 0x1234)  # Validated before write
+                with self.assertRaises(error):
+                    Frame(**fields)
+        with self.assertRaises(TypeError):
+            Frozen(0)._update_(low=1)
@@ -0,0 +1,125 @@
+"""Buffer-backed view tests."""
+
+import gc
+import unittest
+import weakref
+
+from binfield import BinField
+from binfield import BinFieldView
+
+
+# pylint: disable=protected-access,missing-docstring,no-member,attribute-defined-outside-init
+
+
+class Header(BinField):
+    _size_ = 32
+    _mask_ = 0xFFFF7FFF
+    kind = (0, 4)
+    flag = 4
+    nested = {
+        '_index_': (8, 20),
+        'low': (0, 4),
+        'high': (4, 12),
+    }
+    length = (20, 32)
+
+
+class TestBinFieldView(unittest.TestCase):
+    def test_read(self):
+        for byteorder in ('big', 'little'):
+            value = 0x12345678
+            buf = bytearray(b'\xAA') + bytearray(value.to_bytes(4, byteorder)) + bytearray(b'\xBB')
+            view = BinFieldView(Header, buf, offset=1, byteorder=byteorder)
+            bf = Header(value)
+
+            self.assertEqual(view._value_, bf)
+            self.assertEqual(int(view), int(bf))
+            self.assertEqual(view, bf)
+            self.assertIs(view._cls_, Header)
+            for key in ('kind', 'flag', 'nested', 'length', 'nested.low', 'nested.high'):
+                self.assertEqual(view[key], bf._get_int_(key))
+            self.assertEqual(view.kind, bf.kind)
+            self.assertEqual(view[3:13], bf[3:13])
+            self.assertEqual(view[(3, 13)], bf[3:13])
+            self.assertEqual(view[31], bf[31])
+            self.assertEqual(view._snapshot_(), bf)
+            self.assertEqual(str(view), str(bf))
+
+    def test_write(self):
+        for byteorder in ('big', 'little'):
+            buf = bytearray(6)
+            with BinFieldView(Header, buf, offset=1, byteorder=byteorder) as view:
+                bf = Header(0)
+
+                view['nested.high'] = 0xAB
+                bf.nested.high = 0xAB
+                self.assertEqual(view._value_, bf)
+
+                view.length = 0xFFF
+                bf.length = 0xFFF
+                self.assertEqual(view._value_, bf)
+
+                view[0:5] = 0b10101
+                bf[0:5] = 0b10101
+                self.assertEqual(view._value_, bf)
+
+                view[15] = 1  # Masked
+                self.assertEqual(view._value_, bf)
+
+                view._value_ = 0xFFFFFFFF
+                self.assertEqual(view._value_, 0xFFFF7FFF)
+
+            self.assertEqual(buf[0], 0)
+            self.assertEqual(buf[-1], 0)
+
+    def test_write_touch_bytes(self):
+        buf = bytearray(4)
+        view = BinFieldView(Header, memoryview(buf), byteorder='big')
+        view.kind = 0xF
+        self.assertEqual(buf, b'\x00\x00\x00\x0F')
+        view['nested.low'] = 0xF
+        self.assertEqual(buf, b'\x00\x00\x0F\x0F')
+        view._release_()
+
+        with self.assertRaises(TypeError):
+            BinFieldView(Header, bytes(4)).kind = 1  # Read-only buffer
+
+    def test_negative(self):
+        buf = bytearray(4)
+        view = BinFieldView(Header, buf)
+        with self.assertRaises(ValueError):
+            view.kind = 0x10
+        with self.assertRaises(ValueError):
+            view.kind = -1
+        with self.assertRaises(TypeError):
+            view.kind = 1.0
+        with self.assertRaises(IndexError):
+            view['nonexistent']
+        with self.assertRaises(IndexError):
+            view[None]
+        with self.assertRaises(IndexError):
+            view[33]
+        with self.assertRaises(AttributeError):
+            view.nonexistent
+        with self.assertRaises(OverflowError):
+            view._value_ = 1 << 32
+        with self.assertRaises(ValueError):
+            BinFieldView(Header, bytearray(3))
+        with self.assertRaises(ValueError):
+            BinFieldView(Header, buf, offset=-1)
+        with self.assertRaises(ValueError):
+            BinFieldView(Header, buf, byteorder='middle')
+        with self.assertRaises(ValueError):
+            BinFieldView(BinField, buf)
+        with self.assertRaises(TypeError):
+            hash(view)
+
+    def test_plan_cache_does_not_keep_class(self):
+        cls = BinField.__class__.makecls('Generated', mapping={'low': (0, 8), 'high': (8, 16)}, size=16)
+        with BinFieldView(cls, bytearray(b'\x12\x34')) as view:
+            self.assertEqual(view.high, 0x12)
+            self.assertEqual(view[0:4], 0x4)
+        ref = weakref.ref(cls)
+        del cls, view
+        gc.collect()
+        self.assertIsNone(ref())